@@ -0,0 +1,653 @@
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+### Benchmark for the Automatic .pcap Verification Tool
+###
+### - in the context of Precision Time Protocol (PTP) Simulations
+###
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Description --------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+#
+# This script compares the runtime of the decoders offered by ptp_sim_aut_ver_tool.py
+# - tshark ... single-pass tshark extraction, only if tshark is installed
+# - native ... built-in pcap/pcapng decoder
+# - mmap   ... memory-mapped, vectorized pcap/pcapng decoder
+#
+# With -g it generates synthetic PTP captures of the given sizes and times every stage of the analysis
+# - extract  ... decoding of the capture (tshark, native or mmap)
+# - frames   ... filling the record store of the decoded messages per source and message type, see PtpRecordStore
+# - calcs    ... ptp_msg_type_specific_calcs(), pairing, offset/delay, see run_ptp_calcs()
+# - warnings ... print_warning_overview()
+# - overview ... print_final_overview()
+#
+# With --startup it measures the startup time of the tool (-v, -h, import) against --startupTarget, e.g. as a CI check
+#
+# usage: ptp_benchmark.py [-h] [-r REPEAT] [-g GENERATE] [-f {pcap,pcapng}] [--masters MASTERS] [--slaves SLAVES] [--syncLogMP SYNCLOGMP]
+#                         [--dlyReqLogMP DLYREQLOGMP] [--annLogMP ANNLOGMP] [--missingDlyResp N] [--zeroTS N] [--backwardsTS N] [--seqIDGaps N]
+#                         [--genDir GENDIR] [-D DECODERS] [-o OUTPUT] [--startup] [--startupTarget STARTUPTARGET] [inFiles ...]
+#
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+###----- Imports ------------------------------------------------------------------------------------------------------------------------------------
+import argparse
+import contextlib
+import datetime
+import glob
+import io
+import os
+import platform
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+import ptp_sim_aut_ver_tool as ptpTool
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Constants ----------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+### topology and message rates of the synthetic captures
+GEN_DEFAULT_MASTERS = 1
+GEN_DEFAULT_SLAVES = 4
+GEN_DEFAULT_SYNC_LOGMP = -3
+GEN_DEFAULT_DLY_REQ_LOGMP = 0
+GEN_DEFAULT_ANN_LOGMP = 1
+
+### capture time of the first message, in seconds since epoch
+GEN_START_S = 1700000000
+
+### capture time between Sync and FollowUp and between DlyReq and DlyResp, in nanoseconds
+GEN_FOLLOW_UP_DELAY_NS = 20000
+GEN_DLY_RESP_DELAY_NS = 50000
+
+### path delay between master and slave, in nanoseconds
+GEN_PATH_DELAY_NS = 1000
+
+### maximum jitter of the message intervals, relative to the interval
+GEN_INTERVAL_JITTER = 0.01
+
+### number of packets assembled at once
+GEN_CHUNK_PACKETS = 100000
+
+### fault types that can be injected, number of faults per capture
+# - missingDlyResp ... DlyResp messages are dropped, DlyReq stays unmatched
+# - zeroTS         ... Sync messages with an originTimestamp of 0
+# - backwardsTS    ... FollowUp messages with a preciseOriginTimestamp before the one of the previous FollowUp
+# - seqIDGaps      ... Sync and FollowUp messages are dropped
+# negative timestamps cannot be injected, the seconds field of a PTP timestamp is unsigned
+GEN_FAULT_TYPES = ["missingDlyResp", "zeroTS", "backwardsTS", "seqIDGaps"]
+
+### length of the PTP message per message type, in bytes
+GEN_PTP_LENGTHS = {ptpTool.PTP_MTYPE_SYNC:       44,
+                   ptpTool.PTP_MTYPE_DELAY_REQ:  44,
+                   ptpTool.PTP_MTYPE_FOLLOW_UP:  44,
+                   ptpTool.PTP_MTYPE_DELAY_RESP: 54,
+                   ptpTool.PTP_MTYPE_ANNOUNCE:   64}
+
+### controlField per message type, 5 ... all others
+GEN_PTP_CONTROL = {ptpTool.PTP_MTYPE_SYNC:       0,
+                   ptpTool.PTP_MTYPE_DELAY_REQ:  1,
+                   ptpTool.PTP_MTYPE_FOLLOW_UP:  2,
+                   ptpTool.PTP_MTYPE_DELAY_RESP: 3,
+                   ptpTool.PTP_MTYPE_ANNOUNCE:   5}
+
+### stages of the analysis, in order of execution
+STAGES = ["extract", "frames", "calcs", "warnings", "overview"]
+
+### startup of the tool, see measure_startup()
+# a run of -v/-h or importing the module must not take longer, in seconds
+STARTUP_DEFAULT_TARGET_S = 0.5
+# modules which must not be imported by importing the tool, they are imported by the stages needing them
+STARTUP_LAZY_MODULES = ["pandas"]
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Sub-Routines -------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+###----- time a single extraction function ------------------------------------
+# returns the best wall time out of <repeat> runs and the number of extracted PTP messages
+#
+# \param extractFunction ... function taking the input file name, returning a data frame or structured array
+#
+# \param inputFileName   ... capture file to decode
+#
+# \param repeat          ... number of runs
+def time_extraction(extractFunction, inputFileName, repeat):
+    bestTime = None
+    numMsgs = 0
+    for run in range(repeat):
+        startTime = time.perf_counter()
+        ptpData = extractFunction(inputFileName)
+        runTime = time.perf_counter() - startTime
+        numMsgs = len(ptpData)
+        if(bestTime == None or runTime < bestTime):
+            bestTime = runTime
+    return bestTime, numMsgs
+###----------------------------------------------------------------------------
+
+
+###----- benchmark all decoders on a list of files ----------------------------
+# returns a data frame holding one row per input file
+def benchmark_decoders(inputFileNames, repeat):
+    tsharkAvailable = shutil.which("tshark") != None
+    if(tsharkAvailable == True):
+        ptpTool.check_tshark_version()
+
+    results = []
+    for inputFileName in inputFileNames:
+        result = {"file": inputFileName}
+        result["native_s"], result["native_msgs"] = time_extraction(ptpTool.extract_ptp_data_native, inputFileName, repeat)
+        result["mmap_s"], result["mmap_msgs"] = time_extraction(lambda fileName: ptpTool.extract_ptp_records_mmap(fileName)[0], inputFileName, repeat)
+        if(tsharkAvailable == True):
+            result["tshark_s"], result["tshark_msgs"] = time_extraction(ptpTool.extract_ptp_data_single_pass, inputFileName, repeat)
+            result["speedup"] = result["tshark_s"] / result["native_s"]
+        results.append(result)
+
+    return pd.DataFrame(results)
+###----------------------------------------------------------------------------
+
+
+
+###----- write a big-endian field into every row of a byte matrix --------------
+# \param rows     ... uint8 matrix, one packet per row
+#
+# \param offset   ... byte offset of the field within a row
+#
+# \param values   ... integer per row
+#
+# \param numBytes ... size of the field
+def put_be(rows, offset, values, numBytes):
+    values = np.asarray(values, dtype = np.uint64)
+    for byteIdx in range(numBytes):
+        rows[:, offset + byteIdx] = (values >> np.uint64(8 * (numBytes - 1 - byteIdx))) & np.uint64(0xff)
+###----------------------------------------------------------------------------
+
+
+###----- write a little-endian field into every row of a byte matrix -----------
+# see put_be()
+def put_le(rows, offset, values, numBytes):
+    values = np.asarray(values, dtype = np.uint64)
+    for byteIdx in range(numBytes):
+        rows[:, offset + byteIdx] = (values >> np.uint64(8 * byteIdx)) & np.uint64(0xff)
+###----------------------------------------------------------------------------
+
+
+###----- periodic message streams of a synthetic capture ------------------------
+# returns a list of dicts, one per stream of periodic messages
+# - msgID, srcIdx, logMP, period (ns), phase (ns) ... every master sends Sync and Ann, every slave sends DlyReq
+# - dstIdx ... master a slave sends its DlyReq to, the master answers with a DlyResp
+# - Sync streams are followed by FollowUp messages, see generate_chunk()
+#
+# \param numMasters, numSlaves ... number of master and slave clocks, slave i belongs to master i % numMasters
+#
+# \param syncLogMP, dlyReqLogMP, annLogMP ... logMessagePeriod of Sync/FollowUp, DlyReq/DlyResp and Ann messages
+def get_streams(numMasters, numSlaves, syncLogMP, dlyReqLogMP, annLogMP):
+    streams = []
+    for masterIdx in range(numMasters):
+        for msgID, logMP in ((ptpTool.PTP_MTYPE_SYNC, syncLogMP), (ptpTool.PTP_MTYPE_ANNOUNCE, annLogMP)):
+            streams.append({"msgID": msgID, "srcIdx": masterIdx, "dstIdx": None, "logMP": logMP})
+    for slaveIdx in range(numSlaves):
+        streams.append({"msgID": ptpTool.PTP_MTYPE_DELAY_REQ, "srcIdx": numMasters + slaveIdx, "dstIdx": slaveIdx % numMasters, "logMP": dlyReqLogMP})
+
+    for streamIdx, stream in enumerate(streams):
+        stream["period"] = int(round(ptpTool.NS_PER_S * 2.0 ** stream["logMP"]))
+        # spread the streams over the first interval, so messages of different streams do not coincide
+        stream["phase"] = stream["period"] * (streamIdx + 1) // (len(streams) + 1)
+        # Sync and DlyReq are answered by a second message
+        stream["packetsPerMsg"] = 1 if(stream["msgID"] == ptpTool.PTP_MTYPE_ANNOUNCE) else 2
+    return streams
+###----------------------------------------------------------------------------
+
+
+###----- template of a PTP packet ---------------------------------------------
+# Ethernet/IPv4/UDP frame of the given message type, every field that differs per message is set by generate_chunk()
+def get_packet_template(msgID):
+    ptpLen = GEN_PTP_LENGTHS[msgID]
+    port = ptpTool.PTP_EVENT_PORT if(msgID in (ptpTool.PTP_MTYPE_SYNC, ptpTool.PTP_MTYPE_DELAY_REQ)) else ptpTool.PTP_GENERAL_PORT
+    eth = bytes.fromhex("01005e000181") + bytes.fromhex("020000000000") + struct.pack(">H", ptpTool.ETHTYPE_IPV4)
+    ip = struct.pack(">BBHHHBBH4s4s", 0x45, 0, 20 + 8 + ptpLen, 0, 0, 1, 17, 0, bytes(4), bytes([224, 0, 1, 129]))
+    udp = struct.pack(">HHHH", port, port, 8 + ptpLen, 0)
+    ptp = bytearray(ptpLen)
+    ptp[0] = msgID
+    ptp[1] = 2
+    ptp[2:4] = struct.pack(">H", ptpLen)
+    ptp[32] = GEN_PTP_CONTROL[msgID]
+    return np.frombuffer(eth + ip + udp + bytes(ptp), dtype = np.uint8)
+###----------------------------------------------------------------------------
+
+
+###----- messages of one stream within a time window -----------------------------
+# returns the message indices k and capture times (ns) of the messages whose nominal time is within [windowStart, windowEnd)
+# - the jitter is derived from k, so the messages do not depend on the window size
+def get_stream_messages(stream, windowStart, windowEnd, duration):
+    firstK = max(0, -(-(windowStart - stream["phase"]) // stream["period"]))
+    endK = -(-(min(windowEnd, duration) - stream["phase"]) // stream["period"])
+    k = np.arange(firstK, max(firstK, endK), dtype = np.int64)
+    jitter = ((k * 2654435761) % 2001 - 1000) * int(stream["period"] * GEN_INTERVAL_JITTER) // 1000
+    return k, GEN_START_S * ptpTool.NS_PER_S + stream["phase"] + k * stream["period"] + jitter
+###----------------------------------------------------------------------------
+
+
+###----- append messages to the columns of a time window ---------------------------
+# \param columns     ... dict of message type -> dict of column name -> list of arrays, updated in place
+#
+# \param times       ... capture times, in nanoseconds
+#
+# \param srcIdx      ... sending clock, defines MAC, IP address and clock identity
+#
+# \param ts          ... timestamp within the PTP message, in nanoseconds
+#
+# \param reqClockIdx ... requesting clock of a DlyResp, None ... no requestingPortIdentity
+def append_messages(columns, msgID, times, srcIdx, seqIDs, logMP, ts, reqClockIdx = None, twoStep = False):
+    column = columns.setdefault(msgID, {"time": [], "srcIdx": [], "seqID": [], "logMP": [], "ts": [], "reqClockIdx": [], "flags": []})
+    column["time"].append(times)
+    column["srcIdx"].append(np.full(len(times), srcIdx))
+    column["seqID"].append(seqIDs % 65536)
+    column["logMP"].append(np.full(len(times), logMP))
+    column["ts"].append(ts)
+    column["reqClockIdx"].append(np.full(len(times), -1 if(reqClockIdx is None) else reqClockIdx))
+    # two-step flag
+    column["flags"].append(np.full(len(times), 0x0200 if(twoStep == True) else 0))
+###----------------------------------------------------------------------------
+
+
+###----- generate the packets of one time window ----------------------------------
+# returns one dict per message type, holding the columns of append_messages() as arrays, not sorted by time
+#
+# \param faults ... dict of fault type -> dict of streamIdx -> message indices k the fault is injected at
+def generate_chunk(streams, windowStart, windowEnd, duration, faults):
+    columns = {}
+    for streamIdx, stream in enumerate(streams):
+        k, times = get_stream_messages(stream, windowStart, windowEnd, duration)
+        if(len(k) == 0):
+            continue
+        faultMasks = {faultType: np.isin(k, positions.get(streamIdx, [])) for faultType, positions in faults.items()}
+        noFault = np.zeros(len(k), dtype = bool)
+
+        srcIdx = stream["srcIdx"]
+        if(stream["msgID"] == ptpTool.PTP_MTYPE_SYNC):
+            keep = ~faultMasks.get("seqIDGaps", noFault)
+            syncTS = np.where(faultMasks.get("zeroTS", noFault), 0, times - GEN_PATH_DELAY_NS)
+            append_messages(columns, ptpTool.PTP_MTYPE_SYNC, times[keep], srcIdx, k[keep], stream["logMP"], syncTS[keep], twoStep = True)
+            # a backwards preciseOriginTimestamp lies two intervals before the nominal one
+            follUpTS = times - GEN_PATH_DELAY_NS - np.where(faultMasks.get("backwardsTS", noFault), 2 * stream["period"], 0)
+            append_messages(columns, ptpTool.PTP_MTYPE_FOLLOW_UP, times[keep] + GEN_FOLLOW_UP_DELAY_NS, srcIdx, k[keep], stream["logMP"], follUpTS[keep])
+        elif(stream["msgID"] == ptpTool.PTP_MTYPE_DELAY_REQ):
+            append_messages(columns, ptpTool.PTP_MTYPE_DELAY_REQ, times, srcIdx, k, stream["logMP"], times)
+            keep = ~faultMasks.get("missingDlyResp", noFault)
+            append_messages(columns, ptpTool.PTP_MTYPE_DELAY_RESP, times[keep] + GEN_DLY_RESP_DELAY_NS, stream["dstIdx"], k[keep], stream["logMP"],
+                            times[keep] + GEN_PATH_DELAY_NS, reqClockIdx = srcIdx)
+        else:
+            append_messages(columns, stream["msgID"], times, srcIdx, k, stream["logMP"], times)
+
+    return {msgID: {name: np.concatenate(values) for name, values in column.items()} for msgID, column in columns.items()}
+###----------------------------------------------------------------------------
+
+
+###----- assemble the packets of one time window ----------------------------------
+# returns the bytes of all packets in order of capture time, each preceded by its pcap record header or wrapped into a pcapng EPB
+#
+# \param fileFormat ... "pcap" or "pcapng"
+def assemble_chunk(chunk, fileFormat):
+    recordHeaderLen = 16 if(fileFormat == "pcap") else 28
+    msgIDs = list(chunk)
+    recordLens = []
+    blocks = []
+    for msgID in msgIDs:
+        column = chunk[msgID]
+        template = get_packet_template(msgID)
+        packetLen = len(template)
+        # pcapng blocks are padded to 32 bits and end with the block length
+        recordLen = recordHeaderLen + packetLen if(fileFormat == "pcap") else recordHeaderLen + (packetLen + 3) // 4 * 4 + 4
+        rows = np.zeros((len(column["time"]), recordLen), dtype = np.uint8)
+        rows[:, recordHeaderLen:recordHeaderLen + packetLen] = template
+
+        ### record header, timestamps in nanoseconds
+        times = column["time"]
+        if(fileFormat == "pcap"):
+            put_le(rows, 0, times // ptpTool.NS_PER_S, 4)
+            put_le(rows, 4, times % ptpTool.NS_PER_S, 4)
+            put_le(rows, 8, np.full(len(times), packetLen), 4)
+            put_le(rows, 12, np.full(len(times), packetLen), 4)
+        else:
+            put_le(rows, 0, np.full(len(times), ptpTool.PCAPNG_BT_EPB), 4)
+            put_le(rows, 4, np.full(len(times), recordLen), 4)
+            put_le(rows, 12, times >> 32, 4)
+            put_le(rows, 16, times & 0xffffffff, 4)
+            put_le(rows, 20, np.full(len(times), packetLen), 4)
+            put_le(rows, 24, np.full(len(times), packetLen), 4)
+            put_le(rows, recordLen - 4, np.full(len(times), recordLen), 4)
+
+        ### addresses, source MAC 02:00:00:00:xx:xx, source IP 10.0.xx.xx
+        packet = rows[:, recordHeaderLen:]
+        put_be(packet, 10, column["srcIdx"] + 1, 2)
+        put_be(packet, 14 + 12, (10 << 24) + column["srcIdx"] + 1, 4)
+
+        ### PTP header and body
+        ptp = packet[:, 14 + 20 + 8:]
+        put_be(ptp, 6, column["flags"], 2)
+        put_be(ptp, 20, 0x020000fffe000000 + column["srcIdx"] + 1, 8)
+        put_be(ptp, 28, np.full(len(times), 1), 2)
+        put_be(ptp, 30, column["seqID"], 2)
+        put_be(ptp, 33, column["logMP"] & 0xff, 1)
+        put_be(ptp, 34, column["ts"] // ptpTool.NS_PER_S, 6)
+        put_be(ptp, 40, column["ts"] % ptpTool.NS_PER_S, 4)
+        if(msgID == ptpTool.PTP_MTYPE_DELAY_RESP):
+            put_be(ptp, 44, 0x020000fffe000000 + column["reqClockIdx"] + 1, 8)
+            put_be(ptp, 52, np.full(len(times), 1), 2)
+
+        blocks.append(rows.reshape(-1))
+        recordLens.append(np.full(len(times), recordLen, dtype = np.int64))
+
+    ### interleave the records of all message types by capture time
+    times = np.concatenate([chunk[msgID]["time"] for msgID in msgIDs])
+    recordLens = np.concatenate(recordLens)
+    order = np.argsort(times, kind = "stable")
+    recordStart = np.empty(len(order), dtype = np.int64)
+    recordStart[order] = np.cumsum(recordLens[order]) - recordLens[order]
+    out = np.empty(int(recordLens.sum()), dtype = np.uint8)
+    firstRecord = 0
+    for block, msgID in zip(blocks, msgIDs):
+        numRecords = len(chunk[msgID]["time"])
+        recordLen = len(block) // max(1, numRecords)
+        dst = recordStart[firstRecord:firstRecord + numRecords, None] + np.arange(recordLen)
+        out[dst.reshape(-1)] = block
+        firstRecord += numRecords
+    return out.tobytes()
+###----------------------------------------------------------------------------
+
+
+###----- file header of a synthetic capture ---------------------------------------
+# pcap with nanosecond timestamps, or pcapng with a single Ethernet interface stating if_tsresol 9
+def get_file_header(fileFormat):
+    if(fileFormat == "pcap"):
+        return struct.pack("<IHHiIII", ptpTool.PCAP_MAGIC_NSEC, 2, 4, 0, 0, 65535, ptpTool.LINKTYPE_ETHERNET)
+    shb = struct.pack("<IIIHHqI", ptpTool.PCAPNG_BT_SHB, 28, ptpTool.PCAPNG_BYTE_ORDER_MAGIC, 1, 0, -1, 28)
+    idb = struct.pack("<IIHHIHHB3xII", ptpTool.PCAPNG_BT_IDB, 32, ptpTool.LINKTYPE_ETHERNET, 0, 65535, ptpTool.PCAPNG_OPT_IF_TSRESOL, 1, 9, 0, 32)
+    return shb + idb
+###----------------------------------------------------------------------------
+
+
+###----- generate a synthetic PTP capture -----------------------------------------
+# every master sends two-step Sync/FollowUp and Ann messages, every slave exchanges DlyReq/DlyResp with its master,
+# the capture is written window by window, so its size is not limited by memory
+# returns a dict holding the number of packets, the duration and the number of injected faults per fault type
+#
+# \param fileName   ... capture file to write
+#
+# \param numPackets ... approximate number of packets, defines the duration of the capture
+#
+# \param fileFormat ... "pcap" or "pcapng"
+#
+# \param faults     ... dict of fault type -> number of faults, see GEN_FAULT_TYPES, placed at random messages
+#
+# \param seed       ... seed of the placement of the faults
+def generate_capture(fileName, numPackets, fileFormat = "pcap", numMasters = GEN_DEFAULT_MASTERS, numSlaves = GEN_DEFAULT_SLAVES,
+                     syncLogMP = GEN_DEFAULT_SYNC_LOGMP, dlyReqLogMP = GEN_DEFAULT_DLY_REQ_LOGMP, annLogMP = GEN_DEFAULT_ANN_LOGMP, faults = None, seed = 0):
+    if(fileFormat not in ("pcap", "pcapng")):
+        raise ValueError("unsupported capture format: " + str(fileFormat))
+    if(numMasters < 1):
+        raise ValueError("at least one master is needed")
+
+    streams = get_streams(numMasters, numSlaves, syncLogMP, dlyReqLogMP, annLogMP)
+    packetsPerNs = sum(stream["packetsPerMsg"] / stream["period"] for stream in streams)
+    duration = int(numPackets / packetsPerNs)
+
+    ### place the faults at random messages of the streams they apply to
+    rng = np.random.default_rng(seed)
+    faultStreams = {"missingDlyResp": ptpTool.PTP_MTYPE_DELAY_REQ, "zeroTS": ptpTool.PTP_MTYPE_SYNC,
+                    "backwardsTS": ptpTool.PTP_MTYPE_SYNC, "seqIDGaps": ptpTool.PTP_MTYPE_SYNC}
+    faultPositions = {}
+    numFaultsPlaced = {}
+    for faultType, numFaults in (faults or {}).items():
+        if(faultType not in GEN_FAULT_TYPES):
+            raise ValueError("unknown fault type: " + str(faultType))
+        candidates = [(streamIdx, (duration - stream["phase"]) // stream["period"]) for streamIdx, stream in enumerate(streams)
+                      if(stream["msgID"] == faultStreams[faultType] and (duration - stream["phase"]) // stream["period"] > 1)]
+        # the first message of a stream is kept, so the fault is visible against its predecessor
+        numFaults = min(numFaults, sum(numMsgs - 1 for streamIdx, numMsgs in candidates))
+        positions = set()
+        while(len(positions) < numFaults):
+            streamIdx, numMsgs = candidates[rng.integers(len(candidates))]
+            positions.add((streamIdx, int(rng.integers(1, numMsgs))))
+        faultPositions[faultType] = {}
+        for streamIdx, k in sorted(positions):
+            faultPositions[faultType].setdefault(streamIdx, []).append(k)
+        numFaultsPlaced[faultType] = numFaults
+
+    ### write window by window
+    windowLen = max(1, int(GEN_CHUNK_PACKETS / packetsPerNs))
+    numWritten = 0
+    with open(fileName, "wb") as captureFile:
+        captureFile.write(get_file_header(fileFormat))
+        for windowStart in range(0, duration, windowLen):
+            chunk = generate_chunk(streams, windowStart, windowStart + windowLen, duration, faultPositions)
+            if(len(chunk) == 0):
+                continue
+            numWritten += sum(len(column["time"]) for column in chunk.values())
+            captureFile.write(assemble_chunk(chunk, fileFormat))
+
+    info = {"packets": numWritten, "duration_s": duration / ptpTool.NS_PER_S}
+    info.update(numFaultsPlaced)
+    return info
+###----------------------------------------------------------------------------
+
+
+
+###----- time every stage of the analysis of one capture --------------------------
+# same steps as PtpAnalyzer.run() without streaming, the printed output is discarded
+# returns a dict holding the time per stage, see STAGES, the total time and the number of PTP messages
+#
+# \param decoder ... DECODER_TSHARK (single pass), DECODER_NATIVE or DECODER_MMAP
+def time_stages(inputFileName, decoder):
+    result = ptpTool.PtpAnalysisResult(inputFileName)
+    stageTimes = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        startTime = time.perf_counter()
+        if(decoder == ptpTool.DECODER_MMAP):
+            ptpRecords, srcValues, ethTypeUsed = ptpTool.extract_ptp_records_mmap(inputFileName)
+        elif(decoder == ptpTool.DECODER_NATIVE):
+            ptpData = ptpTool.extract_ptp_data_native(inputFileName)
+        else:
+            ptpData = ptpTool.extract_ptp_data_single_pass(inputFileName)
+        stageTimes["extract"] = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        if(decoder == ptpTool.DECODER_MMAP):
+            ptpTool.split_ptp_records(result, ptpRecords, srcValues, ethTypeUsed)
+            numMsgs = len(ptpRecords)
+        else:
+            ptpTool.split_ptp_data(result, ptpData)
+            numMsgs = len(ptpData)
+        stageTimes["frames"] = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        ptpTool.run_ptp_calcs(result)
+        stageTimes["calcs"] = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        ptpTool.print_warning_overview(result)
+        stageTimes["warnings"] = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        ptpTool.print_final_overview(result)
+        stageTimes["overview"] = time.perf_counter() - startTime
+
+    stageTimes["total"] = sum(stageTimes[stage] for stage in STAGES)
+    stageTimes["msgs"] = numMsgs
+    stageTimes["storeBytes"] = result.recordStore.get_nbytes()
+    stageTimes["warnings_cnt"] = int(result.warningCountDF.iloc[0].sum())
+    return stageTimes
+###----------------------------------------------------------------------------
+
+
+###----- benchmark the stages of the analysis on a list of files --------------------
+# returns a data frame holding one row per input file and decoder, the run with the best total time out of <repeat> runs
+#
+# \param decoders ... list of decoders, see time_stages()
+def benchmark_stages(inputFileNames, decoders, repeat):
+    if(ptpTool.DECODER_TSHARK in decoders):
+        ptpTool.check_tshark_version()
+
+    results = []
+    for inputFileName in inputFileNames:
+        for decoder in decoders:
+            bestTimes = None
+            for run in range(repeat):
+                stageTimes = time_stages(inputFileName, decoder)
+                if(bestTimes == None or stageTimes["total"] < bestTimes["total"]):
+                    bestTimes = stageTimes
+            row = {"file": os.path.basename(inputFileName), "size_MiB": os.path.getsize(inputFileName) / (1024 * 1024), "decoder": decoder}
+            row.update({stage + "_s": bestTimes[stage] for stage in STAGES})
+            row["total_s"] = bestTimes["total"]
+            row["msgs"] = bestTimes["msgs"]
+            row["msgs_per_s"] = bestTimes["msgs"] / bestTimes["total"]
+            row["warnings"] = bestTimes["warnings_cnt"]
+            row["store_B_per_msg"] = bestTimes["storeBytes"] / bestTimes["msgs"]
+            results.append(row)
+    return pd.DataFrame(results)
+###----------------------------------------------------------------------------
+
+
+###----- parse a list of capture sizes ------------------------------------------------
+# e.g. "10k,100k,1M,10M" ... [10000, 100000, 1000000, 10000000]
+def parse_sizes(sizesArg):
+    factors = {"k": 1000, "m": 1000 * 1000}
+    sizes = []
+    for size in sizesArg.split(","):
+        size = size.strip().lower()
+        if(size == ""):
+            continue
+        factor = factors.get(size[-1], 1)
+        sizes.append(int(float(size[:-1] if(size[-1] in factors) else size) * factor))
+    return sizes
+###----------------------------------------------------------------------------
+
+
+###----- generate the synthetic captures of a benchmark ------------------------------
+# a capture is only generated once, its file name holds all parameters, e.g. synth_10000_1m4s_-3_0_1_seed0.pcap
+# returns the list of capture file names
+def generate_captures(args, sizes):
+    faults = {faultType: getattr(args, faultType) for faultType in GEN_FAULT_TYPES if(getattr(args, faultType) > 0)}
+    faultTag = "".join("_" + faultType + str(numFaults) for faultType, numFaults in faults.items())
+    os.makedirs(args.genDir, exist_ok = True)
+
+    fileNames = []
+    for numPackets in sizes:
+        fileName = os.path.join(args.genDir, "synth_%d_%dm%ds_%d_%d_%d%s.%s" % (numPackets, args.masters, args.slaves, args.syncLogMP,
+                                                                                args.dlyReqLogMP, args.annLogMP, faultTag, args.format))
+        if(os.path.exists(fileName) == False):
+            startTime = time.perf_counter()
+            info = generate_capture(fileName + ".tmp", numPackets, args.format, args.masters, args.slaves, args.syncLogMP, args.dlyReqLogMP, args.annLogMP, faults)
+            os.replace(fileName + ".tmp", fileName)
+            print("generated", fileName, info, "in %.1f s" % (time.perf_counter() - startTime))
+        fileNames.append(fileName)
+    return fileNames
+###----------------------------------------------------------------------------
+
+
+###----- measure the startup time of the tool ----------------------------------------
+# every command is run in a fresh interpreter, as by a CI job invoking the tool, the best of <repeat> runs is reported
+# returns a data frame holding one row per command, with the columns
+# - command, best_s, target_s, ok
+# - lazyImported ... modules of STARTUP_LAZY_MODULES imported by "import", they count as failed
+def measure_startup(repeat, target):
+    toolFile = os.path.abspath(ptpTool.__file__)
+    checkLazy = "import sys; import ptp_sim_aut_ver_tool; print(','.join([name for name in " + repr(STARTUP_LAZY_MODULES) + " if(name in sys.modules)]))"
+    commands = {"-v":     [sys.executable, toolFile, "-v"],
+                "-h":     [sys.executable, toolFile, "-h"],
+                "-m -v":  [sys.executable, "-m", "ptp_sim_aut_ver_tool", "-v"],
+                "import": [sys.executable, "-c", checkLazy]}
+
+    results = []
+    for command, cmdArgs in commands.items():
+        bestTime = None
+        lazyImported = ""
+        for run in range(repeat):
+            startTime = time.perf_counter()
+            process = subprocess.run(cmdArgs, cwd = os.path.dirname(toolFile), stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, universal_newlines = True)
+            runTime = time.perf_counter() - startTime
+            if(command == "import"):
+                lazyImported = process.stdout.strip()
+            if(bestTime == None or runTime < bestTime):
+                bestTime = runTime
+        results.append({"command": command, "best_s": bestTime, "target_s": target, "ok": (bestTime <= target and lazyImported == ""), "lazyImported": lazyImported})
+    return pd.DataFrame(results)
+###----------------------------------------------------------------------------
+
+
+###----- append benchmark results to a CSV file ---------------------------------------
+# every row is tagged with date, tool version and the versions of Python, NumPy and pandas, so results can be tracked over releases
+def append_results(resultsDF, outputFileName):
+    resultsDF = resultsDF.copy()
+    resultsDF.insert(0, "date", datetime.datetime.now().isoformat(timespec = "seconds"))
+    resultsDF.insert(1, "toolVersion", ptpTool.TOOL_VERSION)
+    resultsDF["python"] = platform.python_version()
+    resultsDF["numpy"] = np.__version__
+    resultsDF["pandas"] = pd.__version__
+    resultsDF.to_csv(outputFileName, mode = "a", header = (os.path.exists(outputFileName) == False), index = False)
+###----------------------------------------------------------------------------
+
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Main Body ----------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inFiles", type=str, nargs="*", help="capture files to decode, defaults to all files within testdata/")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="number of runs per file and decoder, the best run is reported")
+    parser.add_argument("-g", "--generate", type=str, default=None, help="generate synthetic captures of these sizes in packets, e.g. 10k,100k,1M,10M, and time every stage of the analysis")
+    parser.add_argument("-f", "--format", type=str, choices=["pcap", "pcapng"], default="pcap", help="format of the synthetic captures")
+    parser.add_argument("--masters", type=int, default=GEN_DEFAULT_MASTERS, help="number of masters sending Sync/FollowUp/Ann")
+    parser.add_argument("--slaves", type=int, default=GEN_DEFAULT_SLAVES, help="number of slaves sending DlyReq, answered by their master")
+    parser.add_argument("--syncLogMP", type=int, default=GEN_DEFAULT_SYNC_LOGMP, help="logMessagePeriod of Sync and FollowUp messages")
+    parser.add_argument("--dlyReqLogMP", type=int, default=GEN_DEFAULT_DLY_REQ_LOGMP, help="logMessagePeriod of DlyReq and DlyResp messages")
+    parser.add_argument("--annLogMP", type=int, default=GEN_DEFAULT_ANN_LOGMP, help="logMessagePeriod of Ann messages")
+    parser.add_argument("--missingDlyResp", type=int, default=0, metavar="N", help="number of dropped DlyResp messages")
+    parser.add_argument("--zeroTS", type=int, default=0, metavar="N", help="number of Sync messages with a zero timestamp")
+    parser.add_argument("--backwardsTS", type=int, default=0, metavar="N", help="number of FollowUp messages with a backwards timestamp")
+    parser.add_argument("--seqIDGaps", type=int, default=0, metavar="N", help="number of dropped Sync/FollowUp messages")
+    parser.add_argument("--genDir", type=str, default=os.path.join(tempfile.gettempdir(), "ptp_benchmark"), help="directory of the synthetic captures, existing ones are reused")
+    parser.add_argument("-D", "--decoders", type=str, default=ptpTool.DECODER_NATIVE + "," + ptpTool.DECODER_MMAP, help="decoders of the stage benchmark, e.g. native,mmap,tshark")
+    parser.add_argument("-o", "--output", type=str, default=None, help="append the results of the stage benchmark to this CSV file")
+    parser.add_argument("--startup", action="store_true", help="measure the startup time of the tool instead, exits with 1 if it exceeds --startupTarget")
+    parser.add_argument("--startupTarget", type=float, default=STARTUP_DEFAULT_TARGET_S, help="maximum startup time in seconds")
+    args = parser.parse_args()
+
+    ###----- startup time -----------------------------------------------------------
+    if(args.startup == True):
+        startupDF = measure_startup(args.repeat, args.startupTarget)
+        pd.set_option("display.float_format", "{:.3f}".format)
+        print(startupDF.to_string(index = False))
+        if(startupDF["ok"].all() == False):
+            sys.exit(1)
+        return
+    ###----------------------------------------------------------------------------
+
+    ###----- decoder comparison ---------------------------------------------------
+    if(args.generate == None):
+        inputFileNames = args.inFiles
+        if(len(inputFileNames) == 0):
+            inputFileNames = sorted(glob.glob("testdata/*"))
+
+        print(benchmark_decoders(inputFileNames, args.repeat).to_string(index = False))
+        return
+    ###----------------------------------------------------------------------------
+
+    ###----- stage benchmark on synthetic captures ----------------------------------
+    inputFileNames = generate_captures(args, parse_sizes(args.generate)) + args.inFiles
+    decoders = [decoder.strip() for decoder in args.decoders.split(",") if(decoder.strip() != "")]
+    resultsDF = benchmark_stages(inputFileNames, decoders, args.repeat)
+    pd.set_option("display.float_format", "{:.3f}".format)
+    print(resultsDF.to_string(index = False))
+    if(args.output != None):
+        append_results(resultsDF, args.output)
+    ###----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
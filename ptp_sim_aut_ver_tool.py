@@ -42,7 +42,46 @@
 # from numpy import array_equal # FIXME needed?
 import subprocess
 import argparse
-import pandas as pd
+import array
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
+import mmap
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import numpy as np
+
+###----- optional standard modules -------------------------------------------
+# resource is not available on every platform, e.g. Windows, None there, see PtpProfiler
+try:
+    import resource
+except ImportError:
+    resource = None
+
+###----- module imported on first attribute access ---------------------------
+# keeps heavy dependencies out of the startup, e.g. for -h/-v or many short CI runs
+# - pd.DataFrame etc. import pandas the first time a stage needs it, importing this module has no such cost
+# - importlib.import_module() holds the import lock, so concurrent first accesses from tshark reader threads are safe
+class LazyModule:
+
+    def __init__(self, moduleName):
+        self.moduleName = moduleName
+
+    def __getattr__(self, name):
+        # only called for attributes not cached yet
+        attr = getattr(importlib.import_module(self.moduleName), name)
+        setattr(self, name, attr)
+        return attr
+
+pd = LazyModule("pandas")
 
 ###--------------------------------------------------------------------------------------------------------------------------------------------------
 ###----- Constants ----------------------------------------------------------------------------------------------------------------------------------
@@ -80,991 +119,4830 @@ PTP_MTYPE_SIGNALLING = 12
 # PTP Management Messages (0x0d)
 PTP_MTYPE_MANAGEMENT = 13
 
+### names of the supported PTP messageIDs, as used by the columns of msgCountDF
+PTP_MTYPE_NAMES = {PTP_MTYPE_SYNC:       "Sync",
+                   PTP_MTYPE_DELAY_REQ:  "DlyReq",
+                   PTP_MTYPE_FOLLOW_UP:  "FollUp",
+                   PTP_MTYPE_DELAY_RESP: "DlyResp",
+                   PTP_MTYPE_ANNOUNCE:   "Ann",
+                   PTP_MTYPE_SIGNALLING: "Sig",
+                   PTP_MTYPE_MANAGEMENT: "Man"}
+
+### valid range of the logMessagePeriod per message type, (min, max)
+PTP_LOGMP_LIMITS = {PTP_MTYPE_SYNC:       (-8, 8),
+                    PTP_MTYPE_DELAY_REQ:  (0, 5),
+                    PTP_MTYPE_FOLLOW_UP:  (-8, 8),
+                    PTP_MTYPE_DELAY_RESP: (0, 5),
+                    PTP_MTYPE_ANNOUNCE:   (-7, 4)}
+# logMessagePeriod 0x7F, no period specified, e.g. DelayReq and unicast messages, valid without an expected interval
+PTP_LOGMP_UNSPECIFIED = 127
+
+### number of nanoseconds per second, timestamps are handled as int64 nanoseconds
+NS_PER_S = 1000000000
+
+### message type specific tshark fields holding the (seconds, nanoseconds) timestamp of a PTP message
+# used by the single-pass extraction to pick the right timestamp columns per message type
+PTP_TS_FIELDS = {PTP_MTYPE_SYNC:        ("ptp.v2.sdr.origintimestamp.seconds",        "ptp.v2.sdr.origintimestamp.nanoseconds"),
+                 PTP_MTYPE_DELAY_REQ:   ("ptp.v2.sdr.origintimestamp.seconds",        "ptp.v2.sdr.origintimestamp.nanoseconds"),
+                 PTP_MTYPE_FOLLOW_UP:   ("ptp.v2.fu.preciseorigintimestamp.seconds",  "ptp.v2.fu.preciseorigintimestamp.nanoseconds"),
+                 PTP_MTYPE_DELAY_RESP:  ("ptp.v2.dr.receivetimestamp.seconds",        "ptp.v2.dr.receivetimestamp.nanoseconds"),
+                 PTP_MTYPE_ANNOUNCE:    ("ptp.v2.an.origintimestamp.seconds",         "ptp.v2.an.origintimestamp.nanoseconds")}
+
+### de-duplicated list of all timestamp fields above
+PTP_TS_FIELD_LIST = ["ptp.v2.sdr.origintimestamp.seconds",       "ptp.v2.sdr.origintimestamp.nanoseconds",
+                     "ptp.v2.fu.preciseorigintimestamp.seconds", "ptp.v2.fu.preciseorigintimestamp.nanoseconds",
+                     "ptp.v2.dr.receivetimestamp.seconds",       "ptp.v2.dr.receivetimestamp.nanoseconds",
+                     "ptp.v2.an.origintimestamp.seconds",        "ptp.v2.an.origintimestamp.nanoseconds"]
+
+### fields identifying the sending/requesting port of a PTP message and its capture time
+# - frameTime is kept as integer nanoseconds, see epoch_to_ns()
+# - the requesting port identity is only part of DelayResp messages
+PTP_ID_FIELD_LIST = ["frame.time_epoch", "ptp.v2.clockidentity", "ptp.v2.sourceportid", "ptp.v2.dr.requestingsourceportidentity", "ptp.v2.dr.requestingsourceportid"]
+PTP_ID_COLUMNS = ["frameTime", "clockId", "portId", "reqClockId", "reqPortId"]
+
+### columns of the data frame holding all PTP messages of a capture, see extract_ptp_data_single_pass()
+PTP_DATA_COLUMNS = ["frameNum", "ethType", "ip.src", "ipv6.src", "eth.src", "messageID", "flags", "seqID", "logMP"] + PTP_TS_FIELD_LIST + ["tlvType"] + PTP_ID_COLUMNS
+
+### flag within ptp.v2.flags, set for Sync messages followed by a FollowUp
+PTP_FLAG_TWO_STEP = 0x0200
+
+### pairing of Sync/FollowUp and DlyReq/DlyResp messages, see pair_ptp_messages()
+# sequence IDs are 16 bit, a step back by more than half of the range is regarded as wrap-around
+PTP_SEQ_ID_WRAP_THRESHOLD = 32768
+# FollowUp captured later than this after its Sync is reported as late, in nanoseconds
+PAIR_LATE_FOLLOW_UP_NS = 100 * 1000 * 1000
+# DlyResp captured later than this after its DlyReq is reported as late, in nanoseconds
+PAIR_LATE_DELAY_RESP_NS = 500 * 1000 * 1000
+# keys a request and its response are joined by
+PAIR_KEY_COLUMNS = ["clockId", "portId", "seqEpoch", "seqID", "occurrence"]
+
+### inter-arrival interval statistics, see calc_interval_stats()
+# percentiles reported per source and message type
+INTERVAL_PERCENTILES = [1, 5, 50, 95, 99]
+# default allowed relative deviation of an interval from the expected interval 2**logMP
+INTERVAL_DEFAULT_TOLERANCE = 0.3
+# bin edges of the interval histogram, relative to the expected interval
+INTERVAL_HISTOGRAM_EDGES = [0.0, 0.25, 0.5, 0.7, 0.9, 1.1, 1.3, 1.5, 2.0, 4.0, np.inf]
+INTERVAL_HISTOGRAM_LABELS = ["<" + str(INTERVAL_HISTOGRAM_EDGES[1])] + \
+                            [str(lowEdge) + "-" + str(highEdge) for lowEdge, highEdge in zip(INTERVAL_HISTOGRAM_EDGES[1:-2], INTERVAL_HISTOGRAM_EDGES[2:-1])] + \
+                            [">" + str(INTERVAL_HISTOGRAM_EDGES[-2])]
+# the streaming analysis estimates percentiles from a logarithmic histogram of 1 us .. 10000 s, in nanoseconds
+INTERVAL_LOG_BINS_PER_DECADE = 1000
+INTERVAL_LOG_EDGES = 10.0 ** (np.arange(3 * INTERVAL_LOG_BINS_PER_DECADE, 13 * INTERVAL_LOG_BINS_PER_DECADE + 1) / INTERVAL_LOG_BINS_PER_DECADE)
+# columns of result.intervalStatsDF
+INTERVAL_STATS_COLUMNS = ["messageId", "srcIdx", "count", "expected", "min", "max", "mean", "std"] + ["p" + str(percentile) for percentile in INTERVAL_PERCENTILES] + \
+                         ["below", "above"] + INTERVAL_HISTOGRAM_LABELS
+
+### logMessagePeriod segments, see analyze_logmp_segments()
+# columns of result.logMPSegmentsDF, besides messageId and srcIdx
+LOGMP_SEGMENT_COLUMNS = ["group", "logMP", "prevLogMP", "valid", "count", "frameNum", "frameNumEnd", "expected", "intervals", "mean", "below", "above"]
+
+### sequence ID analysis, see analyze_seq_ids()
+# number of distinct 16 bit seqIDs, 65535 is followed by 0
+SEQ_ID_RANGE = 65536
+# kinds of irregular seqID steps, indexed by the kind codes used within analyze_seq_ids()
+SEQ_KIND_DUPLICATE = "duplicate"
+SEQ_KIND_GAP = "gap"
+SEQ_KIND_REORDER = "reorder"
+SEQ_KIND_NAMES = ["", SEQ_KIND_DUPLICATE, SEQ_KIND_GAP, SEQ_KIND_REORDER]
+# message types whose seqIDs are analysed, management messages are extracted without seqID
+SEQ_ID_MSG_TYPES = [PTP_MTYPE_SYNC, PTP_MTYPE_DELAY_REQ, PTP_MTYPE_FOLLOW_UP, PTP_MTYPE_DELAY_RESP, PTP_MTYPE_ANNOUNCE, PTP_MTYPE_SIGNALLING]
+# columns of the run-length summaries, see analyze_seq_ids() and append_seq_id_runs()
+SEQ_RUN_COLUMNS = ["group", "kind", "count", "missing", "frameNum", "seqID", "frameNumEnd", "seqIDEnd"]
+
+### capture clock estimate of offset and mean path delay, see calc_offset_delay()
+# percentiles reported per slave, in addition to mean/std/min/max
+SERVO_PERCENTILES = [50, 95, 99]
+# the statistics of a slave are withheld if the mean capture clock offset exceeds this bound, in nanoseconds
+# - the capture clock then runs on another timescale than the master, e.g. epoch time while the master runs an arbitrary timescale
+# - a UTC capture clock is 37 s off a TAI master, that is still reported
+SERVO_MAX_CAPTURE_OFFSET_NS = 60 * 1000000000
+
+### supported decoders to extract PTP messages from a capture
+# tshark ... invoke the installed tshark
+# native ... built-in pcap/pcapng decoder, see extract_ptp_data_native()
+# mmap   ... memory-mapped, vectorized pcap/pcapng decoder, see extract_ptp_records_mmap()
+DECODER_TSHARK = "tshark"
+DECODER_NATIVE = "native"
+DECODER_MMAP = "mmap"
+
+### record layout of a decoded PTP message, used by the mmap decoder
+PTP_RECORD_DTYPE = np.dtype([("frameNum",  np.int64),
+                             ("srcIdx",    np.int32),
+                             ("messageId", np.uint8),
+                             ("flags",     np.uint16),
+                             ("seqID",     np.uint16),
+                             ("logMP",     np.int8),
+                             ("ts_s",      np.int64),
+                             ("ts_ns",     np.uint32),
+                             ("tlvType",   np.uint16),
+                             ("frameTime", np.int64),
+                             ("clockId",   np.uint64),
+                             ("portId",    np.uint16),
+                             ("reqClockId", np.uint64),
+                             ("reqPortId", np.uint16)])
+
+### compact store of the decoded PTP messages of a capture, see PtpRecordStore
+# one structured array per source and message type, holding fixed-width integer fields only, whatever decoder extracted the messages
+# - source and message type are the key of an array, not stored per message
+# - ts         ... PTP timestamp in integer nanoseconds, missing timestamp fields count as zero, see check_ts()
+# - clockId    ... port identities as integers, formatted by format_port_identity()
+# - management messages are kept without seqID and logMP, signalling messages without timestamps
+# - naMask     ... one bit per field of PTP_STORE_NULLABLE_FIELDS missing within the decoded message, e.g. an empty tshark field,
+#                  the field itself holds zero, NaN within views and data frames, see get_store_na_mask()
+PTP_STORE_BASE_FIELDS = [("frameNum", np.int64),
+                         ("flags",    np.uint16),
+                         ("seqID",    np.int32),
+                         ("logMP",    np.int16)]
+PTP_STORE_TS_FIELDS = [("ts",        np.int64),
+                       ("frameTime", np.int64),
+                       ("clockId",   np.uint64),
+                       ("portId",    np.int32)]
+PTP_STORE_NA_FIELDS = [("naMask",   np.uint8)]
+PTP_STORE_DTYPES = {msgID: np.dtype(PTP_STORE_BASE_FIELDS + PTP_STORE_TS_FIELDS + PTP_STORE_NA_FIELDS) for msgID in PTP_TS_FIELDS}
+PTP_STORE_DTYPES[PTP_MTYPE_DELAY_RESP] = np.dtype(PTP_STORE_BASE_FIELDS + PTP_STORE_TS_FIELDS + [("reqClockId", np.uint64), ("reqPortId", np.int32)] + PTP_STORE_NA_FIELDS)
+PTP_STORE_DTYPES[PTP_MTYPE_SIGNALLING] = np.dtype(PTP_STORE_BASE_FIELDS + [("tlvType", np.int32)] + PTP_STORE_NA_FIELDS)
+PTP_STORE_DTYPES[PTP_MTYPE_MANAGEMENT] = np.dtype(PTP_STORE_BASE_FIELDS[0:2])
+# fields that may be missing within the decoded message, bit i of naMask belongs to the i-th field
+PTP_STORE_NULLABLE_FIELDS = ["seqID", "logMP", "portId", "reqPortId", "tlvType"]
+
+### number of packets decoded at once by the mmap decoder
+MMAP_CHUNK_PACKETS = 1000000
+
+### follow mode
+# number of bytes read at once from a growing capture or pipe
+FOLLOW_READ_BYTES = 1024 * 1024
+# default time between two reads of a growing capture without new data, in seconds
+FOLLOW_DEFAULT_POLL_INTERVAL = 0.5
+# default time without new data after which a growing capture is regarded as complete, in seconds
+FOLLOW_DEFAULT_IDLE_TIMEOUT = 10.0
+# number of DlyReq messages allowed to be still waiting for their DlyResp before a live warning is printed
+FOLLOW_CNT_MISMATCH_TOLERANCE = 1
+
+### extraction cache
+# version of the cached data layout, increase whenever extraction results change
+CACHE_FORMAT_VERSION = 3
+# default size limit of a cache directory, least recently used entries are evicted beyond it
+CACHE_DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# block size used to hash the content of a capture
+CACHE_HASH_BLOCK_SIZE = 1024 * 1024
+
+### columnar export of decoded messages and results, see export_result()
+# npz     ... single .npz file per capture, only needs numpy
+# parquet ... directory per capture holding one .parquet file per table, needs pyarrow
+# arrow   ... directory per capture holding one .arrow (Feather v2) file per table, needs pyarrow
+EXPORT_FORMAT_NPZ = "npz"
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_FORMAT_ARROW = "arrow"
+# version of the exported data layout, increase whenever tables or columns change
+EXPORT_FORMAT_VERSION = 2
+
+### machine-readable report of a capture, see write_report()
+# version of the report layout, increase whenever fields change
+REPORT_FORMAT_VERSION = 3
+
+### warning output, see PtpWarningLog
+# records printed per warning type, further ones are only counted, 0 ... no limit
+WARNING_DEFAULT_PRINT_LIMIT = 20
+# details summed up when a record is continued, "...End" details are taken from the last message, all others from the first one
+WARNING_SUMMED_DETAILS = ("missing",)
+
+### flight recorder, messages of the same source around a warning, see PtpFlightRecorder
+# default number of messages kept before and after every warning, 0 ... disabled
+FLIGHT_DEFAULT_DEPTH = 8
+# warning records per warning type a snapshot is taken for, bounds the memory of the snapshots
+FLIGHT_MAX_SNAPSHOTS = 1000
+# layout of a recorded message, naMask holds one bit per field of FLIGHT_NULLABLE_FIELDS the message does not hold, e.g. the ts of a signalling message
+FLIGHT_RECORD_DTYPE = np.dtype([("frameNum",  np.int64),
+                                ("messageId", np.uint8),
+                                ("seqID",     np.int32),
+                                ("logMP",     np.int16),
+                                ("ts",        np.int64),
+                                ("frameTime", np.int64),
+                                ("naMask",    np.uint8)])
+FLIGHT_NULLABLE_FIELDS = ["seqID", "logMP", "ts", "frameTime"]
+
+### link layer types supported by the native decoder
+LINKTYPE_ETHERNET = 1
+LINKTYPE_LINUX_SLL = 113
+LINKTYPE_LINUX_SLL2 = 276
+
+### ethertypes and UDP ports relevant for the native decoder
+ETHTYPE_IPV4 = 0x0800
+ETHTYPE_IPV6 = 0x86dd
+ETHTYPE_VLAN = 0x8100
+ETHTYPE_QINQ = 0x88a8
+ETHTYPE_PTP = 0x88f7
+PTP_EVENT_PORT = 319
+PTP_GENERAL_PORT = 320
+
+### pcap/pcapng file format magic numbers and block types
+PCAP_MAGIC_USEC = 0xa1b2c3d4
+PCAP_MAGIC_NSEC = 0xa1b23c4d
+PCAPNG_BT_SHB = 0x0a0d0d0a
+PCAPNG_BT_IDB = 0x00000001
+PCAPNG_BT_PB = 0x00000002
+PCAPNG_BT_SPB = 0x00000003
+PCAPNG_BT_EPB = 0x00000006
+PCAPNG_OPT_IF_TSRESOL = 9
+# timestamps are given in microseconds, unless an interface states otherwise
+PCAPNG_DEFAULT_TSRESOL = 6
+PCAPNG_BYTE_ORDER_MAGIC = 0x1a2b3c4d
+
+### version of the tool, see -v
+TOOL_VERSION = "3.0"
+
+### profile of an analysis, see PtpProfiler
+# version of the layout of the JSON profile, increase whenever fields change
+PROFILE_FORMAT_VERSION = 1
+
 ###--------------------------------------------------------------------------------------------------------------------------------------------------
 ###----- Global Variables ---------------------------------------------------------------------------------------------------------------------------
 ###--------------------------------------------------------------------------------------------------------------------------------------------------
 
-### object for argparse usage
-parser = argparse.ArgumentParser()
-
 ### represents wheter or not warnings of type "zero timestamp found" shall be suppressed or not
 flagSuppressWarningZeroTS = False
 
-### flags to represent which message types were found
-msgFlagSync = False     # sync 
-msgFlagDlyReq = False   # delay request
-msgFlagFollUp = False   # follow up
-msgFlagDlyResp = False  # delay response
-msgFlagAnn = False      # announce 
-msgFlagSig = False      # signalling
-msgFlagMan = False      # management
-
 ### define list of valid args for tshark invocation
-tsharkValidArgList = ["--", "-T", "-Y", "-r", "-e", "-E", ">"]
-
-### list of arguments used to invoke tshark
-tsharkInvokeList = []
-
-### string to represent found eth.type value
-# -e ip.src
-# -e ipv6.src
-# -e eth.src 
-ethTypeUsed = ""
+tsharkValidArgList = ["--version", "-T", "-Y", "-r", "-e", "-E", "-2"]
 
 ### string to represent version-specific name of field to identify type of PTP messages
+# only depends on the installed tshark, therefore shared by all analyses
 # version 1.0.0 to 3.4.13 ... -e ptp.v2.messageid
 # version 3.6.0 to 3.6.3  ... -e ptp.v2.messagetype
 msgIdentifierUsed = ""
 
-### keep track of unique ip-source values
-uniqueSrcValues = []
-
-### list of data frames seperating PTP messages per unique source
-srcsList = []
-
-### to keep track of unique message IDs
-uniqueMsgIDs = []
+### analyzer of a batch worker process, created once per process by init_batch_worker()
+batchAnalyzer = None
 
 ### list of expected values for the field "logMP"
 listExpectedLogMP = [0, 1]
 
-### list of data frames per message type
-listSyncDF = []
-listDlyReqDF = []
-listFollUpDF = []
-listDlyRespDF = []
-listAnnDF = []
-listSigDF = []
-listManDF = []
-
-### preparing counter data frames for individual PTP message types
-msgData = {"Sync":    [0],
-            "DlyReq":  [0],
-            "FollUp":  [0],
-            "DlyResp": [0],
-            "Ann":     [0],
-            "Sig":     [0],
-            "Man":     [0],
-            "Total":   [0]}
-msgCountDF = pd.DataFrame(msgData)
-msgCountDF.index = ["msgCnt"]
-# print(msgCountDF)
-
-### list for logMP of different msg types
-listSyncLogMP = []
-listDlyReqLogMP = []
-listFollUpLogMP = []
-listDlyRespLogMP = []
-listAnnLogMP = []
-listSigLogMP = []
-listManLogMP = []
-
-### list for calculated avg msg interval
-listSyncAvgInterval = []
-listDlyReqAvgInterval = []
-listFollUpAvgInterval = []
-listDlyRespAvgInterval = []
-listAnnAvgInterval = []
-listSigAvgInterval = []
-listManAvgInterval = []
-
-# list for expected number of msgs, derived from
-# - firstTS, lastTS, logMP 
-listAnnMsgExpectedCnt = []
-
 ###--------------------------------------------------------------------------------------------------------------------------------------------------
-###----- Sub-Routines -------------------------------------------------------------------------------------------------------------------------------
+###----- Classes ------------------------------------------------------------------------------------------------------------------------------------
 ###--------------------------------------------------------------------------------------------------------------------------------------------------
-  
-###----- print defined warnings -----------------------------------------------
-### print warning about a non-plausible timestamp within the generated data frame
-# \param wType ... type of warning that shall be printed, supported values are
-#                  - "WTYPE_ZERO_TS"        ... zero timestamp found
-#                  - "WTYPE_NEGATIVE_TS"    ... negative timestamp found
-#                  - "WTYPE_BACKWARDS_TS"   ... current timestamp lower than previous one
-#                  - "WTYPE_UNKNOWN_MSG_ID" ... unknown messageId found
-#
-# \param df    ... data frame that holds the relevant information
-#                  - must hold ["frameNum", "messageId", "flags", "ts"]
-#
-# \param idx   ... index to element of a given data frame
-def print_specific_warning(wType, df, idx):
-    print("-----")
-    if(wType == WTYPE_ZERO_TS):
-        if(flagSuppressWarningZeroTS == False): # TODO actually make use of this flag?
-            print("warning:   zero timestamp")
-            print("- frameNum: ", df["frameNum"][idx])
-            print("- messageId:", df["messageId"][idx])
-            print("- flags:    ", df["flags"][idx])
-            print("- ts:       ", df["ts"][idx])
-    elif(wType == WTYPE_NEGATIVE_TS):
-        print("warning:   negative timestamp")
-        print("- frameNum: ", df["frameNum"][idx])
-        print("- ts:       ", df["ts"][idx])
-    elif(wType == WTYPE_BACKWARDS_TS):
-        print("warning:   current timestamp smaller than following")
-        print("- frameNum: ", df["frameNum"][idx], "->", df["frameNum"][idx+1])
-        print("- ts:       ", df["ts"][idx], "->", df["ts"][idx+1])
-    elif(wType == WTYPE_UNKNOWN_MSG_ID):
-        print("warning:   unknown messageId")
-        print("- frameNum: ", df["frameNum"][idx])
-        print("- messageId:", df["messageId"][idx])
-    else:
-        print("unknown warning type:", wType)
-###----------------------------------------------------------------------------
-
 
-
-###----- check for a number of potential reasons to print warnings ------------
-# utilizes previously implemented print_specific_warning() function
+###----- warnings of a single analysis ----------------------------------------
+# collects one record per warning and keeps the warning counts of the result up to date
+# - a record is a dict holding "type" (column of warningCountDF), "count", "msgType", "srcIdx",
+#   "frameNum", "frameNumEnd" and type specific details, see print_warning_record()
+# - warnings of consecutive messages of the same type, message type and source are aggregated into one record,
+#   see add_indexed(), the record holds the details of the first message, "...End" details of the last one
+# - records are printed once complete, unless echo is disabled, e.g. for a quiet report run,
+#   at most printLimit records per warning type, the remaining ones are summarized by print_suppressed()
+# - with a PtpFlightRecorder the messages of the same source around a warning are added as "context", see recorder
 #
-# \param df             ... data frame that holds the relevant information
+# \param printLimit ... records printed per warning type, 0 ... no limit
 #
-# \param warningCountDF ... data frame intended to present an overview about printed warnings
-def check_ts(df, warningCountDF):
-    ### check for zero ts
-    # df.at[3, "ts"] = 0.0 # FIXME insert zero ts on purpose
-    for idx in range(len(df["ts"])):
-        if(df["ts"][idx] == 0):
-            # print_specific_warning(WTYPE_ZERO_TS, df, idx) # TODO maybe add extra option to print these warnings or not
-            warningCountDF["Zero"] += 1
+# \param aggregate  ... False ... one record per warning, e.g. for the full detail within a report
+class PtpWarningLog:
 
-    ### check for negative ts
-    # df.at[4, "ts"] = -7.0 # FIXME insert negative ts on purpose
-    for idx in range(len(df["ts"])):
-        if(df["ts"][idx] < 0.0):
-            print_specific_warning(WTYPE_NEGATIVE_TS, df, idx)
-            warningCountDF["Negative"] += 1
+    def __init__(self, result, echo = True, printLimit = WARNING_DEFAULT_PRINT_LIMIT, aggregate = True):
+        self.result = result
+        self.echo = echo
+        self.printLimit = printLimit
+        self.aggregate = aggregate
+        self.records = []
 
-    ### check for backwards ts between two consecutive PTP messages
-    for idx in range(len(df["ts"]) - 1):
-        if(df["ts"][idx] > df["ts"][idx+1]):
-            print_specific_warning(WTYPE_BACKWARDS_TS, df, idx)
-            warningCountDF["Backwards"] += 1
-###----------------------------------------------------------------------------
+        ### message type and source of the messages currently checked, see set_source()
+        self.msgID = None
+        self.srcIdx = None
 
+        ### records that may still be extended, keyed by (type, msgType, srcIdx, kind, requester), value [record, msgIdxEnd]
+        self.openRuns = {}
 
+        ### printed and suppressed records per warning type
+        self.numPrinted = {}
+        self.numSuppressed = {}
 
-###----- invoking tshark with a set of arguments ------------------------------
-# function to invoke tshark with a given list of arguments
-def invoke_tshark(argList):
-  
-  # create empty string for args to use
-  invokeString = ""
-    
-  ### check length of given argList
-  # len  < 0 ... should never happen
-  # len == 0 ... invalid
-  # len >= 1 ... check for valid args
-  if(len(argList) == 0):
-    raise ValueError("invalid argList: no args")
-  elif(len(argList) >= 1):
-    for str in argList: # loop to check entries
-      for arg in tsharkValidArgList:
-        if(str.startswith(arg)):
-            invokeString += " " + str
-  else:
-    raise ValueError("error running tshark: len(argList) ==", str(len(argList)))
-  
-  # invoke tshark with created invokeString
-  if(invokeString != ""):
-    try:
-      process = subprocess.run("tshark" + invokeString,
-                               shell = True,
-                               check = True,
-                               universal_newlines = True).check_returncode()
-    except ValueError:
-      print("error running tshark, returncode:", process)
-  else:
-    raise ValueError("error running tshark")
-###----------------------------------------------------------------------------
+        ### PtpFlightRecorder taking a snapshot of the messages around every record, None ... disabled
+        self.recorder = None
 
+    ###----- set the message type and source of the following warnings -------
+    # \param msgID  ... integer messageId, None ... not related to a single message type
+    #
+    # \param srcIdx ... index into uniqueSrcValues, None ... not related to a single source
+    def set_source(self, msgID, srcIdx):
+        self.msgID = msgID
+        self.srcIdx = None if(srcIdx is None) else int(srcIdx)
 
+    ###----- add a warning ------------------------------------------------------
+    # \param wType   ... column of warningCountDF the warning is counted in
+    #
+    # \param count   ... number of warnings the record stands for, e.g. irregular seqID steps of a run
+    #
+    # \param details ... type specific details, may override msgType and srcIdx
+    #
+    # \param msgIdx  ... None ... the record is complete
+    #                    index of the first message within its source and message type, the record continues an open record
+    #                    of the same type, message type, source, kind and requester ending at msgIdx - 1, see add_indexed()
+    #
+    # \param msgIdxEnd ... index of the last message of the record, None ... msgIdx
+    def add(self, wType, count = 1, frameNum = None, frameNumEnd = None, msgIdx = None, msgIdxEnd = None, **details):
+        record = {"type":        wType,
+                  "count":       int(count),
+                  "msgType":     PTP_MTYPE_NAMES.get(self.msgID),
+                  "srcIdx":      self.srcIdx,
+                  "frameNum":    None if(frameNum is None) else int(frameNum),
+                  "frameNumEnd": None if(frameNumEnd is None) else int(frameNumEnd)}
+        record.update(details)
+        self.result.warningCountDF[wType] += count
+        if(self.recorder is not None):
+            self.recorder.snapshot(record)
 
-###----- check the installed tshark version -----------------------------------
-# function to discern installed version of tshark/wireshark
-# needed because of version specific differences such as
-# --- different names for tshark fields, e.g. ptp.v2.messageid VS ptp.v2.messagetype
-# --- different formatting of values of certain fields, e.g. hex-formatting VS strings
-def check_tshark_version():
-    ### string to represent name of field to identify PTP message types, dependant on installed wireshark/tshark version
-    global msgIdentifierUsed
-    
-    ### run version cmd, pipe output to a .txt file
-    invoke_tshark(["--version", ">output/tshark_ver.txt"])
-    
-    ### open .txt file for tshark version
-    file_tshark_ver = open("output/tshark_ver.txt", "r")
-    
-    ### read the first line
-    vLine = file_tshark_ver.readline()
-    
-    if("TShark (Wireshark) " in vLine):
-        ### get part of string containing version number
-        vNumString = vLine.split()[2] # TODO check if this is applicable to different wireshark/tshark versions
-        
-        ### split version string
-        vNumString = vNumString.replace(".", " ").split()
-        
-        ### check length of version string
-        if(len(vNumString) < 2):
-            raise ValueError("invalid version string:", vNumString)
-        elif(len(vNumString) == 3):
-            ### extract major/minor/sub as integers
-            vMajor = int(vNumString[0])
-            vMinor = int(vNumString[1])
-            vSub = int(vNumString[2])
-        else:
-            raise ValueError("invalid version string:", vNumString)
-        
-        ### check for version between 1.0.0 and 3.4.13
-        if((vMajor >= 1 and vMajor <= 3) and (vMinor >= 0 and vMinor <= 4) and (vSub >= 0 and vSub <= 13)):
-            msgIdentifierUsed = "ptp.v2.messageid"
-        ### check for version between 3.6.0 and 3.6.3
-        elif( (vMajor == 3) and (vMinor == 6) and (vSub >= 0 and vSub <= 3)):
-            msgIdentifierUsed = "ptp.v2.messagetype"
-        else:
-            raise ValueError("no valid tshark version found")
-    else:
-        raise ValueError("problem discerning tshark version")
-###----------------------------------------------------------------------------
+        if(msgIdx is None):
+            self.records.append(record)
+            self.complete(record)
+            return
 
+        msgIdx = int(msgIdx)
+        msgIdxEnd = msgIdx if(msgIdxEnd is None) else int(msgIdxEnd)
+        runKey = (wType, record["msgType"], record["srcIdx"], details.get("kind"), details.get("requester"))
+        openRun = self.openRuns.get(runKey)
+        if(self.aggregate == True and openRun is not None and openRun[1] + 1 == msgIdx):
+            ### continue the open record
+            openRecord = openRun[0]
+            openRecord["count"] += record["count"]
+            openRecord["frameNumEnd"] = record["frameNum"] if(record["frameNumEnd"] is None) else record["frameNumEnd"]
+            for key in details:
+                if(key.endswith("End") == True):
+                    openRecord[key] = details[key]
+                elif(key in WARNING_SUMMED_DETAILS):
+                    openRecord[key] += details[key]
+            openRun[1] = msgIdxEnd
+            return
 
+        if(openRun is not None):
+            self.complete(openRun[0])
+        self.records.append(record)
+        self.openRuns[runKey] = [record, msgIdxEnd]
 
-###----- determine Layer2/IPv4/IPv6 -------------------------------------------        
-# invoke tshark to analyse field eth.type
-# create pandas dataframe for processing
-# check dataframe for eligible ptp messages
-# check value of field eth.type, set the String ethTypeUsed for further operations
-def determine_eth_type(inputFileName):
-    global ethTypeUsed
-    
-    invoke_tshark(["-Y \"ptp\"", "-T \"fields\" -2", "-r " + inputFileName, "-e eth.type", "> output/tshark-first.txt"])
-        
-    vData = pd.read_csv("output/tshark-first.txt",
-                        sep = "\t",
-                        header = None,
-                        keep_default_na = True,
-                        names = ["ethType"],
-                        # index_col = "frameNum",
-                        encoding = "utf-8")
-    
-    if(vData.empty == True):
-        raise ValueError("no eligible PTP messages found within:" + inputFileName)
-    else:
-        ### check IPvX version of first PTP message
-        # print(vData["ethType"][vData.first_valid_index()])
-        ethTypeString = str(vData["ethType"][vData.first_valid_index()])
-        
-        if(ethTypeString.find("0800") != -1):
-            ethTypeUsed = "ip.src"
-        elif(ethTypeString.find("86dd") != -1):
-            ethTypeUsed = "ipv6.src"
-        elif(ethTypeString.find("8100") != -1):
-            ethTypeUsed = "eth.src"
+    ###----- add the warnings of a number of messages ---------------------------
+    # consecutive message indices are aggregated into one record, unless aggregation is disabled
+    # - vectorized, a single add() per record
+    #
+    # \param msgIdx       ... ascending indices of the messages within their source and message type
+    #
+    # \param frameNums    ... frame number per message
+    #
+    # \param frameNumsEnd ... None or frame number per message, e.g. the following message of a backwards ts
+    #
+    # \param columns      ... type specific details, one value per message or a single value for all of them
+    def add_indexed(self, wType, msgIdx, frameNums, frameNumsEnd = None, **columns):
+        msgIdx = np.asarray(msgIdx, dtype = np.int64)
+        if(len(msgIdx) == 0):
+            return
+        if(self.aggregate == True):
+            runStart = np.flatnonzero(np.diff(msgIdx, prepend = msgIdx[0] - 2) != 1)
         else:
-            raise ValueError("no valid eth.type found within:" + str(vData["ethType"][vData.first_valid_index]))
-###----------------------------------------------------------------------------
+            runStart = np.arange(len(msgIdx))
+        runEnd = np.append(runStart[1:], len(msgIdx)) - 1
 
+        for start, end in zip(runStart.tolist(), runEnd.tolist()):
+            if(frameNumsEnd is not None):
+                frameNumEnd = frameNumsEnd[end]
+            else:
+                frameNumEnd = frameNums[end] if(end > start) else None
+            details = {}
+            for key, values in columns.items():
+                if(np.ndim(values) == 0):
+                    details[key] = values
+                else:
+                    details[key] = values[end] if(key.endswith("End") == True) else values[start]
+            self.add(wType, end - start + 1, frameNums[start], frameNumEnd, msgIdx[start], msgIdx[end], **details)
 
-###----- identifying unique source-IPs ----------------------------------------
-# TODO add check whether or not ALL PTP messages are of same ethType
-# - read all data from initially created file .txt file
-# - store ip.src values in data frame ... srcData
-# - store unique values for ip.src in ... uniqueSrcValues
-def identify_ptp_sources(inputFileName):
-    # to manipulate globally defined list
-    global uniqueSrcValues
-    
-    # invoke tshark to check for sources of PTP messages
-    # - store output in .txt file
-    tsharkInvokeList = ["-Y \"ptp and not icmp\"", "-T \"fields\" -2", "-r " + inputFileName, "-E occurrence=f", "-e " + ethTypeUsed, "> output/tshark-first.txt"]
-    invoke_tshark(tsharkInvokeList)
-
-    # create pandas data frame from created .txt file
-    srcData = pd.read_csv("output/tshark-first.txt",
-                        sep = "\t",
-                        header = None,
-                        keep_default_na = True,
-                        names = ["srcVal"],
-                        # index_col = "frameNum",
-                        encoding = "utf-8")
-        
-    # get unique values from created pandas data frame, store in list
-    uniqueSrcValues = pd.unique(srcData["srcVal"])
-    print("Unique Src Values: ", uniqueSrcValues)
-###----------------------------------------------------------------------------
+    ###----- complete all open records --------------------------------------------
+    def flush(self):
+        for openRun in self.openRuns.values():
+            self.complete(openRun[0])
+        self.openRuns = {}
 
+    ###----- a record is complete, it is no longer extended ------------------------
+    def complete(self, record):
+        if(self.recorder is not None):
+            self.recorder.complete(record)
+        self.emit(record)
 
-###----- create separate data frames for unique source-IPs --------------------
-# invoke tshark for every unique ip.src found, store output in separate .txt files
-# generate separate data frames for unique ip.src values, add data frames to list ... srcsList[]
-def create_ptp_source_data_frames(inputFileName):
-    global uniqueSrcValues
-    global srcsList
-    
-    # invoke tshark to create separate input files
-    for idx in range(len(uniqueSrcValues)):
-        tsharkInvokeList = []
-        tsharkInvokeList = ["-r " + inputFileName, "-Y \"ptp and " + ethTypeUsed + "==" + uniqueSrcValues[idx] + "\"", "-T \"fields\" -2", "-e frame.number", "-e " + msgIdentifierUsed, "> output/src" + str(idx) + "-out.txt"]
-        invoke_tshark(tsharkInvokeList)
-
-    # create separate data frames for the identified sources, append them to list srcsList
-    fileName = ""
-    for idx in range(len(uniqueSrcValues)):
-        fileName = "output/src" + str(idx) + "-out.txt"
-        srcsList.append(pd.read_csv(fileName,
-                                    sep = "\t",
-                                    header = None,
-                                    keep_default_na = True,
-                                    names = ["frameNum", "messageID"],
-                                    # index_col = "frameNum",
-                                    encoding = "utf-8"))
+    ###----- print a complete record, as far as the limit of its type allows ------
+    def emit(self, record):
+        wType = record["type"]
+        # TODO maybe add extra option to print zero ts warnings or not, see flagSuppressWarningZeroTS
+        if(self.echo == False or wType == "Zero"):
+            return
+        if(self.printLimit > 0 and self.numPrinted.get(wType, 0) >= self.printLimit):
+            self.numSuppressed[wType] = self.numSuppressed.get(wType, 0) + 1
+            return
+        self.numPrinted[wType] = self.numPrinted.get(wType, 0) + 1
+        print_warning_record(record, self.result.uniqueSrcValues)
+
+    ###----- summarize the records not printed due to the limit -------------------
+    def print_suppressed(self):
+        self.flush()
+        for wType, numRecords in self.numSuppressed.items():
+            print("")
+            print(numRecords, "further", wType, "warning(s) not printed, limit", self.printLimit, "per type, see --warningLimit or the report (-r)")
+        self.numSuppressed = {}
 ###----------------------------------------------------------------------------
 
 
-###----- identifying unique PTP message IDs -----------------------------------
-# read data from srcsList[]
-# identify unique message IDs for identified srcVal in previously created srcsList
-# store unique message IDs in list ... uniqueMsgIDs
-# FIXME problem with version specific formatting of field <msgIdentifierUsed>
-# - old versions (eg 3.2.3) ... ptp.v2.messageid=1
-# - new versions (eg 3.6.3) ... ptp.v2.messagetype=0x01
-def identify_ptp_msg_types():
-    global srcsList
-    global uniqueMsgIDs
-    global msgFlagSync
-    global msgFlagDlyReq
-    global msgFlagFollUp
-    global msgFlagDlyResp
-    global msgFlagAnn
-    global msgFlagSig
-    global msgFlagMan
-    # find and store unique message IDs
-    for idx in range(len(srcsList)):
-        uniqueMsgIDs.append(pd.unique(srcsList[idx]["messageID"]))
-        # print("uniqueMsgIDs, srcsList[" + str(idx) + "]: ", uniqueMsgIDs)
+###----- messages of the same source around a warning ---------------------------
+# adds the list "context" to a warning record, holding up to depth messages of its source (all message types) before frameNum,
+# the messages at frameNum and frameNumEnd and up to depth messages after frameNumEnd, messages within a run are left out
+# - a row holds frameNum, msgType, seqID, logMP, ts and frameTime, None for fields the message does not hold
+# - before a record is complete only the messages before it are taken, see snapshot(), the ones after it once it is complete, see complete()
+# - at most FLIGHT_MAX_SNAPSHOTS records per warning type get a context
+# - batch analysis: the messages of a source are taken from the data frames of the result, converted once at its first warning, see get_window()
+# - streaming analysis: feed() keeps a ring of the last depth messages per source, followed by the chunk currently checked,
+#   so memory stays fixed and every message is handled once, messages after a warning at the end of a chunk are added with the next chunk,
+#   a warning starting at a message that already left the ring, e.g. a seqID gap following the last Sync of a previous chunk, gets fewer messages before it
+#
+# \param depth ... number of messages kept before and after a warning
+class PtpFlightRecorder:
 
-    # check what PTP message types were found
-    for arrayIdx in range(len(srcsList)):
-        for itemIdx in range(len(uniqueMsgIDs[arrayIdx])):
+    def __init__(self, result, depth = FLIGHT_DEFAULT_DEPTH):
+        self.result = result
+        self.depth = depth
+        self.numSnapshots = {}
 
-            # FIXME problem with version specific formatting of field <msgIdentifierUsed>
-            # - old versions (eg 3.2.3) ... ptp.v2.messageid=1
-            # - new versions (eg 3.6.3) ... ptp.v2.messagetype=0x01
-            # converting "0x0X" string to integer
-            tempID = int(uniqueMsgIDs[arrayIdx][itemIdx], 16)
-            uniqueMsgIDs[arrayIdx][itemIdx] = tempID
-            # uniqueMsgIDs[arrayIdx][itemIdx] = int(uniqueMsgIDs[arrayIdx][itemIdx], 16) # doing conversion in one line
-
-            if(uniqueMsgIDs[arrayIdx][itemIdx] == 0):
-                msgFlagSync = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 1):
-                msgFlagDlyReq = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 8):
-                msgFlagFollUp = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 9):
-                msgFlagDlyResp = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 11):
-                msgFlagAnn = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 12):
-                msgFlagSig = True
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == 13):
-                msgFlagMan = True
-
-    # print uniqueMsgIDs as a whole
-    print("Unique Msg IDs: ", uniqueMsgIDs)
-###----------------------------------------------------------------------------
+        ### open snapshots, keyed by id(record), see take_after()
+        self.snapshots = {}
 
+        ### messages per source sorted by frame number, keyed by srcIdx
+        # streaming analysis ... ring of the last depth messages followed by the current chunk, see feed()
+        # batch analysis     ... all messages of the source, see get_window()
+        self.streaming = False
+        self.windows = {}
 
-###----- get further information according to message type --------------------
-# iterate through array of uniqueSrcValues and uniqueMsgIDs respectively to create .txt files for further processing
-# add fields to tsharkInvokeList dependant on the identified PTP message type
-def get_further_information(inputFileName, uniqueSrcValues, uniqueMsgIDs):
+    ###----- take the messages before a new record -------------------------------
+    def snapshot(self, record):
+        wType = record["type"]
+        if(record["srcIdx"] is None or record["frameNum"] is None or self.numSnapshots.get(wType, 0) >= FLIGHT_MAX_SNAPSHOTS):
+            return
+        self.numSnapshots[wType] = self.numSnapshots.get(wType, 0) + 1
 
-    for arrayIdx in range(len(uniqueSrcValues)):
-        for itemIdx in range(len(uniqueMsgIDs[arrayIdx])):
-            tsharkInvokeList = ["-r " + inputFileName, "-Y \"ptp and " + msgIdentifierUsed + "==" + str(uniqueMsgIDs[arrayIdx][itemIdx]) + " and " + ethTypeUsed + "==" + str(uniqueSrcValues[arrayIdx]) + "\"", "-T \"fields\" -2"]
-            
-            # FIXME use commas to seperate entries in tsharkInvokeList
-            if(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_SYNC):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.sdr.origintimestamp.seconds -e ptp.v2.sdr.origintimestamp.nanoseconds")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_DELAY_REQ):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.sdr.origintimestamp.seconds -e ptp.v2.sdr.origintimestamp.nanoseconds")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_FOLLOW_UP):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.fu.preciseorigintimestamp.seconds -e ptp.v2.fu.preciseorigintimestamp.nanoseconds")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_DELAY_RESP):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.dr.receivetimestamp.seconds -e ptp.v2.dr.receivetimestamp.nanoseconds")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_ANNOUNCE):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.an.origintimestamp.seconds -e ptp.v2.an.origintimestamp.nanoseconds")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_SIGNALLING):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags -e ptp.v2.sequenceid -e ptp.v2.logmessageperiod -e ptp.v2.sig.tlv.tlvType")
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_MANAGEMENT):
-                tsharkInvokeList.append("-e frame.number -e " + msgIdentifierUsed + " -e ptp.v2.flags")
-            else:
-                print("unknown message ID: ", uniqueMsgIDs[arrayIdx][itemIdx])
-                continue
-            
-            tsharkInvokeList.append("> output/src" + str(arrayIdx) + "-msgID" + str(uniqueMsgIDs[arrayIdx][itemIdx]) + "-out.txt")
-            
-            invoke_tshark(tsharkInvokeList)
-###----------------------------------------------------------------------------
+        frameNum = record["frameNum"]
+        rows = self.query(record["srcIdx"], frameNum, self.depth, 1)
+        record["context"] = self.to_rows(rows[rows["frameNum"] <= frameNum])
+        # frameNumEnd ... messages after it taken so far, numAfter ... number of them
+        self.snapshots[id(record)] = {"record": record, "afterStart": len(record["context"]), "frameNumEnd": None, "numAfter": 0, "complete": False}
 
+    ###----- take the messages after a complete record ---------------------------
+    def complete(self, record):
+        snapshot = self.snapshots.get(id(record))
+        if(snapshot is None):
+            return
+        self.take_after(snapshot)
+        snapshot["complete"] = True
+        # a streamed record may still wait for the messages after it, see feed()
+        if(self.streaming == False or snapshot["numAfter"] >= self.depth):
+            del self.snapshots[id(record)]
 
-###----- create individual data frames for different message IDs --------------
-# go through previously created .txt files to create individual pandas data frames
-# append generated data frames to lists differentiated by type of PTP message
-def create_ptp_message_data_frames():
-    global uniqueSrcValues
-    global uniqueMsgIDs
-    global listSyncDF
-    global listDlyReqDF
-    global listFollUpDF
-    global listDlyRespDF
-    global listAnnDF
-    global listSigDF
-    
-    ### iterate through uniqueIpSrcs and uniqueMsgIDs
-    for arrayIdx in range(len(uniqueSrcValues)):
-        for itemIdx in range(len(uniqueMsgIDs[arrayIdx])):
-            ### prepare fileName
-            fileName = ""
-            fileName += "output/src" + str(arrayIdx) + "-msgID" + str(uniqueMsgIDs[arrayIdx][itemIdx]) + "-out.txt"
-            # print("fileName: ", fileName)
-            
-            ### create data frames according to found message IDs
-            if(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_SYNC):
-                syncData = pd.read_csv(fileName,
-                                    sep = "\t",
-                                    header = None,
-                                    keep_default_na = True,
-                                    names = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"],
-                                    # index_col = "frameNum",
-                                    encoding = "utf-8")
-                # append to list
-                listSyncDF.append(syncData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_DELAY_REQ):
-                delayReqData = pd.read_csv(fileName,
-                                        sep = "\t",
-                                        header = None,
-                                        keep_default_na = True,
-                                        names = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"],
-                                        # index_col = "frameNum",
-                                        encoding = "utf-8")
-                # append to list
-                listDlyReqDF.append(delayReqData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_FOLLOW_UP):
-                followUpData = pd.read_csv(fileName,
-                                        sep = "\t",
-                                        header = None,
-                                        keep_default_na = True,
-                                        names = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"],
-                                        # index_col = "frameNum",
-                                        encoding = "utf-8")
-                # append to list
-                listFollUpDF.append(followUpData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_DELAY_RESP):
-                delayRespData = pd.read_csv(fileName,
-                                            sep = "\t",
-                                            header = None,
-                                            keep_default_na = True,
-                                            names = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"],
-                                            # index_col = "frameNum",
-                                            encoding = "utf-8")
-                # append to list
-                listDlyRespDF.append(delayRespData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_ANNOUNCE):
-                announceData = pd.read_csv(fileName,
-                                        sep = "\t",
-                                        header = None,
-                                        keep_default_na = True,
-                                        names = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"],
-                                        # index_col = "frameNum",
-                                        encoding = "utf-8")
-                # append to list
-                listAnnDF.append(announceData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_SIGNALLING):
-                sigData = pd.read_csv(fileName,
-                                    sep = "\t",
-                                    header = None,
-                                    keep_default_na = True,
-                                    names = ["frameNum", "messageID", "flags", "seqID", "logMP", "tlvType"],
-                                    # index_col = "frameNum",
-                                    encoding = "utf-8")
-                # append to list
-                listSigDF.append(sigData)
-                
-            elif(uniqueMsgIDs[arrayIdx][itemIdx] == PTP_MTYPE_MANAGEMENT):
-                manData = pd.read_csv(fileName,
-                                    sep = "\t",
-                                    header = None,
-                                    keep_default_na = True,
-                                    names = ["frameNum", "messageId", "flags"],
-                                    # index_col = "frameNum",
-                                    encoding = "utf-8")
-                # append to list
-                listManDF.append(manData)
-                
-            else:
-                print("unknown message ID: ", uniqueMsgIDs[arrayIdx][itemIdx])
+    ###----- (re-)take the messages after the current end of a record -------------
+    # the messages taken for a previous end are replaced, e.g. once a run was extended
+    def take_after(self, snapshot):
+        record = snapshot["record"]
+        frameNumEnd = record["frameNum"] if(record["frameNumEnd"] is None) else record["frameNumEnd"]
+        if(snapshot["frameNumEnd"] == frameNumEnd):
+            return
+
+        context = record["context"]
+        del context[snapshot["afterStart"]:]
+        rows = self.query(record["srcIdx"], frameNumEnd, 0, self.depth + 1)
+        afterRows = rows[rows["frameNum"] > frameNumEnd][:self.depth]
+        if(frameNumEnd != record["frameNum"]):
+            context += self.to_rows(rows[rows["frameNum"] == frameNumEnd])
+        context += self.to_rows(afterRows)
+        snapshot["frameNumEnd"] = frameNumEnd
+        snapshot["numAfter"] = len(afterRows)
+
+    ###----- messages of a source around a frame number ----------------------------
+    # returns a structured array of dtype FLIGHT_RECORD_DTYPE, sorted by frame number,
+    # holding up to numBefore messages before frameNum and up to numAfter messages from frameNum on
+    #
+    # \param srcIdx ... index into uniqueSrcValues
+    def query(self, srcIdx, frameNum, numBefore, numAfter):
+        window = self.get_window(srcIdx)
+        pos = int(np.searchsorted(window["frameNum"], frameNum, side = "left"))
+        return window[max(0, pos - numBefore):pos + numAfter]
+
+    ###----- messages of a source sorted by frame number --------------------------------
+    # the records of all message types of a source are merged once, batch analysis only
+    def get_window(self, srcIdx):
+        if(srcIdx not in self.windows):
+            if(self.streaming == True):
+                return np.empty(0, dtype = FLIGHT_RECORD_DTYPE)
+            parts = [np.empty(0, dtype = FLIGHT_RECORD_DTYPE)]
+            for (recordSrcIdx, msgID), records in self.result.recordStore.records.items():
+                if(recordSrcIdx == srcIdx):
+                    parts.append(store_to_flight_records(records, msgID))
+            window = np.concatenate(parts)
+            self.windows[srcIdx] = window[np.argsort(window["frameNum"], kind = "stable")]
+        return self.windows[srcIdx]
+
+    ###----- add a chunk of messages, streaming analysis only ---------------------------
+    # to be called before the chunk is checked
+    #
+    # \param records ... structured array of dtype PTP_RECORD_DTYPE
+    def feed(self, records):
+        self.streaming = True
+
+        ### messages after open records are taken before the previous chunk is dropped
+        for snapshot in self.snapshots.values():
+            if(snapshot["complete"] == False):
+                self.take_after(snapshot)
+
+        ### keep the ring of the last depth messages per source, append the chunk
+        flightRecords = get_flight_records(records)
+        srcIdxs = records["srcIdx"]
+        order = np.argsort(srcIdxs, kind = "stable")
+        uniqueSrcIdxs, srcStart = np.unique(srcIdxs[order], return_index = True)
+        srcEnd = np.append(srcStart[1:], len(order))
+        windows = {srcIdx: window[max(0, len(window) - self.depth):] for srcIdx, window in self.windows.items()}
+        for srcIdx, start, end in zip(uniqueSrcIdxs.tolist(), srcStart.tolist(), srcEnd.tolist()):
+            windows[srcIdx] = np.concatenate((windows.get(srcIdx, np.empty(0, dtype = FLIGHT_RECORD_DTYPE)), flightRecords[order[start:end]]))
+        self.windows = windows
+
+        ### add the new messages to records still waiting for the messages after them
+        for recordID, snapshot in list(self.snapshots.items()):
+            if(snapshot["frameNumEnd"] is None or snapshot["numAfter"] >= self.depth):
                 continue
+            record = snapshot["record"]
+            window = self.get_window(record["srcIdx"])
+            lastFrameNum = max(snapshot["frameNumEnd"], record["context"][-1]["frameNum"] if(len(record["context"]) > 0) else snapshot["frameNumEnd"])
+            pos = int(np.searchsorted(window["frameNum"], lastFrameNum, side = "right"))
+            afterRows = window[pos:pos + self.depth - snapshot["numAfter"]]
+            record["context"] += self.to_rows(afterRows)
+            snapshot["numAfter"] += len(afterRows)
+            if(snapshot["complete"] == True and snapshot["numAfter"] >= self.depth):
+                del self.snapshots[recordID]
+
+    ###----- context rows of a number of messages ------------------------------------
+    def to_rows(self, flightRecords):
+        rows = []
+        for flightRecord in flightRecords.tolist():
+            row = {"frameNum": flightRecord[0],
+                   "msgType":  PTP_MTYPE_NAMES.get(flightRecord[1], flightRecord[1])}
+            for fieldIdx, col in enumerate(FLIGHT_NULLABLE_FIELDS):
+                row[col] = None if((flightRecord[-1] >> fieldIdx) & 1) else flightRecord[2 + fieldIdx]
+            rows.append(row)
+        return rows
 ###----------------------------------------------------------------------------
 
 
-###----- PTP message type specific calculations -----------------------------------
-# TODO determine sensible analysis for signnaling messages
-# TODO determine sensible analysis for management messages
-# PTP message type specific calculations
-# - get msg count
-# - get logMP # TODO check if logMP stays the same for ALL messages of one type
-# - append calculated avgIntervall to list of respective ptpMsgType
-def ptp_msg_type_specific_calcs(ptpMsgType, listDF):
-    
-    global msgCountDF
-    
-    # iterate through given list
-    for arrayIdx in range(len(listDF)):
-        # TODO current special cases for signalling/management msgs, as they dont hold time stamps
-        if(ptpMsgType == PTP_MTYPE_SIGNALLING):
-            msgCountDF["Sig"] += len(listDF[arrayIdx]["frameNum"])
-        elif(ptpMsgType == PTP_MTYPE_MANAGEMENT):
-            msgCountDF["Man"] += len(listDF[arrayIdx]["frameNum"])
-        else:
-            ### shared calculations
-            # create empty column for combined ts
-            pd.DataFrame.insert(listDF[arrayIdx], len(listDF[arrayIdx].columns), "ts", float(0.0))
+###----- per-stage profile of a single analysis ------------------------------
+# records per stage: wall time, CPU time of the process and of finished child processes (tshark),
+# peak RSS of the process and its children, number of tshark launches and bytes read
+# - stages are nested, a stage includes the stages started within, its name is "<outer>/<inner>"
+# - a stage entered repeatedly, e.g. once per chunk, accumulates, see "calls"
+# - peak RSS is the high-water mark of the process at the end of a stage, peakRSSIncrease how much a stage raised it
+# - tshark launches and bytes read are counted by the tshark invocations and decoders the profiler is passed to, see count_tshark_launch() and count_bytes_read()
+# - peak RSS and child CPU time need the resource module, they stay None on other platforms, e.g. Windows
+class PtpProfiler:
 
-            # calc ts from ts_s and ts_ns
-            for idx in range(len(listDF[arrayIdx])):
-                ts = listDF[arrayIdx]["ts_s"][idx] + listDF[arrayIdx]["ts_ns"][idx] * 10 ** (-9)
-                listDF[arrayIdx].at[idx, "ts"] = ts
-            # print(listDF[arrayIdx])
+    def __init__(self):
+        self.stages = {}
+        self.stack = []
+        self.tsharkLaunches = 0
+        self.bytesRead = 0
+        # tshark outputs are read by worker threads, see read_tshark_fields_concurrent()
+        self.lock = threading.Lock()
+        self.startCounters = self.get_counters()
+        self.endCounters = None
 
-            # get unique sequence IDs
-            msgTypeUniqueSeqID = len(pd.unique(listDF[arrayIdx]["seqID"]))
-            # print(msgTypeUniqueSeqID)
+    ###----- snapshot of all counters --------------------------------------------
+    def get_counters(self):
+        counters = {"wall":           time.perf_counter(),
+                    "cpu":            time.process_time(),
+                    "childCpu":       None,
+                    "peakRSS":        None,
+                    "childPeakRSS":   None,
+                    "tsharkLaunches": self.tsharkLaunches,
+                    "bytesRead":      self.bytesRead}
+        if(resource is not None):
+            selfUsage = resource.getrusage(resource.RUSAGE_SELF)
+            childUsage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            # ru_maxrss is given in KiB, on macOS in bytes
+            rssUnit = 1 if(sys.platform == "darwin") else 1024
+            counters["childCpu"] = childUsage.ru_utime + childUsage.ru_stime
+            counters["peakRSS"] = selfUsage.ru_maxrss * rssUnit
+            counters["childPeakRSS"] = childUsage.ru_maxrss * rssUnit
+        return counters
 
-            # get information about ts
-            firstTS = listDF[arrayIdx]["ts"][listDF[arrayIdx]["ts"].first_valid_index()]
-            lastTS  = listDF[arrayIdx]["ts"][listDF[arrayIdx]["ts"].last_valid_index()]
-            diffTS  = lastTS - firstTS
-            
-            ### msg type specific calculations
-            # sync
-            if(ptpMsgType == PTP_MTYPE_SYNC):
-                global listSyncLogMP
-                global listSyncAvgInterval
-               
-                msgCountDF["Sync"] += len(listDF[arrayIdx]["frameNum"])
-                listSyncLogMP.append(listDF[arrayIdx]["logMP"][listDF[arrayIdx]["logMP"].first_valid_index()])
-                listSyncAvgInterval.append(diffTS / msgTypeUniqueSeqID)
-                
-            # delay request
-            elif(ptpMsgType == PTP_MTYPE_DELAY_REQ):
-                global listDlyReqLogMP
-                global listDlyReqAvgInterval
-                
-                msgCountDF["DlyReq"] += len(listDF[arrayIdx]["frameNum"])
-                listDlyReqLogMP.append(listDF[arrayIdx]["logMP"][listDF[arrayIdx]["logMP"].first_valid_index()])           
-                listDlyReqAvgInterval.append(diffTS / msgTypeUniqueSeqID)
-
-            # follow up
-            elif(ptpMsgType == PTP_MTYPE_FOLLOW_UP):
-                global listFollUpLogMP
-                global listFollUpAvgInterval
-                
-                msgCountDF["FollUp"] += len(listDF[arrayIdx]["frameNum"])
-                listFollUpLogMP.append(listDF[arrayIdx]["logMP"][listDF[arrayIdx]["logMP"].first_valid_index()])           
-                listFollUpAvgInterval.append(diffTS / msgTypeUniqueSeqID)
-            
-            # delay response
-            elif(ptpMsgType == PTP_MTYPE_DELAY_RESP):
-                global listDlyRespLogMP
-                global listDlyRespAvgInterval
-                
-                msgCountDF["DlyResp"] += len(listDF[arrayIdx]["frameNum"])
-                listDlyRespLogMP.append(listDF[arrayIdx]["logMP"][listDF[arrayIdx]["logMP"].first_valid_index()])           
-                listDlyRespAvgInterval.append(diffTS / msgTypeUniqueSeqID)
-            
-            # announce
-            elif(ptpMsgType == PTP_MTYPE_ANNOUNCE):
-                global listAnnLogMP
-                global listAnnAvgInterval
-                
-                msgCountDF["Ann"] += len(listDF[arrayIdx]["frameNum"])
-                listAnnLogMP.append(listDF[arrayIdx]["logMP"][listDF[arrayIdx]["logMP"].first_valid_index()])           
-                listAnnAvgInterval.append(diffTS / msgTypeUniqueSeqID)
-###--------------------------------------------------------------------------------
+    ###----- profile a stage -------------------------------------------------------
+    # \param name ... name of the stage, prefixed by the names of the enclosing stages
+    @contextlib.contextmanager
+    def stage(self, name):
+        self.stack.append(name)
+        stageName = "/".join(self.stack)
+        # registered on entry, so stages are listed in order of execution, outer before inner ones
+        stats = self.stages.setdefault(stageName, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "childCpu_s": None, "peakRSS_MiB": None,
+                                                   "peakRSSIncrease_MiB": None, "childPeakRSS_MiB": None, "tsharkLaunches": 0, "bytesRead": 0})
+        startCounters = self.get_counters()
+        try:
+            yield
+        finally:
+            endCounters = self.get_counters()
+            self.stack.pop()
+            stats["calls"] += 1
+            self.add_deltas(stats, startCounters, endCounters)
 
+    ###----- add the difference of two counter snapshots to the stats of a stage -----
+    def add_deltas(self, stats, startCounters, endCounters):
+        stats["wall_s"] += endCounters["wall"] - startCounters["wall"]
+        stats["cpu_s"] += endCounters["cpu"] - startCounters["cpu"]
+        stats["tsharkLaunches"] += endCounters["tsharkLaunches"] - startCounters["tsharkLaunches"]
+        stats["bytesRead"] += endCounters["bytesRead"] - startCounters["bytesRead"]
+        if(endCounters["peakRSS"] is not None):
+            stats["childCpu_s"] = (stats["childCpu_s"] or 0.0) + endCounters["childCpu"] - startCounters["childCpu"]
+            stats["peakRSS_MiB"] = endCounters["peakRSS"] / (1024 * 1024)
+            stats["peakRSSIncrease_MiB"] = (stats["peakRSSIncrease_MiB"] or 0.0) + (endCounters["peakRSS"] - startCounters["peakRSS"]) / (1024 * 1024)
+            stats["childPeakRSS_MiB"] = endCounters["childPeakRSS"] / (1024 * 1024)
 
-###----- print warning overview ---------------------------------------------------
-# check for potential reasons to print a warning, like
-# - Zero TS
-# - Negative TS
-# - Backwards TS between two following Messages
-# - Not yet defined reasons due to unknown problems
-def print_warning_overview(warningCountDF):
-    print("--------------------------------------------------------------------")
-    print("--- Warning(s) -----------------------------------------------------")
-    print("--------------------------------------------------------------------")
-    print("- Sync -")
-    if(msgFlagSync == True):
-        for arrayIdx in range(len(listSyncDF)):
-            check_ts(listSyncDF[arrayIdx], warningCountDF)
-    print("--------------------------------------------------------------------")
-    print("- DlyReq -")
-    if(msgFlagDlyReq == True):
-        for arrayIdx in range(len(listDlyReqDF)):
-            check_ts(listDlyReqDF[arrayIdx], warningCountDF)
-            # iterate through seqID to find possible irregularities
-            for itemIdx in range(len(listDlyReqDF[arrayIdx])-1):
-                if(listDlyReqDF[arrayIdx]["seqID"][itemIdx]+1 != listDlyReqDF[arrayIdx]["seqID"][itemIdx+1]):
-                    warningCountDF["SeqID"] += 1
-                    print("")
-                    print("Irregular seqID:")
-                    print("- frameNum =", listDlyReqDF[arrayIdx]["frameNum"][itemIdx], "-> frameNum =", listDlyReqDF[arrayIdx]["frameNum"][itemIdx+1])
-                    print("- seqID =", listDlyReqDF[arrayIdx]["seqID"][itemIdx], "-> seqID =", listDlyReqDF[arrayIdx]["seqID"][itemIdx+1])
-            # compare number of DlyReq and DlyResp messages
-            if(msgCountDF["DlyReq"][msgCountDF["DlyReq"].last_valid_index()] < msgCountDF["DlyResp"][msgCountDF["DlyResp"].last_valid_index()]):
-                # print("DlyResp Msg missing")
-                warningCountDF["CntMismatch"] += 1
-                print("")
-                print("Missing DlyReq Msg:")
-                print("- Cnt DlyReq:  ", msgCountDF["DlyReq"][msgCountDF["DlyReq"].last_valid_index()])
-                print("- Cnt DlyResp: ", msgCountDF["DlyResp"][msgCountDF["DlyResp"].last_valid_index()])
+    ###----- end of the profiled analysis ---------------------------------------------
+    def stop(self):
+        self.endCounters = self.get_counters()
 
-    print("--------------------------------------------------------------------")
-    print("- FollowUp -")
-    if(msgFlagFollUp == True):
-        for arrayIdx in range(len(listFollUpDF)):
-            check_ts(listFollUpDF[arrayIdx], warningCountDF)
-    print("--------------------------------------------------------------------")
-    print("- DlyResp -")
-    if(msgFlagDlyResp == True):
-        for arrayIdx in range(len(listDlyRespDF)):
-            check_ts(listDlyRespDF[arrayIdx], warningCountDF)
-            # iterate through seqID to find possible irregularities
-            for itemIdx in range(len(listDlyRespDF[arrayIdx])-1):
-                if(listDlyRespDF[arrayIdx]["seqID"][itemIdx]+1 != listDlyRespDF[arrayIdx]["seqID"][itemIdx+1]):
-                    warningCountDF["SeqID"] += 1
-                    print("")
-                    print("Irregular seqID:")
-                    print("- frameNum =", listDlyRespDF[arrayIdx]["frameNum"][itemIdx], "-> frameNum =", listDlyRespDF[arrayIdx]["frameNum"][itemIdx+1])
-                    print("- seqID =", listDlyRespDF[arrayIdx]["seqID"][itemIdx], "-> seqID =", listDlyRespDF[arrayIdx]["seqID"][itemIdx+1])
-            # compare number of DlyReq and DlyResp messages
-            if(msgCountDF["DlyReq"][msgCountDF["DlyReq"].last_valid_index()] > msgCountDF["DlyResp"][msgCountDF["DlyResp"].last_valid_index()]):
-                # print("DlyResp Msg missing")
-                warningCountDF["CntMismatch"] += 1
-                print("")
-                print("Missing DlyResp Msg:")
-                print("- Cnt DlyReq:  ", msgCountDF["DlyReq"][msgCountDF["DlyReq"].last_valid_index()])
-                print("- Cnt DlyResp: ", msgCountDF["DlyResp"][msgCountDF["DlyResp"].last_valid_index()])
-                
-    print("--------------------------------------------------------------------")
-    print("- Ann -")
-    if(msgFlagAnn == True):
-        for arrayIdx in range(len(listAnnDF)):
-            check_ts(listAnnDF[arrayIdx], warningCountDF)
-    print("--------------------------------------------------------------------")
-###-------------------------------------------------------------------------------- 
+    ###----- stats of all stages and of the whole analysis ---------------------------
+    # returns a data frame holding one row per stage, in order of first entry, the last row "total" covers the whole analysis
+    def get_stats_df(self):
+        total = {"calls": 1, "wall_s": 0.0, "cpu_s": 0.0, "childCpu_s": None, "peakRSS_MiB": None,
+                 "peakRSSIncrease_MiB": None, "childPeakRSS_MiB": None, "tsharkLaunches": 0, "bytesRead": 0}
+        self.add_deltas(total, self.startCounters, self.endCounters if(self.endCounters is not None) else self.get_counters())
+        rows = [dict(stage = stageName, **stats) for stageName, stats in self.stages.items()]
+        rows.append(dict(stage = "total", **total))
+        return pd.DataFrame(rows)
 
+    ###----- count a tshark launch ---------------------------------------------------
+    def count_tshark_launch(self):
+        with self.lock:
+            self.tsharkLaunches += 1
 
-###----- print final overview -----------------------------------------------------
-def print_final_overview(warningCountDF):
-    global msgCountDF
-    
-    print("--- Msg Type Specific Overview -------------------------------------")
-    ### Sync Message Overview
-    if(msgFlagSync == True):
-        ### display actual results
-        print("--------------------------------------------------------------------")
-        print("--- sync info ---")
+    ###----- count bytes read from a capture, a cache file or a tshark pipe -----------
+    def count_bytes_read(self, numBytes):
+        with self.lock:
+            self.bytesRead += int(numBytes)
+###----------------------------------------------------------------------------
 
-        for arrayIdx in range(len(listSyncDF)):
-            print("")
-            print("src:", str(uniqueSrcValues[arrayIdx]))
-            ### expected avg interval VS actual avg interval
-            # listSyncLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
-            syncAvgIntervalExpected = 0.0
-            firstTS = listSyncDF[arrayIdx]["ts"][listSyncDF[arrayIdx]["ts"].first_valid_index()]
-            lastTS = listSyncDF[arrayIdx]["ts"][listSyncDF[arrayIdx]["ts"].last_valid_index()]
-            print("first ts:", firstTS, "s")
-            print("last ts: ", lastTS, "s")
-            if(-8 <= listSyncLogMP[arrayIdx] <= 8): # FIXME magic numbers for limits
-                syncAvgIntervalExpected = 2.0 ** float(listSyncLogMP[arrayIdx])
-                syncExpectedNumMsgs = (lastTS - firstTS) / syncAvgIntervalExpected
-                print("Sync Log MP:", listSyncLogMP[arrayIdx])
-                print("Expected Num Sync Msgs: ", syncExpectedNumMsgs) # FIXME leave it like this or add number to a second row in msgCountDF
-                print("Expected Avg Sync Interval:  ", syncAvgIntervalExpected, "s")
-                print("Calculated Avg Sync Interval:", listSyncAvgInterval, "s")
-            else:
-                print("Unexpected Log MP:", listSyncLogMP[arrayIdx])
-       
-    ### DelayReq Message Overview 
-    if(msgFlagDlyReq == True):
-        ### display actual results
-        print("--------------------------------------------------------------------")
-        print("--- dely req info ---")
 
-        for arrayIdx in range(len(listDlyReqDF)):
-            print("")
-            print("src:", str(uniqueSrcValues[arrayIdx]))
-            ### expected avg interval VS actual avg interval
-            # listDlyReqLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
-            dlyReqAvgIntervalExpected = 0.0
-            print("first ts:", listDlyReqDF[arrayIdx]["ts"][listDlyReqDF[arrayIdx]["ts"].first_valid_index()], "s")
-            print("last ts: ", listDlyReqDF[arrayIdx]["ts"][listDlyReqDF[arrayIdx]["ts"].last_valid_index()], "s")
-            if(0 <= listDlyReqLogMP[arrayIdx] <= 5): # FIXME magic numbers for limits
-                print("DlyReq LogMP:", listDlyReqLogMP[arrayIdx])
-                dlyReqAvgIntervalExpected = 2.0 ** float(listDlyReqLogMP[arrayIdx])
-                print("Expected Avg DlyReq Interval:  ", dlyReqAvgIntervalExpected, "s")
-            else:
-                print("Unexpected Log MP:", listDlyReqLogMP[arrayIdx])
-            print("Calculated Avg DlyReq Interval:", listDlyReqAvgInterval[arrayIdx], "s")
-    
-    ### Follow Up Message Overview
-    if(msgFlagFollUp == True):
-        ### display actual results
-        print("--------------------------------------------------------------------")
-        print("--- follow up info ---")
+###----- text stream counting what is read from it ------------------------------
+# wraps the stdout pipe of tshark while profiling, see read_tshark_fields()
+class PtpCountingReader:
 
-        for arrayIdx in range(len(listFollUpDF)):
-            print("")
-            print("src:", str(uniqueSrcValues[arrayIdx]))
-            ### expected avg interval VS actual avg interval
-            # listFollUpLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
-            follUpAvgIntervalExpected = 0.0
-            print("first ts:", listFollUpDF[arrayIdx]["ts"][listFollUpDF[arrayIdx]["ts"].first_valid_index()], "s")
-            print("last ts: ", listFollUpDF[arrayIdx]["ts"][listFollUpDF[arrayIdx]["ts"].last_valid_index()], "s")
-            if(-8 <= listFollUpLogMP[arrayIdx] <= 8): # FIXME magic numbers for limits # FIXME what are the actual limits?
-                print("FollUp LogMP:", listFollUpLogMP[arrayIdx])
-                follUpAvgIntervalExpected = 2.0 ** float(listFollUpLogMP[arrayIdx])
-                print("Expected Avg FollUp Interval:  ", follUpAvgIntervalExpected, "s")
-            else:
-                print("Unexpected Log MP:", listFollUpLogMP[arrayIdx])
-            print("Calculated Avg FollUp Interval:", listFollUpAvgInterval[arrayIdx], "s")
-    
-    ### DelayResp Message Overview
-    if(msgFlagDlyResp == True):
-        ### display actual results
-        print("--------------------------------------------------------------------")
-        print("--- delay response info ---")
+    def __init__(self, stream, profiler):
+        self.stream = stream
+        self.profiler = profiler
 
-        for arrayIdx in range(len(listDlyRespDF)):
-            print("")
-            print("src:", str(uniqueSrcValues[arrayIdx]))
-            ### expected avg interval VS actual avg interval
-            # listDlyRespLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
-            dlyRespAvgIntervalExpected = 0.0
-            print("first ts:", listDlyRespDF[arrayIdx]["ts"][listDlyRespDF[arrayIdx]["ts"].first_valid_index()], "s")
-            print("last ts: ", listDlyRespDF[arrayIdx]["ts"][listDlyRespDF[arrayIdx]["ts"].last_valid_index()], "s")
-            if(0 <= listDlyRespLogMP[arrayIdx] <= 5): # FIXME magic numbers for limits
-                print("DlyResp LogMP:", listDlyRespLogMP[arrayIdx])
-                dlyRespAvgIntervalExpected = 2.0 ** float(listDlyRespLogMP[arrayIdx])
-                print("Expected Avg DlyResp Interval:  ", dlyRespAvgIntervalExpected, "s")
+    def read(self, size = -1):
+        data = self.stream.read(size)
+        self.profiler.count_bytes_read(len(data))
+        return data
+
+    def readline(self, size = -1):
+        line = self.stream.readline(size)
+        self.profiler.count_bytes_read(len(line))
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, "")
+###----------------------------------------------------------------------------
+
+
+###----- decoded PTP messages of a capture ------------------------------------
+# one structured array of dtype PTP_STORE_DTYPES[msgID] per (srcIdx, msgID), see append_ptp_message_records()
+# - the check and stats stages read the arrays through a PtpRecordView, data frames are only built on demand
+class PtpRecordStore:
+
+    def __init__(self):
+        ### structured arrays keyed by (srcIdx, msgID)
+        self.records = {}
+
+        ### increased by every add(), data frames built from the messages are cached per version, see PtpAnalysisResult.get_msg_df()
+        self.version = 0
+
+    ###----- add the messages of a single source and message type ---------------
+    # messages added twice for the same key are appended
+    #
+    # \param records ... structured array of dtype PTP_STORE_DTYPES[msgID]
+    def add(self, srcIdx, msgID, records):
+        key = (srcIdx, msgID)
+        if(key in self.records):
+            records = np.concatenate([self.records[key], records])
+        self.records[key] = records
+        self.version += 1
+
+    ###----- view of the messages of a single source and message type -----------
+    # empty for keys without messages, e.g. the sources of a streaming analysis, which does not keep messages
+    def get_view(self, srcIdx, msgID):
+        records = self.records.get((srcIdx, msgID))
+        if(records is None):
+            records = np.empty(0, dtype = PTP_STORE_DTYPES[msgID])
+        return PtpRecordView(records, msgID)
+
+    ###----- number of bytes held by all messages ---------------------------------
+    def get_nbytes(self):
+        return sum([records.nbytes for records in self.records.values()])
+
+    def __len__(self):
+        return sum([len(records) for records in self.records.values()])
+###----------------------------------------------------------------------------
+
+
+###----- messages of a single source and message type -------------------------
+# read-only column access to a structured array of the PtpRecordStore, without copying it
+# - view["col"] returns the integer array of a field, nullable fields missing for any message are returned as float holding NaN, see get_store_na_mask()
+# - usable wherever the check and stats stages used to get a data frame, see to_frame() for the data frame itself
+#
+# \param records ... structured array of dtype PTP_STORE_DTYPES[msgID]
+#
+# \param msgID   ... integer messageId
+class PtpRecordView:
+
+    def __init__(self, records, msgID):
+        self.records = records
+        self.msgID = msgID
+        self.columns = list(records.dtype.names)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, col):
+        values = self.records[col]
+        naMask = get_store_na_mask(self.records, col)
+        if(naMask.any() == True):
+            values = np.where(naMask, np.nan, values)
+        return values
+
+    ###----- first value of a field which is not missing, None if there is none ---
+    def first_valid(self, col):
+        values = self[col]
+        validIdx = np.flatnonzero(~np.isnan(values)) if(values.dtype.kind == "f") else np.arange(min(len(values), 1))
+        return values[validIdx[0]] if(len(validIdx) > 0) else None
+
+    ###----- data frame of the messages ---------------------------------------------
+    # same columns as the data frames created by get_further_information(), plus ts
+    # - messageID/messageId and flags are integers, ts_s/ts_ns are derived from ts
+    def to_frame(self):
+        frameData = {"frameNum": self.records["frameNum"],
+                     ("messageId" if(self.msgID == PTP_MTYPE_MANAGEMENT) else "messageID"): np.full(len(self.records), self.msgID, dtype = np.uint8),
+                     "flags": self.records["flags"]}
+        if(self.msgID != PTP_MTYPE_MANAGEMENT):
+            frameData["seqID"] = self["seqID"]
+            frameData["logMP"] = self["logMP"]
+        if(self.msgID in PTP_TS_FIELDS):
+            frameData["ts_s"] = self.records["ts"] // NS_PER_S
+            frameData["ts_ns"] = self.records["ts"] % NS_PER_S
+            for col in get_ptp_id_columns(self.msgID):
+                frameData[col] = self[col]
+            frameData["ts"] = self.records["ts"]
+        elif(self.msgID == PTP_MTYPE_SIGNALLING):
+            frameData["tlvType"] = self["tlvType"]
+        return pd.DataFrame(frameData)
+###----------------------------------------------------------------------------
+
+
+###----- result of the analysis of a single capture ---------------------------
+# holds everything derived from one input file, so analyses of different captures never share state
+# - sources, message types and the decoded messages per source and message type, see PtpRecordStore
+# - message counts, logMP, calculated avg intervals
+# - warning counts
+class PtpAnalysisResult:
+
+    def __init__(self, inputFileName):
+        ### analysed input file
+        self.inputFileName = inputFileName
+
+        ### string to represent found eth.type value
+        # -e ip.src
+        # -e ipv6.src
+        # -e eth.src 
+        self.ethTypeUsed = ""
+
+        ### keep track of unique ip-source values
+        self.uniqueSrcValues = []
+
+        ### to keep track of unique message IDs
+        self.uniqueMsgIDs = []
+
+        ### flags to represent which message types were found
+        self.msgFlagSync = False     # sync 
+        self.msgFlagDlyReq = False   # delay request
+        self.msgFlagFollUp = False   # follow up
+        self.msgFlagDlyResp = False  # delay response
+        self.msgFlagAnn = False      # announce 
+        self.msgFlagSig = False      # signalling
+        self.msgFlagMan = False      # management
+
+        ### decoded messages per source and message type, see PtpRecordStore
+        self.recordStore = PtpRecordStore()
+        # data frames built from the record store, valid as long as its version equals frameCacheVersion, see get_cached_frame()
+        self.frameCache = {}
+        self.frameCacheVersion = 0
+
+        ### index into uniqueSrcValues for every source holding messages of a message type, in order of extraction
+        # the position within a list is the arrayIdx of the source, see get_msg_data() and get_data_frame_list()
+        self.listSrcIdx = {PTP_MTYPE_SYNC:       [],
+                           PTP_MTYPE_DELAY_REQ:  [],
+                           PTP_MTYPE_FOLLOW_UP:  [],
+                           PTP_MTYPE_DELAY_RESP: [],
+                           PTP_MTYPE_ANNOUNCE:   [],
+                           PTP_MTYPE_SIGNALLING: [],
+                           PTP_MTYPE_MANAGEMENT: []}
+
+        ### first and last timestamp of every entry of listSrcIdx, per message type, in nanoseconds
+        self.listFirstTS = {msgID: [] for msgID in self.listSrcIdx}
+        self.listLastTS = {msgID: [] for msgID in self.listSrcIdx}
+
+        ### list for logMP of different msg types
+        self.listSyncLogMP = []
+        self.listDlyReqLogMP = []
+        self.listFollUpLogMP = []
+        self.listDlyRespLogMP = []
+        self.listAnnLogMP = []
+
+        ### list for calculated avg msg interval, in nanoseconds
+        self.listSyncAvgInterval = []
+        self.listDlyReqAvgInterval = []
+        self.listFollUpAvgInterval = []
+        self.listDlyRespAvgInterval = []
+        self.listAnnAvgInterval = []
+
+        ### dict of PtpStreamStats keyed by (srcIdx, msgID), only filled by the streaming analysis
+        self.streamState = {}
+
+        ### allowed relative deviation of an interval from the expected interval, see calc_interval_stats()
+        self.intervalTolerance = INTERVAL_DEFAULT_TOLERANCE
+
+        ### inter-arrival interval statistics, one row per source and message type, see calc_interval_stats()
+        self.intervalStatsDF = pd.DataFrame(columns = INTERVAL_STATS_COLUMNS)
+
+        ### segments of consecutive messages holding the same logMP, per source and message type, see analyze_logmp_segments()
+        # not kept by the streaming analysis
+        self.logMPSegmentsDF = pd.DataFrame(columns = ["messageId", "srcIdx"] + LOGMP_SEGMENT_COLUMNS)
+
+        ### run-length summaries of irregular seqIDs of all message types and sources, see analyze_seq_ids()
+        self.seqIDRunsDF = pd.DataFrame(columns = ["messageId", "srcIdx"] + SEQ_RUN_COLUMNS)
+
+        ### data frames of paired messages, one row per pair or unmatched message, see pair_ptp_messages()
+        # None as long as no pairing took place, e.g. for the streaming analysis
+        self.pairSyncFollUpDF = None
+        self.pairDlyReqRespDF = None
+
+        ### t1..t4, mean path delay and capture clock offset per delay request exchange, see calc_offset_delay()
+        # None as long as no Sync and DlyReq/DlyResp pairs were found
+        self.offsetDelayDF = None
+        # summary statistics per slave port identity, see calc_offset_delay_stats()
+        self.offsetDelayStatsDF = None
+
+        ### preparing counter data frames for individual PTP message types
+        msgData = {"Sync":    [0],
+                   "DlyReq":  [0],
+                   "FollUp":  [0],
+                   "DlyResp": [0],
+                   "Ann":     [0],
+                   "Sig":     [0],
+                   "Man":     [0],
+                   "Total":   [0]}
+        self.msgCountDF = pd.DataFrame(msgData)
+        self.msgCountDF.index = ["msgCnt"]
+
+        ### prepare counters for potential warnings regarding different possible problems
+        # TODO maybe add more dimensions to this data frame, to easily determine the origin of a warning
+        warningData = {"Zero":        [0],
+                       "Negative":    [0],
+                       "Backwards":   [0],
+                       "SeqID":       [0],
+                       "LogMP":       [0],
+                       "CntMismatch": [0],
+                       "Unmatched":   [0],
+                       "Late":        [0],
+                       "Other":       [0]}
+        self.warningCountDF = pd.DataFrame(warningData)
+        self.warningCountDF.index = ["wCnt"]
+
+        ### print progress and warnings while analysing, False for a quiet analysis, see print_info()
+        self.echo = True
+
+        ### one record per warning, counted in warningCountDF, see PtpWarningLog
+        self.warningLog = PtpWarningLog(self)
+
+        ### PtpProfiler of the analysis, None if not profiled
+        self.profiler = None
+
+    ### lists of data frames per message type, kept for callers of the former data frame lists, see get_data_frame_list()
+    # thin wrappers of get_msg_df(), every data frame is built once and cached, get_msg_data() is cheaper for a single column
+    listSyncDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_SYNC))
+    listDlyReqDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_DELAY_REQ))
+    listFollUpDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_FOLLOW_UP))
+    listDlyRespDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_DELAY_RESP))
+    listAnnDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_ANNOUNCE))
+    listSigDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_SIGNALLING))
+    listManDF = property(lambda self: self.get_data_frame_list(PTP_MTYPE_MANAGEMENT))
+
+    ###----- get the messages of a source and message type ------------------------
+    # returns a PtpRecordView, cheap enough to be called per check
+    #
+    # \param msgID    ... integer messageId
+    #
+    # \param arrayIdx ... index into result.listSrcIdx[msgID]
+    def get_msg_data(self, msgID, arrayIdx):
+        return self.recordStore.get_view(self.listSrcIdx[msgID][arrayIdx], msgID)
+
+    ###----- get the data frame of a source and message type -----------------------
+    # built from the record store once, see PtpRecordView.to_frame(), and cached until messages are added to the store
+    # the data frame is shared by all callers, changes to it are only kept until then, copy it to modify it
+    #
+    # \param msgID    ... integer messageId
+    #
+    # \param arrayIdx ... index into result.listSrcIdx[msgID]
+    def get_msg_df(self, msgID, arrayIdx):
+        return self.get_cached_frame((msgID, self.listSrcIdx[msgID][arrayIdx]), lambda: self.get_msg_data(msgID, arrayIdx).to_frame())
+
+    ###----- get the list of data frames of a message type ----------------------
+    # one data frame per source, see get_msg_df()
+    # returns None for not (yet) supported message types
+    #
+    # \param msgID ... integer messageId
+    def get_data_frame_list(self, msgID):
+        if(msgID not in self.listSrcIdx):
+            return None
+        return [self.get_msg_df(msgID, arrayIdx) for arrayIdx in range(len(self.listSrcIdx[msgID]))]
+
+    ###----- data frames holding frameNum and messageID of every source --------------
+    # built from the record store once and cached like get_msg_df(), ordered by frameNum
+    @property
+    def srcsList(self):
+        return [self.get_cached_frame(("srcs", srcIdx), lambda: self.get_src_frame(srcIdx)) for srcIdx in range(len(self.uniqueSrcValues))]
+
+    ###----- data frame holding frameNum and messageID of a source -------------------
+    # \param srcIdx ... index into uniqueSrcValues
+    def get_src_frame(self, srcIdx):
+        srcRecords = [(records["frameNum"], np.full(len(records), msgID, dtype = np.uint8)) for (recordSrcIdx, msgID), records in self.recordStore.records.items() if(recordSrcIdx == srcIdx)]
+        frameNums = np.concatenate([frameNums for frameNums, _ in srcRecords] + [np.zeros(0, dtype = np.int64)])
+        msgIDs = np.concatenate([msgIDs for _, msgIDs in srcRecords] + [np.zeros(0, dtype = np.uint8)])
+        order = np.argsort(frameNums, kind = "stable")
+        return pd.DataFrame({"frameNum": frameNums[order], "messageID": msgIDs[order]})
+
+    ###----- get a cached data frame, built on its first access ----------------------
+    # the whole cache is dropped as soon as the version of the record store changed
+    #
+    # \param cacheKey ... key of the data frame, e.g. (msgID, srcIdx)
+    #
+    # \param build    ... function building the data frame
+    def get_cached_frame(self, cacheKey, build):
+        if(self.frameCacheVersion != self.recordStore.version):
+            self.frameCache = {}
+            self.frameCacheVersion = self.recordStore.version
+        if(cacheKey not in self.frameCache):
+            self.frameCache[cacheKey] = build()
+        return self.frameCache[cacheKey]
+
+    ###----- get the source of an entry of listSrcIdx ----------------------------
+    # \param msgID    ... integer messageId
+    #
+    # \param arrayIdx ... index into listSrcIdx[msgID]
+    def get_src_value(self, msgID, arrayIdx):
+        return self.uniqueSrcValues[self.listSrcIdx[msgID][arrayIdx]]
+###----------------------------------------------------------------------------
+
+
+###----- resumable index of pcap/pcapng packets -------------------------------
+# walks the record/block headers of a capture buffer without copying packet data
+# - keeps the file format, byte order, link types and frame number between calls,
+#   so a capture can be indexed piece by piece while it is still being written
+# - incomplete records at the end of the buffer are left for the next call
+class CaptureIndexer:
+
+    def __init__(self):
+        self.fileFormat = None
+        self.endian = "<"
+        self.linkType = None
+        self.linkTypes = []
+        self.tsResols = []
+        self.tsFactor = 1000
+        self.frameNum = 0
+
+    ###----- index the complete packets of a buffer ------------------------------
+    # returns (frameNums, offsets, capLens, linkTypes, frameTimes, pos)
+    # - offsets point to the first byte of the packet data within buf
+    # - frameTimes are the capture times in integer nanoseconds, 0 if not recorded (simple packet blocks)
+    # - pos is the position of the first record/block not yet indexed
+    #
+    # \param buf        ... bytes-like capture data, starting at a record/block border
+    #
+    # \param pos        ... position within buf to start at
+    #
+    # \param maxPackets ... maximum number of packets to index
+    def index(self, buf, pos, maxPackets):
+        offsets = array.array("q")
+        capLens = array.array("q")
+        linkTypeList = array.array("q")
+        frameTimes = array.array("q")
+
+        ### file format, only known after the file header was read
+        if(self.fileFormat == None):
+            if(len(buf) - pos < 24):
+                return self.to_arrays(offsets, capLens, linkTypeList, frameTimes) + (pos,)
+            magicLE = struct.unpack_from("<I", buf, pos)[0]
+            if(magicLE in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC) or struct.unpack_from(">I", buf, pos)[0] in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC)):
+                self.fileFormat = "pcap"
+                self.endian = "<" if(magicLE in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC)) else ">"
+                self.linkType = struct.unpack_from(self.endian + "I", buf, pos + 20)[0] & 0x0fffffff
+                self.tsFactor = 1 if(struct.unpack_from(self.endian + "I", buf, pos)[0] == PCAP_MAGIC_NSEC) else 1000
+                pos += 24
+            elif(magicLE == PCAPNG_BT_SHB):
+                self.fileFormat = "pcapng"
+            else:
+                raise ValueError("unknown capture file format")
+
+        ### classic pcap
+        if(self.fileFormat == "pcap"):
+            recordHeaderStruct = struct.Struct(self.endian + "IIII")
+            while(pos + 16 <= len(buf) and len(offsets) < maxPackets):
+                tsSec, tsFrac, inclLen, origLen = recordHeaderStruct.unpack_from(buf, pos)
+                if(pos + 16 + inclLen > len(buf)):
+                    break
+                offsets.append(pos + 16)
+                capLens.append(inclLen)
+                linkTypeList.append(self.linkType)
+                frameTimes.append(tsSec * NS_PER_S + tsFrac * self.tsFactor)
+                pos += 16 + inclLen
+
+        ### pcapng
+        else:
+            while(pos + 12 <= len(buf) and len(offsets) < maxPackets):
+                endian = self.endian
+                if(struct.unpack_from("<I", buf, pos)[0] == PCAPNG_BT_SHB):
+                    endian = "<" if(struct.unpack_from("<I", buf, pos + 8)[0] == PCAPNG_BYTE_ORDER_MAGIC) else ">"
+
+                blockType, blockLen = struct.unpack_from(endian + "II", buf, pos)
+                if(blockLen < 12):
+                    raise ValueError("invalid pcapng block length: " + str(blockLen))
+                if(pos + blockLen > len(buf)):
+                    break
+
+                if(blockType == PCAPNG_BT_SHB):
+                    self.endian = endian
+                    self.linkTypes = []
+                    self.tsResols = []
+                elif(blockType == PCAPNG_BT_IDB):
+                    self.linkTypes.append(struct.unpack_from(endian + "H", buf, pos + 8)[0])
+                    self.tsResols.append(parse_pcapng_tsresol(buf, pos + 16, pos + blockLen - 4, endian))
+                elif(blockType == PCAPNG_BT_EPB or blockType == PCAPNG_BT_PB):
+                    if(blockType == PCAPNG_BT_EPB):
+                        interfaceId = struct.unpack_from(endian + "I", buf, pos + 8)[0]
+                    else:
+                        interfaceId = struct.unpack_from(endian + "H", buf, pos + 8)[0]
+                    tsHigh, tsLow, capLen = struct.unpack_from(endian + "III", buf, pos + 12)
+                    offsets.append(pos + 28)
+                    capLens.append(capLen)
+                    linkTypeList.append(self.linkTypes[interfaceId])
+                    frameTimes.append(pcapng_ts_to_ns(tsHigh, tsLow, self.tsResols[interfaceId]))
+                elif(blockType == PCAPNG_BT_SPB):
+                    offsets.append(pos + 12)
+                    capLens.append(min(struct.unpack_from(endian + "I", buf, pos + 8)[0], blockLen - 16))
+                    linkTypeList.append(self.linkTypes[0])
+                    frameTimes.append(0)
+                pos += blockLen
+
+        return self.to_arrays(offsets, capLens, linkTypeList, frameTimes) + (pos,)
+
+    ###----- convert the collected entries into NumPy arrays, numbering the frames
+    def to_arrays(self, offsets, capLens, linkTypeList, frameTimes):
+        frameNums = np.arange(self.frameNum + 1, self.frameNum + len(offsets) + 1)
+        self.frameNum += len(offsets)
+        return (frameNums, np.frombuffer(offsets, dtype = np.int64), np.frombuffer(capLens, dtype = np.int64), np.frombuffer(linkTypeList, dtype = np.int64), np.frombuffer(frameTimes, dtype = np.int64))
+###----------------------------------------------------------------------------
+
+
+###----- running state of one source and message type ------------------------
+# used by the streaming analysis instead of a data frame holding every message
+# - memory usage is constant, independent of the number of messages
+# - intervals between consecutive timestamps are tracked as running mean/variance (Welford), min and max
+#
+# \param srcIdx ... index into uniqueSrcValues
+#
+# \param msgID  ... integer messageId
+class PtpStreamStats:
+
+    def __init__(self, srcIdx, msgID, intervalTolerance = INTERVAL_DEFAULT_TOLERANCE):
+        self.srcIdx = srcIdx
+        self.msgID = msgID
+        self.intervalTolerance = intervalTolerance
+        self.count = 0
+        self.logMP = None
+
+        ### first and last message, in nanoseconds
+        self.firstTS = None
+        self.lastTS = None
+        self.lastFrameNum = None
+
+        ### (frameNum, seqID, frameTime, logMP, ts) of the last message per seqID group, see get_seq_id_groups(), and the runs of irregular seqIDs found so far
+        self.lastSeqIDs = {}
+        self.seqIDRuns = []
+
+        ### seqIDs seen so far, needed for the avg interval
+        self.seqIDSeen = np.zeros(65536, dtype = bool)
+
+        ### running statistics of the intervals between capture times, in nanoseconds, see calc_intervals()
+        self.numIntervals = 0
+        self.meanInterval = 0.0
+        self.m2Interval = 0.0
+        self.minInterval = None
+        self.maxInterval = None
+        self.intervalLogHist = np.zeros(len(INTERVAL_LOG_EDGES) + 1, dtype = np.int64)
+        self.intervalHist = np.zeros(len(INTERVAL_HISTOGRAM_LABELS), dtype = np.int64)
+        self.intervalsBelow = 0
+        self.intervalsAbove = 0
+
+    ###----- standard deviation of the intervals --------------------------------
+    # population standard deviation, like calc_interval_stats()
+    def get_interval_std(self):
+        if(self.numIntervals < 1):
+            return 0.0
+        return (self.m2Interval / self.numIntervals) ** 0.5
+
+    ###----- estimated percentiles of the intervals -----------------------------
+    # taken from the logarithmic histogram, accurate to about 0.25 %
+    def get_interval_percentiles(self):
+        cumCounts = np.cumsum(self.intervalLogHist)
+        binIdx = np.searchsorted(cumCounts, np.array(INTERVAL_PERCENTILES) / 100.0 * self.numIntervals, side = "left")
+        # geometric center of every bin, the outer bins are represented by their inner edge
+        binEdges = np.concatenate(([INTERVAL_LOG_EDGES[0]], INTERVAL_LOG_EDGES, [INTERVAL_LOG_EDGES[-1]]))
+        return np.clip(np.sqrt(binEdges[binIdx] * binEdges[binIdx + 1]), self.minInterval, self.maxInterval)
+
+    ###----- avg interval as calculated by ptp_msg_type_specific_calcs() --------
+    def get_avg_interval(self):
+        return (self.lastTS - self.firstTS) // int(np.count_nonzero(self.seqIDSeen))
+###----------------------------------------------------------------------------
+
+
+###----- analyzer for PTP captures --------------------------------------------
+# reentrant entry point, every call of analyze() works on a fresh PtpAnalysisResult
+# - the tshark version is only checked once per analyzer
+#
+# \param singlePass ... decode the input file with a single tshark run
+#
+# \param decoder    ... decoder used to extract PTP messages, see DECODER_*
+#
+# \param tsharkJobs ... maximum number of concurrent tshark runs, None ... number of cores
+#
+# \param cacheDir      ... directory of the extraction cache, None ... no cache
+#
+# \param cacheMaxBytes ... size limit of the cache directory
+#
+# \param streaming     ... analyse the capture chunk by chunk with constant memory, uses the mmap decoder
+#
+# \param chunkPackets  ... number of packets decoded at once by the mmap decoder
+#
+# \param follow        ... follow a growing capture or read from stdin ("-"), implies streaming
+#
+# \param pollInterval  ... time between two reads of a growing capture without new data, in seconds
+#
+# \param idleTimeout   ... time without new data after which a growing capture is regarded as complete, in seconds
+#
+# \param intervalTolerance ... allowed relative deviation of an interval from the expected interval
+#
+# \param exportDir     ... directory the decoded messages and results are exported to, None ... no export
+#
+# \param exportFormat  ... format of the export, see EXPORT_FORMAT_*
+#
+# \param reportDir     ... directory the JSON/CSV report is written to, None ... no report
+#
+# \param quiet         ... print nothing, the warnings are collected for the report only
+#
+# \param warningLimit  ... warning records printed per warning type, 0 ... no limit
+#
+# \param warningDetail ... one warning record per message instead of aggregated ones, printed without limit
+#
+# \param profile       ... record time, memory, tshark launches and bytes read per stage, see PtpProfiler
+class PtpAnalyzer:
+
+    def __init__(self, singlePass = False, decoder = DECODER_TSHARK, tsharkJobs = None, cacheDir = None, cacheMaxBytes = CACHE_DEFAULT_MAX_BYTES, streaming = False, chunkPackets = MMAP_CHUNK_PACKETS,
+                 follow = False, pollInterval = FOLLOW_DEFAULT_POLL_INTERVAL, idleTimeout = FOLLOW_DEFAULT_IDLE_TIMEOUT, intervalTolerance = INTERVAL_DEFAULT_TOLERANCE,
+                 exportDir = None, exportFormat = EXPORT_FORMAT_NPZ, reportDir = None, quiet = False,
+                 warningLimit = WARNING_DEFAULT_PRINT_LIMIT, warningDetail = False, profile = False, contextSize = FLIGHT_DEFAULT_DEPTH):
+        self.singlePass = singlePass
+        self.decoder = decoder
+        self.tsharkJobs = tsharkJobs
+        self.cacheDir = cacheDir
+        self.cacheMaxBytes = cacheMaxBytes
+        self.streaming = streaming or follow
+        self.chunkPackets = chunkPackets
+        self.follow = follow
+        self.pollInterval = pollInterval
+        self.idleTimeout = idleTimeout
+        self.intervalTolerance = intervalTolerance
+        self.exportDir = exportDir
+        self.exportFormat = exportFormat
+        self.reportDir = reportDir
+        self.quiet = quiet
+        self.warningLimit = warningLimit
+        self.warningDetail = warningDetail
+        self.profile = profile
+        self.contextSize = contextSize
+        self.tsharkChecked = False
+
+        # fail before a capture is analysed, not afterwards
+        if(exportDir != None):
+            check_export_format(exportFormat)
+
+    ###----- analyse a single capture -------------------------------------------
+    # returns a PtpAnalysisResult, prints the warning and final overview
+    #
+    # \param inputFileName ... capture file to analyse
+    def analyze(self, inputFileName):
+        result = PtpAnalysisResult(inputFileName)
+        result.intervalTolerance = self.intervalTolerance
+        result.echo = (self.quiet == False)
+        result.warningLog.echo = result.echo
+        result.warningLog.printLimit = 0 if(self.warningDetail == True) else self.warningLimit
+        result.warningLog.aggregate = (self.warningDetail == False)
+        if(self.contextSize > 0):
+            result.warningLog.recorder = PtpFlightRecorder(result, self.contextSize)
+        if(self.profile == True):
+            result.profiler = PtpProfiler()
+
+        # a quiet analysis prints nothing, the warnings are only collected, see print_info()
+        self.run(result, inputFileName)
+
+        if(self.exportDir != None):
+            with profile_stage(result.profiler, "export"):
+                exportPath = export_result(result, self.exportDir, self.exportFormat)
+            if(self.quiet == False):
+                print("Exported to:", exportPath)
+        if(self.reportDir != None):
+            with profile_stage(result.profiler, "report"):
+                reportPath = write_report(result, self.reportDir)
+            if(self.quiet == False):
+                print("Report written to:", reportPath)
+
+        if(result.profiler is not None):
+            result.profiler.stop()
+            if(self.reportDir != None):
+                profilePath = write_profile(result, self.reportDir)
+                if(self.quiet == False):
+                    print("Profile written to:", profilePath)
+            if(self.quiet == False):
+                print_profile(result)
+        return result
+
+    ###----- decode a capture and run all checks --------------------------------
+    # \param result        ... fresh PtpAnalysisResult
+    #
+    # \param inputFileName ... capture file to analyse
+    def run(self, result, inputFileName):
+        ###----- streaming analysis ---------------------------------------------------
+        # warnings are printed while the capture is decoded, no data frames are kept
+        if(self.streaming == True):
+            with profile_stage(result.profiler, "stream"):
+                stream_ptp_data(self, result, inputFileName)
+            if(self.quiet == False):
+                with profile_stage(result.profiler, "overview"):
+                    print_final_overview(result)
+            return
+        ###----------------------------------------------------------------------------
+
+        with profile_stage(result.profiler, "extract"):
+            if(self.cacheDir == None):
+                extract_ptp_data(self, result, inputFileName)
+            else:
+                extract_ptp_data_cached(self, result, inputFileName)
+        with profile_stage(result.profiler, "calcs"):
+            run_ptp_calcs(result)
+
+        ###----- print warning overview -----------------------------------------------
+        with profile_stage(result.profiler, "warnings"):
+            print_warning_overview(result)
+        ###----------------------------------------------------------------------------
+
+        ###----- print final overview -------------------------------------------------
+        if(self.quiet == False):
+            with profile_stage(result.profiler, "overview"):
+                print_final_overview(result)
+        ###----------------------------------------------------------------------------
+###----------------------------------------------------------------------------
+
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Sub-Routines -------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+  
+###----- profile a stage of an analysis ----------------------------------------
+# returns a context manager, a no-op if the analysis is not profiled, see PtpProfiler.stage()
+#
+# \param profiler ... PtpProfiler of the analysis, e.g. result.profiler, None ... not profiled
+def profile_stage(profiler, name):
+    if(profiler is None):
+        return contextlib.nullcontext()
+    return profiler.stage(name)
+###----------------------------------------------------------------------------
+
+
+###----- print a line of the progress or warning output of an analysis ----------
+# nothing is printed for a quiet analysis, see PtpAnalysisResult.echo
+def print_info(result, *args):
+    if(result.echo == True):
+        print(*args)
+###----------------------------------------------------------------------------
+
+
+###----- count a tshark launch of an analysis -----------------------------------
+# \param profiler ... PtpProfiler of the analysis, None ... not profiled
+def count_tshark_launch(profiler):
+    if(profiler is not None):
+        profiler.count_tshark_launch()
+###----------------------------------------------------------------------------
+
+
+###----- count bytes read by an analysis ----------------------------------------
+# \param profiler ... PtpProfiler of the analysis, None ... not profiled
+def count_bytes_read(profiler, numBytes):
+    if(profiler is not None):
+        profiler.count_bytes_read(numBytes)
+###----------------------------------------------------------------------------
+
+
+###----- format an integer nanosecond value as seconds ------------------------
+# exact conversion for display purposes, e.g. 1862108783080400 -> "1862108.783080400"
+#
+# \param tsNs ... timestamp or time interval in nanoseconds
+def format_ts_ns(tsNs):
+    tsNs = int(tsNs)
+    sign = "-" if(tsNs < 0) else ""
+    tsS, tsFrac = divmod(abs(tsNs), NS_PER_S)
+    return sign + str(tsS) + "." + str(tsFrac).zfill(9)
+###----------------------------------------------------------------------------
+
+
+###----- print a warning record ---------------------------------------------
+# prints a record collected by PtpWarningLog.add(), the layout depends on the warning type
+# - zero timestamps are only counted, not printed
+#
+# \param record    ... dict holding "type", "count", "msgType", "srcIdx", "frameNum", "frameNumEnd" and type specific details
+#
+# \param srcValues ... list of unique source addresses, indexed by srcIdx
+def print_warning_record(record, srcValues):
+    wType = record["type"]
+    if(wType == "Zero"):
+        # not printed, see PtpWarningLog.emit()
+        pass
+    elif(wType == "Negative"):
+        print("-----")
+        print("warning:   negative timestamp")
+        if(record["count"] > 1):
+            print("- frameNum: ", record["frameNum"], "->", record["frameNumEnd"])
+            print("- messages: ", record["count"])
+        else:
+            print("- frameNum: ", record["frameNum"])
+        print("- ts:       ", format_ts_ns(record["ts"]))
+    elif(wType == "Backwards"):
+        print("-----")
+        print("warning:   current timestamp smaller than following")
+        print("- frameNum: ", record["frameNum"], "->", record["frameNumEnd"])
+        if(record["count"] > 1):
+            print("- steps:    ", record["count"])
+        print("- ts:       ", format_ts_ns(record["ts"]), "->", format_ts_ns(record["tsEnd"]))
+    elif(wType == "SeqID"):
+        print("")
+        print("Irregular " + record["msgType"] + " seqID:", record["count"], record["kind"] + "(s)")
+        print("- src =", srcValues[record["srcIdx"]])
+        if(record.get("requester") is not None):
+            print("- requester =", record["requester"])
+        print("- frameNum =", record["frameNum"], "-> frameNum =", record["frameNumEnd"])
+        print("- seqID =", record["seqID"], "-> seqID =", record["seqIDEnd"])
+        if(record["kind"] == SEQ_KIND_GAP):
+            print("- missing =", record["missing"])
+    elif(wType == "LogMP"):
+        print("")
+        print("Unexpected " + record["msgType"] + " logMP:", record["logMP"])
+        print("- src =", srcValues[record["srcIdx"]])
+        if(record.get("requester") is not None):
+            print("- requester =", record["requester"])
+        print("- frameNum =", record["frameNum"], "-> frameNum =", record["frameNumEnd"])
+        print("- messages =", record["messages"])
+    elif(wType == "CntMismatch"):
+        print("")
+        print("Missing " + record["missing"] + " Msg:")
+        print("- Cnt DlyReq:  ", record["cntDlyReq"])
+        print("- Cnt DlyResp: ", record["cntDlyResp"])
+    elif(wType == "Unmatched"):
+        print("")
+        print("Unmatched " + record["msgType"] + " Msg:")
+        if(record["count"] > 1):
+            print("- frameNum =", record["frameNum"], "-> frameNum =", record["frameNumEnd"])
+            print("- seqID =", record["seqID"], "-> seqID =", record["seqIDEnd"])
+            print("- messages =", record["count"])
+        else:
+            print("- frameNum =", record["frameNum"])
+            print("- seqID =", record["seqID"])
+        print("- portIdentity =", record["portIdentity"])
+        print("- src =", srcValues[record["srcIdx"]])
+    elif(wType == "Late"):
+        print("")
+        print("Late " + record["msgType"] + " Msg:")
+        print("- frameNum =", record["frameNum"], "-> frameNum =", record["frameNumEnd"])
+        if(record["count"] > 1):
+            print("- seqID =", record["seqID"], "-> seqID =", record["seqIDEnd"])
+            print("- pairs =", record["count"])
+        else:
+            print("- seqID =", record["seqID"])
+        print("- latency =", format_ts_ns(record["latency"]), "s")
+    else:
+        print("unknown warning type:", wType)
+###----------------------------------------------------------------------------
+
+
+
+###----- check for a number of potential reasons to print warnings ------------
+# every anomaly is added to the given warning log, see PtpWarningLog
+# - all checks are done with vectorized column operations, no per-row loop
+# returns a dict holding the indices of all anomalies found, per warning type
+# - WTYPE_ZERO_TS      ... indices of zero timestamps
+# - WTYPE_NEGATIVE_TS  ... indices of negative timestamps
+# - WTYPE_BACKWARDS_TS ... indices idx with ts[idx] > ts[idx+1]
+#
+# \param df         ... PtpRecordView (or data frame) that holds ["frameNum", "ts"]
+#
+# \param warningLog ... PtpWarningLog of the result
+def check_ts(df, warningLog):
+    frameNums = np.asarray(df["frameNum"])
+    ts = np.asarray(df["ts"])
+
+    anomalies = {WTYPE_ZERO_TS:      np.flatnonzero(ts == 0),
+                 WTYPE_NEGATIVE_TS:  np.flatnonzero(ts < 0),
+                 WTYPE_BACKWARDS_TS: np.flatnonzero(ts[:-1] > ts[1:])}
+
+    ### zero ts
+    # TODO maybe add extra option to print these warnings or not
+    idx = anomalies[WTYPE_ZERO_TS]
+    warningLog.add_indexed("Zero", idx, frameNums[idx])
+
+    ### negative ts
+    idx = anomalies[WTYPE_NEGATIVE_TS]
+    warningLog.add_indexed("Negative", idx, frameNums[idx], ts = ts[idx].tolist())
+
+    ### backwards ts between two consecutive PTP messages
+    idx = anomalies[WTYPE_BACKWARDS_TS]
+    warningLog.add_indexed("Backwards", idx, frameNums[idx], frameNums[idx+1], ts = ts[idx].tolist(), tsEnd = ts[idx+1].tolist())
+
+    warningLog.flush()
+    return anomalies
+###----------------------------------------------------------------------------
+
+
+
+###----- run-length analysis of sequence IDs -----------------------------------
+# every step between two consecutive messages of a group is classified, 65535 -> 0 is a regular step
+# - step 1                                   ... regular
+# - step 0                                   ... duplicate, unless both messages hold the same ts, i.e. the same message captured twice, e.g. at a mirror port
+# - step 2 .. PTP_SEQ_ID_WRAP_THRESHOLD - 1 ... gap, step - 1 seqIDs are missing
+# - any other step                           ... reorder, the seqID stepped back
+# consecutive irregular steps of the same kind and group form one run, a regular step in between ends it
+# returns a data frame holding one row per run, with the columns SEQ_RUN_COLUMNS
+# - group                 ... group label, None if no groups are given
+# - kind                  ... SEQ_KIND_DUPLICATE, SEQ_KIND_GAP or SEQ_KIND_REORDER
+# - count                 ... number of irregular steps within the run
+# - missing               ... number of missing seqIDs, only non-zero for gaps
+# - frameNum, seqID       ... message before the first irregular step of the run
+# - frameNumEnd, seqIDEnd ... message after the last irregular step of the run
+#
+# \param frameNums ... frame numbers, in order of appearance
+#
+# \param seqIDs    ... seqIDs, messages without seqID are skipped
+#
+# \param groups    ... None or one label per message, e.g. a pd.MultiIndex, seqIDs are analysed per group
+#
+# \param ts        ... None or PTP timestamp per message, to tell re-captures from duplicates, e.g. None for message types without timestamps
+def analyze_seq_ids(frameNums, seqIDs, groups = None, ts = None):
+    seqIDs = np.asarray(seqIDs, dtype = np.float64)
+    validIdx = np.flatnonzero(~np.isnan(seqIDs))
+    frameNums = np.asarray(frameNums)[validIdx]
+    seqIDs = seqIDs[validIdx].astype(np.int64)
+    ts = None if(ts is None) else np.asarray(ts)[validIdx]
+    if(groups is None):
+        groupCodes = np.zeros(len(seqIDs), dtype = np.int64)
+        groupLabels = [None]
+    else:
+        groupCodes, groupLabels = pd.factorize(groups[validIdx])
+        # stable, so every group keeps its order of appearance
+        order = np.argsort(groupCodes, kind = "stable")
+        frameNums, seqIDs, groupCodes = frameNums[order], seqIDs[order], groupCodes[order]
+        ts = None if(ts is None) else ts[order]
+
+    steps = (seqIDs[1:] - seqIDs[:-1]) % SEQ_ID_RANGE
+    kindCodes = np.select([steps == 0, (steps > 1) & (steps < PTP_SEQ_ID_WRAP_THRESHOLD), steps >= PTP_SEQ_ID_WRAP_THRESHOLD], [1, 2, 3], 0)
+    kindCodes[groupCodes[1:] != groupCodes[:-1]] = 0
+    if(ts is not None):
+        kindCodes[(steps == 0) & (ts[1:] == ts[:-1])] = 0
+
+    ### merge irregular steps into runs
+    stepIdx = np.flatnonzero(kindCodes)
+    stepKinds = kindCodes[stepIdx]
+    stepGroups = groupCodes[stepIdx]
+    runStart = np.ones(len(stepIdx), dtype = bool)
+    runStart[1:] = (stepKinds[1:] != stepKinds[:-1]) | (stepGroups[1:] != stepGroups[:-1]) | (stepIdx[1:] != stepIdx[:-1] + 1)
+    runEnd = np.ones(len(stepIdx), dtype = bool)
+    runEnd[:-1] = runStart[1:]
+    startPos = np.flatnonzero(runStart)
+    endPos = np.flatnonzero(runEnd)
+    missing = np.where(stepKinds == 2, steps[stepIdx] - 1, 0)
+
+    return pd.DataFrame({"group":       [groupLabels[groupCode] for groupCode in stepGroups[startPos]],
+                         "kind":        np.array(SEQ_KIND_NAMES, dtype = object)[stepKinds[startPos]],
+                         "count":       endPos - startPos + 1,
+                         "missing":     np.add.reduceat(missing, startPos) if(len(startPos) > 0) else np.zeros(0, dtype = np.int64),
+                         "frameNum":    frameNums[stepIdx[startPos]],
+                         "seqID":       seqIDs[stepIdx[startPos]],
+                         "frameNumEnd": frameNums[stepIdx[endPos] + 1],
+                         "seqIDEnd":    seqIDs[stepIdx[endPos] + 1]}, columns = SEQ_RUN_COLUMNS)
+###----------------------------------------------------------------------------
+
+
+###----- groups of a message type seqIDs are analysed by ----------------------
+# DlyResp messages echo the seqID of the DlyReq they answer, so they are analysed per requesting port identity
+# returns None for all other message types
+#
+# \param data  ... PtpRecordView, data frame or structured array holding the messages of a single source and message type
+#
+# \param msgID ... integer messageId
+def get_seq_id_groups(data, msgID):
+    if(msgID != PTP_MTYPE_DELAY_RESP):
+        return None
+    return pd.MultiIndex.from_arrays([np.asarray(data["reqClockId"]), np.asarray(data["reqPortId"])])
+###----------------------------------------------------------------------------
+
+
+###----- check for irregular sequence IDs -------------------------------------
+# prints one warning per run of irregular seqIDs and counts every irregular step, see analyze_seq_ids()
+# returns the data frame of runs
+#
+# \param df         ... PtpRecordView (or data frame, dict of arrays) that holds ["frameNum", "seqID"] and "ts" for message types holding timestamps
+#
+# \param warningLog ... PtpWarningLog of the result
+#
+# \param groups     ... None or one label per message, see get_seq_id_groups()
+#
+# \param msgID      ... integer messageId, re-captures are only told from duplicates for message types holding timestamps, see analyze_seq_ids()
+#
+# \param continued  ... True ... the runs may continue the open records of a previous chunk, used by the streaming analysis,
+#                               the frame numbers stand in for the message indices, a run starting at the frameNumEnd of an open record continues it
+def check_seq_id(df, warningLog, groups = None, msgID = None, continued = False):
+    seqIDRuns = analyze_seq_ids(df["frameNum"], df["seqID"], groups, df["ts"] if(msgID in PTP_TS_FIELDS) else None)
+
+    for seqIDRun in seqIDRuns.itertuples():
+        msgIdx = seqIDRun.frameNum if(continued == True) else None
+        msgIdxEnd = seqIDRun.frameNumEnd - 1 if(continued == True) else None
+        warningLog.add("SeqID", seqIDRun.count, seqIDRun.frameNum, seqIDRun.frameNumEnd, msgIdx, msgIdxEnd,
+                       kind = seqIDRun.kind, seqID = int(seqIDRun.seqID), seqIDEnd = int(seqIDRun.seqIDEnd), missing = int(seqIDRun.missing),
+                       requester = None if(seqIDRun.group is None) else format_port_identity(*seqIDRun.group))
+
+    return seqIDRuns
+###----------------------------------------------------------------------------
+
+
+###----- keep the seqID runs of a source and message type ---------------------
+# \param msgID     ... integer messageId
+#
+# \param srcIdx    ... index into uniqueSrcValues
+#
+# \param seqIDRuns ... data frame created by analyze_seq_ids()
+def append_seq_id_runs(result, msgID, srcIdx, seqIDRuns):
+    if(len(seqIDRuns) == 0):
+        return
+    seqIDRuns = seqIDRuns.assign(messageId = msgID, srcIdx = srcIdx)[result.seqIDRunsDF.columns]
+    if(len(result.seqIDRunsDF) == 0):
+        result.seqIDRunsDF = seqIDRuns.reset_index(drop = True)
+    else:
+        result.seqIDRunsDF = pd.concat([result.seqIDRunsDF, seqIDRuns], ignore_index = True)
+###----------------------------------------------------------------------------
+
+
+###----- merge the seqID runs of consecutive chunks ----------------------------
+# a run crossing a chunk border is found as two runs, the second one starting at the message the first one ends with
+# returns a single data frame like analyze_seq_ids()
+#
+# \param seqIDRunsList ... data frames created by analyze_seq_ids(), one per chunk, in order of the chunks
+def merge_seq_id_runs(seqIDRunsList):
+    mergedRuns = []
+    lastRunIdx = {}
+    for seqIDRun in [run for seqIDRuns in seqIDRunsList for run in seqIDRuns.to_dict("records")]:
+        runKey = (seqIDRun["group"], seqIDRun["kind"])
+        lastRun = mergedRuns[lastRunIdx[runKey]] if(runKey in lastRunIdx) else None
+        if(lastRun is not None and lastRun["frameNumEnd"] == seqIDRun["frameNum"]):
+            lastRun["count"] += seqIDRun["count"]
+            lastRun["missing"] += seqIDRun["missing"]
+            lastRun["frameNumEnd"] = seqIDRun["frameNumEnd"]
+            lastRun["seqIDEnd"] = seqIDRun["seqIDEnd"]
+            continue
+        lastRunIdx[runKey] = len(mergedRuns)
+        mergedRuns.append(seqIDRun)
+    return pd.DataFrame(mergedRuns, columns = SEQ_RUN_COLUMNS)
+###----------------------------------------------------------------------------
+
+
+###----- compare number of DlyReq and DlyResp messages -------------------------
+# \param ptpMsgType ... PTP_MTYPE_DELAY_REQ  ... warn about missing DlyReq messages
+#                       PTP_MTYPE_DELAY_RESP ... warn about missing DlyResp messages
+def check_dly_cnt_mismatch(result, ptpMsgType):
+    cntDlyReq = result.msgCountDF["DlyReq"][result.msgCountDF["DlyReq"].last_valid_index()]
+    cntDlyResp = result.msgCountDF["DlyResp"][result.msgCountDF["DlyResp"].last_valid_index()]
+
+    if(ptpMsgType == PTP_MTYPE_DELAY_REQ and cntDlyReq < cntDlyResp):
+        result.warningLog.add("CntMismatch", missing = "DlyReq", cntDlyReq = int(cntDlyReq), cntDlyResp = int(cntDlyResp))
+    elif(ptpMsgType == PTP_MTYPE_DELAY_RESP and cntDlyReq > cntDlyResp):
+        result.warningLog.add("CntMismatch", missing = "DlyResp", cntDlyReq = int(cntDlyReq), cntDlyResp = int(cntDlyResp))
+###----------------------------------------------------------------------------
+
+
+###----- format a PTP port identity -------------------------------------------
+# clock identities are hex strings for the tshark/native decoders and integers for the mmap decoder
+def format_port_identity(clockId, portId):
+    if(isinstance(clockId, str) == False):
+        clockId = "0x%016x" % int(clockId)
+    return str(clockId) + "-" + str(portId)
+###----------------------------------------------------------------------------
+
+
+###----- check paired messages for unmatched and late ones --------------------
+# every unmatched or late message is added to the warning log of the result with its frame number
+# returns the indices of unmatched requests, unmatched responses and late pairs within pairDF
+#
+# \param pairDF      ... data frame created by pair_ptp_messages()
+#
+# \param reqName     ... name of the request message type, e.g. "Sync"
+#
+# \param respName    ... name of the response message type, e.g. "FollowUp"
+#
+# \param lateLatency ... responses captured later than this after their request are late, in nanoseconds
+def check_ptp_pairs(result, pairDF, reqName, respName, lateLatency):
+    pairState = pairDF["pairState"].to_numpy()
+    unmatchedReqIdx = np.flatnonzero(pairState == "left_only")
+    unmatchedRespIdx = np.flatnonzero(pairState == "right_only")
+    lateIdx = np.flatnonzero((pairState == "both") & (pairDF["latency"].to_numpy() > lateLatency))
+
+    ### unmatched and late messages are aggregated per source, consecutive rows of pairDF form one record
+    seqIDs = pairDF["seqID"].to_numpy()
+    for side, msgName, unmatchedIdx in (("Req", reqName, unmatchedReqIdx), ("Resp", respName, unmatchedRespIdx)):
+        srcIdxs = pairDF["srcIdx" + side].to_numpy()
+        for srcIdx in pd.unique(srcIdxs[unmatchedIdx]):
+            result.warningLog.set_source(None, srcIdx)
+            idx = unmatchedIdx[srcIdxs[unmatchedIdx] == srcIdx]
+            result.warningLog.add_indexed("Unmatched", idx, pairDF["frameNum" + side].to_numpy()[idx], msgType = msgName, seqID = seqIDs[idx].tolist(), seqIDEnd = seqIDs[idx].tolist(),
+                                          portIdentity = [format_port_identity(pairDF["clockId"].iat[itemIdx], pairDF["portId"].iat[itemIdx]) for itemIdx in idx])
+
+    srcIdxs = pairDF["srcIdxResp"].to_numpy()
+    for srcIdx in pd.unique(srcIdxs[lateIdx]):
+        result.warningLog.set_source(None, srcIdx)
+        idx = lateIdx[srcIdxs[lateIdx] == srcIdx]
+        result.warningLog.add_indexed("Late", idx, pairDF["frameNumReq"].to_numpy()[idx], pairDF["frameNumResp"].to_numpy()[idx], msgType = respName,
+                                      seqID = seqIDs[idx].tolist(), seqIDEnd = seqIDs[idx].tolist(), latency = pairDF["latency"].to_numpy()[idx].tolist())
+
+    result.warningLog.set_source(None, None)
+    result.warningLog.flush()
+    return unmatchedReqIdx, unmatchedRespIdx, lateIdx
+###----------------------------------------------------------------------------
+
+
+
+###----- invoking tshark with a set of arguments ------------------------------
+# function to invoke tshark with a given list of arguments
+# - every option given in argList must be part of tsharkValidArgList, values follow their option as separate entries
+# - tshark is run without a shell, its output is captured via a pipe and returned as a string
+#
+# \param profiler ... PtpProfiler counting the launch and the output read, None ... not profiled
+def invoke_tshark(argList, profiler = None):
+  
+  # check given args, build the command to run
+  tsharkCmd = build_tshark_cmd(argList)
+  
+  # invoke tshark with created command, return what was written to stdout
+  count_tshark_launch(profiler)
+  try:
+    process = subprocess.run(tsharkCmd,
+                             check = True,
+                             stdout = subprocess.PIPE,
+                             universal_newlines = True)
+  except subprocess.CalledProcessError as err:
+    raise ValueError("error running tshark, returncode: " + str(err.returncode))
+  except FileNotFoundError:
+    raise ValueError("error running tshark: tshark not found")
+  
+  count_bytes_read(profiler, len(process.stdout))
+  return process.stdout
+###----------------------------------------------------------------------------
+
+
+
+###----- check arguments used to invoke tshark --------------------------------
+# returns the command list to pass to subprocess
+#
+# \param argList ... list of tshark arguments, e.g. ["-r", inputFileName, "-Y", "ptp", "-T", "fields", "-e", "frame.number"]
+def build_tshark_cmd(argList):
+  
+  ### check length of given argList
+  # len  < 0 ... should never happen
+  # len == 0 ... invalid
+  # len >= 1 ... check for valid args
+  if(len(argList) == 0):
+    raise ValueError("invalid argList: no args")
+  
+  # every entry starting with "-" is an option, it must be a valid one
+  for arg in argList:
+    if(arg.startswith("-") and arg not in tsharkValidArgList):
+      raise ValueError("invalid tshark argument: " + arg)
+  
+  return ["tshark"] + list(argList)
+###----------------------------------------------------------------------------
+
+
+
+###----- convert frame.time_epoch to integer nanoseconds ---------------------
+# frame.time_epoch is read as text, e.g. "1641900000.123456789", a float would lose the nanoseconds
+# - missing values are treated as zero
+#
+# \param epochStrings ... series of frame.time_epoch values
+def epoch_to_ns(epochStrings):
+    if(len(epochStrings) == 0):
+        return pd.Series([], index = epochStrings.index, dtype = "int64")
+
+    epochParts = epochStrings.fillna("0").astype(str).str.split(".", n = 1, expand = True)
+    epochNs = epochParts[0].astype("int64") * NS_PER_S
+    if(1 in epochParts.columns):
+        epochNs += epochParts[1].fillna("0").str.ljust(9, "0").str[0:9].astype("int64")
+    return epochNs
+###----------------------------------------------------------------------------
+
+
+###----- port identity and capture time columns of a message type ------------
+# returns the subset of PTP_ID_COLUMNS kept for the data frames of the given message type
+#
+# \param msgID ... integer messageId
+def get_ptp_id_columns(msgID):
+    if(msgID == PTP_MTYPE_DELAY_RESP):
+        return PTP_ID_COLUMNS
+    return ["frameTime", "clockId", "portId"]
+###----------------------------------------------------------------------------
+
+
+###----- read tshark fields output into a data frame --------------------------
+# invoke tshark with a given list of arguments (-T fields expected) and stream its output
+# through a pipe straight into pd.read_csv, no intermediate .txt file is written
+# - returns an empty data frame holding the given columns if tshark found no matching packets
+#
+# \param argList  ... list of tshark arguments, see build_tshark_cmd()
+#
+# \param colNames ... names of the data frame columns, one per "-e" field
+#
+# \param colTypes ... optional dict of column types passed to pd.read_csv, e.g. to read frame.time_epoch as text
+#
+# \param profiler ... PtpProfiler counting the launch and the output read, None ... not profiled
+def read_tshark_fields(argList, colNames, colTypes = None, profiler = None):
+  
+  tsharkCmd = build_tshark_cmd(argList)
+  
+  count_tshark_launch(profiler)
+  try:
+    process = subprocess.Popen(tsharkCmd,
+                               stdout = subprocess.PIPE,
+                               universal_newlines = True,
+                               encoding = "utf-8")
+  except FileNotFoundError:
+    raise ValueError("error running tshark: tshark not found")
+  
+  try:
+    fieldData = pd.read_csv(process.stdout if(profiler is None) else PtpCountingReader(process.stdout, profiler),
+                            sep = "\t",
+                            header = None,
+                            keep_default_na = True,
+                            names = colNames,
+                            dtype = colTypes)
+  except pd.errors.EmptyDataError:
+    fieldData = pd.DataFrame(columns = colNames)
+  finally:
+    process.stdout.close()
+    returnCode = process.wait()
+  
+  if(returnCode != 0):
+    raise ValueError("error running tshark, returncode: " + str(returnCode))
+  
+  return fieldData
+###----------------------------------------------------------------------------
+
+
+###----- read several tshark fields outputs concurrently ---------------------
+# the tshark runs are independent of each other, they are launched from a bounded thread pool
+# - the threads mostly wait for the tshark processes, so every run gets its own core
+# - returns a dict holding the data frame of every job, using the same keys as the given dict
+#
+# \param tsharkJobs ... dict of (argList, colNames, colTypes) tuples, see read_tshark_fields()
+#
+# \param maxWorkers ... maximum number of concurrent tshark runs, None ... number of cores
+#
+# \param profiler   ... PtpProfiler counting the launches and the output read, None ... not profiled
+def read_tshark_fields_concurrent(tsharkJobs, maxWorkers = None, profiler = None):
+  if(maxWorkers == None):
+    maxWorkers = os.cpu_count() or 1
+  
+  fieldData = {}
+  with concurrent.futures.ThreadPoolExecutor(max_workers = maxWorkers) as executor:
+    futures = {key: executor.submit(read_tshark_fields, argList, colNames, colTypes, profiler) for key, (argList, colNames, colTypes) in tsharkJobs.items()}
+    for key in tsharkJobs:
+      fieldData[key] = futures[key].result()
+  
+  return fieldData
+###----------------------------------------------------------------------------
+
+
+
+###----- check the installed tshark version -----------------------------------
+# function to discern installed version of tshark/wireshark
+# needed because of version specific differences such as
+# --- different names for tshark fields, e.g. ptp.v2.messageid VS ptp.v2.messagetype
+# --- different formatting of values of certain fields, e.g. hex-formatting VS strings
+def check_tshark_version(profiler = None):
+    ### string to represent name of field to identify PTP message types, dependant on installed wireshark/tshark version
+    global msgIdentifierUsed
+    
+    ### run version cmd, read the first line of its output
+    vLine = invoke_tshark(["--version"], profiler).partition("\n")[0]
+    
+    if("TShark (Wireshark) " in vLine):
+        ### get part of string containing version number
+        vNumString = vLine.split()[2] # TODO check if this is applicable to different wireshark/tshark versions
+        
+        ### split version string
+        vNumString = vNumString.replace(".", " ").split()
+        
+        ### check length of version string
+        if(len(vNumString) < 2):
+            raise ValueError("invalid version string:", vNumString)
+        elif(len(vNumString) == 3):
+            ### extract major/minor/sub as integers
+            vMajor = int(vNumString[0])
+            vMinor = int(vNumString[1])
+            vSub = int(vNumString[2])
+        else:
+            raise ValueError("invalid version string:", vNumString)
+        
+        ### check for version between 1.0.0 and 3.4.13
+        if((vMajor >= 1 and vMajor <= 3) and (vMinor >= 0 and vMinor <= 4) and (vSub >= 0 and vSub <= 13)):
+            msgIdentifierUsed = "ptp.v2.messageid"
+        ### check for version between 3.6.0 and 3.6.3
+        elif( (vMajor == 3) and (vMinor == 6) and (vSub >= 0 and vSub <= 3)):
+            msgIdentifierUsed = "ptp.v2.messagetype"
+        else:
+            raise ValueError("no valid tshark version found")
+    else:
+        raise ValueError("problem discerning tshark version")
+###----------------------------------------------------------------------------
+
+
+
+###----- determine Layer2/IPv4/IPv6 -------------------------------------------        
+# invoke tshark to analyse field eth.type
+# create pandas dataframe for processing
+# check dataframe for eligible ptp messages
+# check value of field eth.type, set the String ethTypeUsed for further operations
+def determine_eth_type(result, inputFileName):
+    
+    vData = read_tshark_fields(["-Y", "ptp", "-T", "fields", "-2", "-r", inputFileName, "-e", "eth.type"], ["ethType"], profiler = result.profiler)
+    
+    if(vData.empty == True):
+        raise ValueError("no eligible PTP messages found within:" + inputFileName)
+    else:
+        ### check IPvX version of first PTP message
+        # print(vData["ethType"][vData.first_valid_index()])
+        ethTypeString = str(vData["ethType"][vData.first_valid_index()])
+        
+        if(ethTypeString.find("0800") != -1):
+            result.ethTypeUsed = "ip.src"
+        elif(ethTypeString.find("86dd") != -1):
+            result.ethTypeUsed = "ipv6.src"
+        elif(ethTypeString.find("8100") != -1):
+            result.ethTypeUsed = "eth.src"
+        else:
+            raise ValueError("no valid eth.type found within:" + str(vData["ethType"][vData.first_valid_index]))
+###----------------------------------------------------------------------------
+
+
+###----- identifying unique source-IPs ----------------------------------------
+# TODO add check whether or not ALL PTP messages are of same ethType
+# - read all data from tshark output
+# - store ip.src values in data frame ... srcData
+# - store unique values for ip.src in ... uniqueSrcValues
+def identify_ptp_sources(result, inputFileName):
+    
+    # invoke tshark to check for sources of PTP messages, create pandas data frame from its output
+    tsharkInvokeList = ["-Y", "ptp and not icmp", "-T", "fields", "-2", "-r", inputFileName, "-E", "occurrence=f", "-e", result.ethTypeUsed]
+    srcData = read_tshark_fields(tsharkInvokeList, ["srcVal"], profiler = result.profiler)
+        
+    # get unique values from created pandas data frame, store in list
+    result.uniqueSrcValues = pd.unique(srcData["srcVal"])
+    print_info(result, "Unique Src Values: ", result.uniqueSrcValues)
+###----------------------------------------------------------------------------
+
+
+###----- create separate data frames for unique source-IPs --------------------
+# invoke tshark for every unique ip.src found
+# generate separate data frames for unique ip.src values, returns them as list ... srcsList[]
+#
+# \param maxWorkers ... maximum number of concurrent tshark runs, None ... number of cores
+def create_ptp_source_data_frames(result, inputFileName, maxWorkers = None):
+    
+    # invoke tshark per source concurrently, append the created data frames to list srcsList
+    tsharkJobs = {}
+    for idx in range(len(result.uniqueSrcValues)):
+        tsharkInvokeList = ["-r", inputFileName, "-Y", "ptp and " + result.ethTypeUsed + "==" + result.uniqueSrcValues[idx], "-T", "fields", "-2", "-e", "frame.number", "-e", msgIdentifierUsed]
+        tsharkJobs[idx] = (tsharkInvokeList, ["frameNum", "messageID"], None)
+    
+    srcData = read_tshark_fields_concurrent(tsharkJobs, maxWorkers, result.profiler)
+    return [srcData[idx] for idx in range(len(result.uniqueSrcValues))]
+###----------------------------------------------------------------------------
+
+
+###----- set flag for a found PTP message type -------------------------------
+# \param msgID ... integer messageId of a found PTP message
+def set_ptp_msg_flag(result, msgID):
+
+    if(msgID == PTP_MTYPE_SYNC):
+        result.msgFlagSync = True
+    elif(msgID == PTP_MTYPE_DELAY_REQ):
+        result.msgFlagDlyReq = True
+    elif(msgID == PTP_MTYPE_FOLLOW_UP):
+        result.msgFlagFollUp = True
+    elif(msgID == PTP_MTYPE_DELAY_RESP):
+        result.msgFlagDlyResp = True
+    elif(msgID == PTP_MTYPE_ANNOUNCE):
+        result.msgFlagAnn = True
+    elif(msgID == PTP_MTYPE_SIGNALLING):
+        result.msgFlagSig = True
+    elif(msgID == PTP_MTYPE_MANAGEMENT):
+        result.msgFlagMan = True
+###----------------------------------------------------------------------------
+
+
+###----- identifying unique PTP message IDs -----------------------------------
+# read data from srcsList[]
+# identify unique message IDs for identified srcVal in previously created srcsList
+# store unique message IDs in list ... uniqueMsgIDs
+# FIXME problem with version specific formatting of field <msgIdentifierUsed>
+# - old versions (eg 3.2.3) ... ptp.v2.messageid=1
+# - new versions (eg 3.6.3) ... ptp.v2.messagetype=0x01
+#
+# \param srcsList ... list of data frames holding frameNum and messageID per source, see create_ptp_source_data_frames()
+def identify_ptp_msg_types(result, srcsList):
+    # find and store unique message IDs
+    for idx in range(len(srcsList)):
+        # object array, IDs are converted to integers in place below
+        result.uniqueMsgIDs.append(pd.unique(srcsList[idx]["messageID"]).astype(object))
+        # print("result.uniqueMsgIDs, srcsList[" + str(idx) + "]: ", result.uniqueMsgIDs)
+
+    # check what PTP message types were found
+    for arrayIdx in range(len(srcsList)):
+        for itemIdx in range(len(result.uniqueMsgIDs[arrayIdx])):
+
+            # FIXME problem with version specific formatting of field <msgIdentifierUsed>
+            # - old versions (eg 3.2.3) ... ptp.v2.messageid=1
+            # - new versions (eg 3.6.3) ... ptp.v2.messagetype=0x01
+            # converting "0x0X" string to integer
+            tempID = int(result.uniqueMsgIDs[arrayIdx][itemIdx], 16)
+            result.uniqueMsgIDs[arrayIdx][itemIdx] = tempID
+            # result.uniqueMsgIDs[arrayIdx][itemIdx] = int(result.uniqueMsgIDs[arrayIdx][itemIdx], 16) # doing conversion in one line
+
+            set_ptp_msg_flag(result, result.uniqueMsgIDs[arrayIdx][itemIdx])
+
+    # print result.uniqueMsgIDs as a whole
+    print_info(result, "Unique Msg IDs: ", [msgIDs.tolist() for msgIDs in result.uniqueMsgIDs])
+###----------------------------------------------------------------------------
+
+
+###----- get further information according to message type --------------------
+# iterate through array of uniqueSrcValues and uniqueMsgIDs respectively to read the tshark output for further processing
+# add fields to tsharkInvokeList dependant on the identified PTP message type
+# returns a dict holding one data frame per (arrayIdx, messageId)
+#
+# \param maxWorkers ... maximum number of concurrent tshark runs, None ... number of cores
+def get_further_information(result, inputFileName, maxWorkers = None):
+    tsharkJobs = {}
+
+    for arrayIdx in range(len(result.uniqueSrcValues)):
+        for itemIdx in range(len(result.uniqueMsgIDs[arrayIdx])):
+            msgID = result.uniqueMsgIDs[arrayIdx][itemIdx]
+            tsharkInvokeList = ["-r", inputFileName, "-Y", "ptp and " + msgIdentifierUsed + "==" + str(msgID) + " and " + result.ethTypeUsed + "==" + str(result.uniqueSrcValues[arrayIdx]), "-T", "fields", "-2"]
+            
+            if(msgID in PTP_TS_FIELDS):
+                idColumns = get_ptp_id_columns(msgID)
+                fieldList = ["frame.number", msgIdentifierUsed, "ptp.v2.flags", "ptp.v2.sequenceid", "ptp.v2.logmessageperiod", PTP_TS_FIELDS[msgID][0], PTP_TS_FIELDS[msgID][1]] + [PTP_ID_FIELD_LIST[PTP_ID_COLUMNS.index(col)] for col in idColumns]
+                colNames = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"] + idColumns
+            elif(msgID == PTP_MTYPE_SIGNALLING):
+                fieldList = ["frame.number", msgIdentifierUsed, "ptp.v2.flags", "ptp.v2.sequenceid", "ptp.v2.logmessageperiod", "ptp.v2.sig.tlv.tlvType"]
+                colNames = ["frameNum", "messageID", "flags", "seqID", "logMP", "tlvType"]
+            elif(msgID == PTP_MTYPE_MANAGEMENT):
+                fieldList = ["frame.number", msgIdentifierUsed, "ptp.v2.flags"]
+                colNames = ["frameNum", "messageId", "flags"]
+            else:
+                print_info(result, "unknown message ID: ", msgID)
+                continue
+            
+            for field in fieldList:
+                tsharkInvokeList += ["-e", field]
+            
+            tsharkJobs[(arrayIdx, msgID)] = (tsharkInvokeList, colNames, {"frameTime": str})
+
+    # the tshark runs per source and message type are independent, run them concurrently
+    ptpMsgData = read_tshark_fields_concurrent(tsharkJobs, maxWorkers, result.profiler)
+    for msgData in ptpMsgData.values():
+        if("frameTime" in msgData.columns):
+            msgData["frameTime"] = epoch_to_ns(msgData["frameTime"])
+    return ptpMsgData
+###----------------------------------------------------------------------------
+
+
+###----- create individual data frames for different message IDs --------------
+# go through previously read tshark output to add the individual pandas data frames
+# to lists differentiated by type of PTP message
+#
+# \param ptpMsgData ... dict of data frames as returned by get_further_information()
+def create_ptp_message_data_frames(result, ptpMsgData):
+    
+    ### iterate through uniqueIpSrcs and result.uniqueMsgIDs
+    for arrayIdx in range(len(result.uniqueSrcValues)):
+        for itemIdx in range(len(result.uniqueMsgIDs[arrayIdx])):
+            msgID = result.uniqueMsgIDs[arrayIdx][itemIdx]
+            
+            ### append data frames according to found message IDs
+            if((arrayIdx, msgID) in ptpMsgData):
+                append_ptp_message_data_frame(result, msgID, ptpMsgData[(arrayIdx, msgID)], arrayIdx)
+            else:
+                print_info(result, "unknown message ID: ", msgID)
+                continue
+###----------------------------------------------------------------------------
+
+
+###----- single-pass extraction of all needed PTP fields ----------------------
+# alternative to determine_eth_type() ... get_further_information()
+# - invoke tshark exactly once, asking for the union of all fields needed by the later stages
+# - its output is read into one data frame ... ptpData
+# - the data frame is split by source and message type in memory, see split_ptp_data()
+#
+# \param profiler ... PtpProfiler of the analysis, None ... not profiled
+def extract_ptp_data_single_pass(inputFileName, profiler = None):
+    # field names in the same order as PTP_DATA_COLUMNS
+    fieldList = ["frame.number", "eth.type", "ip.src", "ipv6.src", "eth.src", msgIdentifierUsed, "ptp.v2.flags", "ptp.v2.sequenceid", "ptp.v2.logmessageperiod"] + PTP_TS_FIELD_LIST + ["ptp.v2.sig.tlv.tlvType"] + PTP_ID_FIELD_LIST
+
+    tsharkInvokeList = ["-r", inputFileName, "-Y", "ptp and not icmp", "-T", "fields", "-2", "-E", "occurrence=f"]
+    for field in fieldList:
+        tsharkInvokeList += ["-e", field]
+    ptpData = read_tshark_fields(tsharkInvokeList, PTP_DATA_COLUMNS, {"frameTime": str}, profiler)
+
+    if(ptpData.empty == True):
+        raise ValueError("no eligible PTP messages found within:" + inputFileName)
+    ptpData["frameTime"] = epoch_to_ns(ptpData["frameTime"])
+
+    return ptpData
+###----------------------------------------------------------------------------
+
+
+###----- append a data frame to the messages of its message type --------------
+# the data frame is converted into the record store of the result, see frame_to_store_records()
+#
+# \param result  ... PtpAnalysisResult to add the data frame to
+#
+# \param msgID   ... integer messageId of the PTP messages held by msgData
+#
+# \param msgData ... data frame holding PTP messages of a single source and message type
+#
+# \param srcIdx  ... index into result.uniqueSrcValues
+def append_ptp_message_data_frame(result, msgID, msgData, srcIdx):
+    if(msgID in PTP_STORE_DTYPES):
+        append_ptp_message_records(result, msgID, frame_to_store_records(msgData, msgID), srcIdx)
+###----------------------------------------------------------------------------
+
+
+###----- append records to the messages of their message type -----------------
+# \param result  ... PtpAnalysisResult to add the records to
+#
+# \param msgID   ... integer messageId of the PTP messages held by records
+#
+# \param records ... structured array of dtype PTP_STORE_DTYPES[msgID], holding PTP messages of a single source
+#
+# \param srcIdx  ... index into result.uniqueSrcValues
+def append_ptp_message_records(result, msgID, records, srcIdx):
+    result.recordStore.add(srcIdx, msgID, records)
+    result.listSrcIdx[msgID].append(srcIdx)
+###----------------------------------------------------------------------------
+
+
+###----- convert a data frame into records of the record store ----------------
+# returns a structured array of dtype PTP_STORE_DTYPES[msgID]
+# - flags and clock identities are parsed from hex strings, see flags_to_int() and clock_ids_to_int()
+# - missing flags, timestamps, capture times and clock identities become zero, other missing fields zero and are marked within naMask
+#
+# \param frame ... data frame holding PTP messages of a single source and message type, as created by get_further_information()
+#
+# \param msgID ... integer messageId of the PTP messages held by frame
+def frame_to_store_records(frame, msgID):
+    records = np.empty(len(frame), dtype = PTP_STORE_DTYPES[msgID])
+    if("naMask" in records.dtype.names):
+        records["naMask"] = 0
+    for col in records.dtype.names:
+        if(col == "naMask"):
+            continue
+        elif(col == "ts"):
+            records[col] = frame["ts_s"].fillna(0).astype("int64") * NS_PER_S + frame["ts_ns"].fillna(0).astype("int64")
+        elif(col == "flags"):
+            records[col] = flags_to_int(frame[col]).to_numpy()
+        elif(col in ("clockId", "reqClockId")):
+            records[col] = clock_ids_to_int(frame[col])
+        elif(col in PTP_STORE_NULLABLE_FIELDS):
+            values = pd.to_numeric(frame[col], errors = "coerce")
+            records[col] = values.fillna(0).to_numpy(dtype = np.int64)
+            records["naMask"] |= values.isna().to_numpy().astype(np.uint8) << PTP_STORE_NULLABLE_FIELDS.index(col)
+        else:
+            records[col] = frame[col].fillna(0).to_numpy(dtype = np.int64)
+    return records
+###----------------------------------------------------------------------------
+
+
+###----- missing values of a field of the record store ------------------------
+# returns a boolean array, True for the messages the field is missing for, all False for fields that are never missing
+#
+# \param records ... structured array of dtype PTP_STORE_DTYPES[msgID]
+#
+# \param col     ... name of the field
+def get_store_na_mask(records, col):
+    if(col not in PTP_STORE_NULLABLE_FIELDS or "naMask" not in records.dtype.names):
+        return np.zeros(len(records), dtype = bool)
+    return (records["naMask"] & (1 << PTP_STORE_NULLABLE_FIELDS.index(col))) != 0
+###----------------------------------------------------------------------------
+
+
+###----- split single-pass data by source and message type --------------------
+# in-memory equivalent of determine_eth_type(), identify_ptp_sources(), create_ptp_source_data_frames(),
+# identify_ptp_msg_types() and create_ptp_message_data_frames()
+# - ethTypeUsed is derived from the eth.type of the first PTP message
+# - the data frames split off hold the same columns as the ones created by get_further_information()
+#
+# \param ptpData ... data frame as returned by extract_ptp_data_single_pass()
+def split_ptp_data(result, ptpData):
+
+    ### check IPvX version of first PTP message
+    ethTypeString = str(ptpData["ethType"][ptpData["ethType"].first_valid_index()])
+    if(ethTypeString.find("0800") != -1):
+        result.ethTypeUsed = "ip.src"
+    elif(ethTypeString.find("86dd") != -1):
+        result.ethTypeUsed = "ipv6.src"
+    elif(ethTypeString.find("8100") != -1):
+        result.ethTypeUsed = "eth.src"
+    else:
+        raise ValueError("no valid eth.type found: " + ethTypeString)
+
+    ### identify unique sources, create one data frame per source
+    result.uniqueSrcValues = pd.unique(ptpData[result.ethTypeUsed].dropna()).astype(object)
+    print_info(result, "Unique Src Values: ", result.uniqueSrcValues)
+
+    srcDataList = []
+    for idx in range(len(result.uniqueSrcValues)):
+        srcData = ptpData[ptpData[result.ethTypeUsed] == result.uniqueSrcValues[idx]].reset_index(drop = True)
+        srcDataList.append(srcData)
+
+    ### identify unique message IDs per source, sets msgFlag* as well
+    identify_ptp_msg_types(result, [srcData[["frameNum", "messageID"]] for srcData in srcDataList])
+
+    ### create data frames per source and message type, same order as create_ptp_message_data_frames()
+    for arrayIdx in range(len(result.uniqueSrcValues)):
+        srcData = srcDataList[arrayIdx]
+        srcMsgIDs = srcData["messageID"].map(lambda msgID: int(str(msgID), 16))
+
+        for itemIdx in range(len(result.uniqueMsgIDs[arrayIdx])):
+            msgID = result.uniqueMsgIDs[arrayIdx][itemIdx]
+            msgData = srcData[srcMsgIDs == msgID].reset_index(drop = True)
+
+            if(msgID in PTP_TS_FIELDS):
+                msgData = msgData[["frameNum", "messageID", "flags", "seqID", "logMP", PTP_TS_FIELDS[msgID][0], PTP_TS_FIELDS[msgID][1]] + get_ptp_id_columns(msgID)]
+                msgData.columns = ["frameNum", "messageID", "flags", "seqID", "logMP", "ts_s", "ts_ns"] + get_ptp_id_columns(msgID)
+            elif(msgID == PTP_MTYPE_SIGNALLING):
+                msgData = msgData[["frameNum", "messageID", "flags", "seqID", "logMP", "tlvType"]]
+            elif(msgID == PTP_MTYPE_MANAGEMENT):
+                msgData = msgData[["frameNum", "messageID", "flags"]]
+                msgData.columns = ["frameNum", "messageId", "flags"]
+            else:
+                print_info(result, "unknown message ID: ", msgID)
+                continue
+
+            append_ptp_message_data_frame(result, msgID, msgData, arrayIdx)
+###----------------------------------------------------------------------------
+
+
+###----- timestamp resolution of a pcapng interface --------------------------
+# returns the value of the if_tsresol option of an interface description block, PCAPNG_DEFAULT_TSRESOL if not given
+#
+# \param buf      ... bytes-like capture data
+#
+# \param optStart ... position of the first option within buf
+#
+# \param optEnd   ... position after the last option within buf
+#
+# \param endian   ... byte order of the section, "<" or ">"
+def parse_pcapng_tsresol(buf, optStart, optEnd, endian):
+    optPos = optStart
+    while(optPos + 4 <= optEnd):
+        optCode, optLen = struct.unpack_from(endian + "HH", buf, optPos)
+        if(optCode == 0):
+            break
+        if(optCode == PCAPNG_OPT_IF_TSRESOL and optLen >= 1):
+            return buf[optPos + 4]
+        optPos += 4 + ((optLen + 3) & ~3)
+    return PCAPNG_DEFAULT_TSRESOL
+###----------------------------------------------------------------------------
+
+
+###----- convert a pcapng timestamp to integer nanoseconds --------------------
+# \param tsHigh, tsLow ... upper and lower 32 bit of the timestamp
+#
+# \param tsResol       ... if_tsresol of the interface, MSB set ... negative power of 2, else negative power of 10
+def pcapng_ts_to_ns(tsHigh, tsLow, tsResol):
+    ts = (tsHigh << 32) | tsLow
+    if(tsResol & 0x80):
+        return (ts * NS_PER_S) >> (tsResol & 0x7f)
+    elif(tsResol <= 9):
+        return ts * 10 ** (9 - tsResol)
+    return ts // 10 ** (tsResol - 9)
+###----------------------------------------------------------------------------
+
+
+###----- iterate over the packets of a pcap/pcapng file -----------------------
+# generator used by the native decoder, yields one tuple per captured packet
+# - (frameNum, linkType, packetData, frameTime)
+# - frameNum counts every packet of the file, starting at 1, just like the tshark field frame.number
+# - frameTime is the capture time in integer nanoseconds, 0 if not recorded (simple packet blocks)
+# - supports classic pcap (usec/nsec, both byte orders) and pcapng (SHB, IDB, EPB, SPB, PB)
+#
+# \param inputFileName ... capture file to read, e.g. .pcap, .pcapng, .pcapng.log
+def iter_capture_packets(inputFileName):
+    with open(inputFileName, "rb") as captureFile:
+        fileHeader = captureFile.read(24)
+        if(len(fileHeader) < 24):
+            raise ValueError("invalid capture file, header too short: " + inputFileName)
+
+        frameNum = 0
+        magicLE = struct.unpack("<I", fileHeader[0:4])[0]
+
+        ### classic pcap
+        if(magicLE in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC) or struct.unpack(">I", fileHeader[0:4])[0] in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC)):
+            endian = "<" if(magicLE in (PCAP_MAGIC_USEC, PCAP_MAGIC_NSEC)) else ">"
+            linkType = struct.unpack(endian + "I", fileHeader[20:24])[0] & 0x0fffffff
+            tsFactor = 1 if(struct.unpack(endian + "I", fileHeader[0:4])[0] == PCAP_MAGIC_NSEC) else 1000
+            recordHeaderStruct = struct.Struct(endian + "IIII")
+
+            while(True):
+                recordHeader = captureFile.read(16)
+                if(len(recordHeader) < 16):
+                    break
+                tsSec, tsFrac, inclLen, origLen = recordHeaderStruct.unpack(recordHeader)
+                packetData = captureFile.read(inclLen)
+                if(len(packetData) < inclLen):
+                    break
+                frameNum += 1
+                yield (frameNum, linkType, packetData, tsSec * NS_PER_S + tsFrac * tsFactor)
+
+        ### pcapng
+        elif(magicLE == PCAPNG_BT_SHB):
+            captureFile.seek(0)
+            endian = "<"
+            linkTypes = []
+            tsResols = []
+
+            while(True):
+                blockHeader = captureFile.read(8)
+                if(len(blockHeader) < 8):
+                    break
+
+                ### section header block, (re-)determine byte order and reset interfaces
+                if(struct.unpack("<I", blockHeader[0:4])[0] == PCAPNG_BT_SHB):
+                    byteOrderMagic = captureFile.read(4)
+                    endian = "<" if(struct.unpack("<I", byteOrderMagic)[0] == PCAPNG_BYTE_ORDER_MAGIC) else ">"
+                    blockLen = struct.unpack(endian + "I", blockHeader[4:8])[0]
+                    captureFile.seek(blockLen - 12, 1)
+                    linkTypes = []
+                    tsResols = []
+                    continue
+
+                blockType, blockLen = struct.unpack(endian + "II", blockHeader)
+                if(blockLen < 12):
+                    raise ValueError("invalid pcapng block length: " + str(blockLen))
+                blockBody = captureFile.read(blockLen - 8)
+                if(len(blockBody) < blockLen - 8):
+                    break
+
+                if(blockType == PCAPNG_BT_IDB):
+                    linkTypes.append(struct.unpack(endian + "H", blockBody[0:2])[0])
+                    tsResols.append(parse_pcapng_tsresol(blockBody, 8, len(blockBody) - 4, endian))
+                elif(blockType == PCAPNG_BT_EPB):
+                    interfaceId, tsHigh, tsLow, capLen, origLen = struct.unpack(endian + "IIIII", blockBody[0:20])
+                    frameNum += 1
+                    yield (frameNum, linkTypes[interfaceId], blockBody[20:20 + capLen], pcapng_ts_to_ns(tsHigh, tsLow, tsResols[interfaceId]))
+                elif(blockType == PCAPNG_BT_SPB):
+                    origLen = struct.unpack(endian + "I", blockBody[0:4])[0]
+                    frameNum += 1
+                    yield (frameNum, linkTypes[0], blockBody[4:4 + min(origLen, blockLen - 16)], 0)
+                elif(blockType == PCAPNG_BT_PB):
+                    interfaceId, drops, tsHigh, tsLow, capLen, origLen = struct.unpack(endian + "HHIIII", blockBody[0:20])
+                    frameNum += 1
+                    yield (frameNum, linkTypes[interfaceId], blockBody[20:20 + capLen], pcapng_ts_to_ns(tsHigh, tsLow, tsResols[interfaceId]))
+        else:
+            raise ValueError("unknown capture file format: " + inputFileName)
+###----------------------------------------------------------------------------
+
+
+###----- decode a single packet holding a PTP message -------------------------
+# parse Ethernet/VLAN/IPv4/IPv6/UDP 319/320 and the PTPv2 common header and message body
+# returns None for anything that is not a PTPv2 message, otherwise a list of values
+# matching PTP_DATA_COLUMNS, formatted like the output of extract_ptp_data_single_pass()
+#
+# \param frameNum   ... number of the frame within the capture
+#
+# \param linkType   ... link layer type of the interface the packet was captured on
+#
+# \param packetData ... raw bytes of the captured packet
+#
+# \param frameTime  ... capture time in integer nanoseconds
+def decode_ptp_packet(frameNum, linkType, packetData, frameTime = 0):
+    ethSrc = None
+    ipSrc = None
+    ipv6Src = None
+
+    ### link layer
+    if(linkType == LINKTYPE_ETHERNET):
+        if(len(packetData) < 14):
+            return None
+        ethSrc = packetData[6:12].hex(":")
+        ethType = struct.unpack(">H", packetData[12:14])[0]
+        offset = 14
+    elif(linkType == LINKTYPE_LINUX_SLL):
+        if(len(packetData) < 16):
+            return None
+        ethType = struct.unpack(">H", packetData[14:16])[0]
+        offset = 16
+    elif(linkType == LINKTYPE_LINUX_SLL2):
+        if(len(packetData) < 20):
+            return None
+        ethType = struct.unpack(">H", packetData[0:2])[0]
+        offset = 20
+    else:
+        return None
+    outerEthType = ethType
+
+    ### skip VLAN tags
+    while(ethType in (ETHTYPE_VLAN, ETHTYPE_QINQ)):
+        if(len(packetData) < offset + 4):
+            return None
+        ethType = struct.unpack(">H", packetData[offset + 2:offset + 4])[0]
+        offset += 4
+
+    ### network/transport layer
+    if(ethType == ETHTYPE_IPV4):
+        if(len(packetData) < offset + 20):
+            return None
+        ihl = (packetData[offset] & 0x0f) * 4
+        fragOffset = struct.unpack(">H", packetData[offset + 6:offset + 8])[0] & 0x1fff
+        if(packetData[offset + 9] != 17 or fragOffset != 0):
+            return None
+        ipSrc = socket.inet_ntop(socket.AF_INET, packetData[offset + 12:offset + 16])
+        offset += ihl
+    elif(ethType == ETHTYPE_IPV6):
+        if(len(packetData) < offset + 40):
+            return None
+        nextHeader = packetData[offset + 6]
+        ipv6Src = socket.inet_ntop(socket.AF_INET6, packetData[offset + 8:offset + 24])
+        offset += 40
+        # skip hop-by-hop, routing and destination options extension headers
+        while(nextHeader in (0, 43, 60)):
+            if(len(packetData) < offset + 8):
+                return None
+            nextHeader = packetData[offset]
+            offset += (packetData[offset + 1] + 1) * 8
+        if(nextHeader != 17):
+            return None
+    elif(ethType != ETHTYPE_PTP):
+        return None
+
+    if(ethType != ETHTYPE_PTP):
+        if(len(packetData) < offset + 8):
+            return None
+        srcPort, dstPort = struct.unpack(">HH", packetData[offset:offset + 4])
+        if(dstPort not in (PTP_EVENT_PORT, PTP_GENERAL_PORT) and srcPort not in (PTP_EVENT_PORT, PTP_GENERAL_PORT)):
+            return None
+        offset += 8
+
+    ### PTPv2 common header
+    ptp = packetData[offset:]
+    if(len(ptp) < 34 or (ptp[1] & 0x0f) != 2):
+        return None
+    messageId = ptp[0] & 0x0f
+    flags = struct.unpack(">H", ptp[6:8])[0]
+    seqID = struct.unpack(">H", ptp[30:32])[0]
+    logMP = struct.unpack(">b", ptp[33:34])[0]
+
+    clockId, portId = struct.unpack(">QH", ptp[20:30])
+
+    row = [frameNum, "0x%04x" % outerEthType, ipSrc, ipv6Src, ethSrc, "0x%02x" % messageId, "0x%04x" % flags, seqID, logMP] + [None] * len(PTP_TS_FIELD_LIST) + [None]
+    row += [frameTime, "0x%016x" % clockId, portId, None, None]
+
+    ### PTPv2 message body
+    if(messageId in PTP_TS_FIELDS and len(ptp) >= 44):
+        tsHigh, tsLow, tsNs = struct.unpack(">HII", ptp[34:44])
+        colIdx = PTP_DATA_COLUMNS.index(PTP_TS_FIELDS[messageId][0])
+        row[colIdx] = (tsHigh << 32) | tsLow
+        row[colIdx + 1] = tsNs
+    elif(messageId == PTP_MTYPE_SIGNALLING and len(ptp) >= 46):
+        # first TLV follows the 10 byte targetPortIdentity
+        row[PTP_DATA_COLUMNS.index("tlvType")] = struct.unpack(">H", ptp[44:46])[0]
+
+    ### requesting port identity of DelayResp messages
+    if(messageId == PTP_MTYPE_DELAY_RESP and len(ptp) >= 54):
+        reqClockId, reqPortId = struct.unpack(">QH", ptp[44:54])
+        row[PTP_DATA_COLUMNS.index("reqClockId")] = "0x%016x" % reqClockId
+        row[PTP_DATA_COLUMNS.index("reqPortId")] = reqPortId
+
+    return row
+###----------------------------------------------------------------------------
+
+
+###----- native extraction of all needed PTP fields ---------------------------
+# alternative to extract_ptp_data_single_pass() which does not depend on tshark
+# - read the capture with iter_capture_packets(), decode every packet with decode_ptp_packet()
+# - returns a data frame with the same columns as extract_ptp_data_single_pass() ... PTP_DATA_COLUMNS
+def extract_ptp_data_native(inputFileName, profiler = None):
+    rows = []
+    for frameNum, linkType, packetData, frameTime in iter_capture_packets(inputFileName):
+        row = decode_ptp_packet(frameNum, linkType, packetData, frameTime)
+        if(row != None):
+            rows.append(row)
+
+    if(len(rows) == 0):
+        raise ValueError("no eligible PTP messages found within:" + inputFileName)
+
+    count_bytes_read(profiler, os.path.getsize(inputFileName))
+    return pd.DataFrame.from_records(rows, columns = PTP_DATA_COLUMNS)
+###----------------------------------------------------------------------------
+
+
+###----- index the packets of a memory-mapped pcap/pcapng file ----------------
+# generator used by the mmap decoder, walks the record/block headers of a capture
+# without copying packet data, yields one tuple of NumPy arrays per chunk of packets
+# - (frameNums, offsets, capLens, linkTypes, frameTimes)
+# - offsets point to the first byte of the packet data within the mapped file
+# - frameTimes are the capture times in integer nanoseconds
+#
+# \param buf          ... memory-mapped capture file
+#
+# \param chunkPackets ... maximum number of packets per yielded chunk
+def index_capture_packets(buf, chunkPackets = MMAP_CHUNK_PACKETS):
+    if(len(buf) < 24):
+        raise ValueError("invalid capture file, header too short")
+
+    indexer = CaptureIndexer()
+    pos = 0
+    while(True):
+        frameNums, offsets, capLens, linkTypes, frameTimes, pos = indexer.index(buf, pos, chunkPackets)
+        if(len(offsets) == 0):
+            break
+        yield (frameNums, offsets, capLens, linkTypes, frameTimes)
+###----------------------------------------------------------------------------
+
+
+###----- vectorized decoding of a chunk of packets ----------------------------
+# NumPy equivalent of decode_ptp_packet() for a whole chunk of packets at once
+# - every field is gathered with fancy indexing into the mapped file, no per-packet Python objects are created
+# - IPv6 extension headers are not followed, such packets are skipped
+# returns (records, srcKind, srcKeys)
+# - records ... structured array of dtype PTP_RECORD_DTYPE, srcIdx not yet assigned
+# - srcKind ... "ip.src", "ipv6.src" or "eth.src" per record, derived from the outermost ethertype like split_ptp_data()
+# - srcKeys ... raw source address bytes per record, shape (n, 16), zero padded
+#
+# \param data ... uint8 view of the memory-mapped capture file
+#
+# \param frameNums, offsets, capLens, linkTypes, frameTimes ... one chunk as yielded by index_capture_packets()
+def decode_ptp_chunk(data, frameNums, offsets, capLens, linkTypes, frameTimes):
+    dataLen = len(data)
+
+    # gather helpers, out of bounds positions are clipped and masked out via <valid>
+    def u8(pos):
+        return data[np.minimum(pos, dataLen - 1)].astype(np.uint64)
+    def be16(pos):
+        return (u8(pos) << 8) | u8(pos + 1)
+    def be32(pos):
+        return (be16(pos) << 16) | be16(pos + 2)
+    def be64(pos):
+        return (be32(pos) << 32) | be32(pos + 4)
+
+    endPos = offsets + capLens
+
+    ### link layer
+    ethTypePos = np.full(len(offsets), -1, dtype = np.int64)
+    l3Pos = np.zeros(len(offsets), dtype = np.int64)
+    isEth = linkTypes == LINKTYPE_ETHERNET
+    ethTypePos[isEth] = offsets[isEth] + 12
+    l3Pos[isEth] = offsets[isEth] + 14
+    isSll = linkTypes == LINKTYPE_LINUX_SLL
+    ethTypePos[isSll] = offsets[isSll] + 14
+    l3Pos[isSll] = offsets[isSll] + 16
+    isSll2 = linkTypes == LINKTYPE_LINUX_SLL2
+    ethTypePos[isSll2] = offsets[isSll2]
+    l3Pos[isSll2] = offsets[isSll2] + 20
+
+    valid = (ethTypePos >= 0) & (l3Pos <= endPos)
+    ethType = be16(ethTypePos)
+    outerEthType = ethType.copy()
+
+    ### skip up to two VLAN tags
+    for tag in range(2):
+        isVlan = valid & ((ethType == ETHTYPE_VLAN) | (ethType == ETHTYPE_QINQ))
+        valid &= ~isVlan | (l3Pos + 4 <= endPos)
+        ethType = np.where(isVlan, be16(l3Pos + 2), ethType)
+        l3Pos = np.where(isVlan, l3Pos + 4, l3Pos)
+
+    ### network/transport layer
+    isIPv4 = valid & (ethType == ETHTYPE_IPV4) & (l3Pos + 20 <= endPos)
+    isIPv4 &= (u8(l3Pos + 9) == 17) & ((be16(l3Pos + 6) & 0x1fff) == 0)
+    isIPv6 = valid & (ethType == ETHTYPE_IPV6) & (l3Pos + 40 <= endPos) & (u8(l3Pos + 6) == 17)
+    isL2 = valid & (ethType == ETHTYPE_PTP)
+
+    udpPos = np.where(isIPv4, l3Pos + (u8(l3Pos) & 0x0f).astype(np.int64) * 4, l3Pos + 40)
+    isUdp = (isIPv4 | isIPv6) & (udpPos + 8 <= endPos)
+    srcPort = be16(udpPos)
+    dstPort = be16(udpPos + 2)
+    isUdp &= (srcPort == PTP_EVENT_PORT) | (srcPort == PTP_GENERAL_PORT) | (dstPort == PTP_EVENT_PORT) | (dstPort == PTP_GENERAL_PORT)
+
+    ptpPos = np.where(isL2, l3Pos, udpPos + 8)
+    isPtp = (isUdp | isL2) & (ptpPos + 34 <= endPos)
+    isPtp &= (u8(ptpPos + 1) & 0x0f) == 2
+
+    ### keep PTPv2 messages only
+    sel = np.nonzero(isPtp)[0]
+    ptpPos = ptpPos[sel]
+    endPos = endPos[sel]
+    l3Pos = l3Pos[sel]
+    outerEthType = outerEthType[sel]
+
+    records = np.zeros(len(sel), dtype = PTP_RECORD_DTYPE)
+    records["frameNum"] = frameNums[sel]
+    records["srcIdx"] = -1
+    records["messageId"] = u8(ptpPos) & 0x0f
+    records["flags"] = be16(ptpPos + 6)
+    records["seqID"] = be16(ptpPos + 30)
+    records["logMP"] = u8(ptpPos + 33).astype(np.uint8).view(np.int8)
+
+    hasTs = np.isin(records["messageId"], list(PTP_TS_FIELDS.keys())) & (ptpPos + 44 <= endPos)
+    records["ts_s"] = np.where(hasTs, (be16(ptpPos + 34) << 32) | be32(ptpPos + 36), 0)
+    records["ts_ns"] = np.where(hasTs, be32(ptpPos + 40), 0)
+    hasTlv = (records["messageId"] == PTP_MTYPE_SIGNALLING) & (ptpPos + 46 <= endPos)
+    records["tlvType"] = np.where(hasTlv, be16(ptpPos + 44), 0)
+    records["frameTime"] = frameTimes[sel]
+    records["clockId"] = be64(ptpPos + 20)
+    records["portId"] = be16(ptpPos + 28)
+    hasReqPort = (records["messageId"] == PTP_MTYPE_DELAY_RESP) & (ptpPos + 54 <= endPos)
+    records["reqClockId"] = np.where(hasReqPort, be64(ptpPos + 44), 0)
+    records["reqPortId"] = np.where(hasReqPort, be16(ptpPos + 52), 0)
+
+    ### source address bytes, according to the outermost ethertype
+    srcKind = np.full(len(sel), "", dtype = object)
+    srcKeys = np.zeros((len(sel), 16), dtype = np.uint8)
+    isV4Src = (outerEthType == ETHTYPE_IPV4) & isIPv4[sel]
+    isV6Src = (outerEthType == ETHTYPE_IPV6) & isIPv6[sel]
+    isEthSrc = (outerEthType == ETHTYPE_VLAN) & isEth[sel]
+    srcKind[isV4Src] = "ip.src"
+    srcKind[isV6Src] = "ipv6.src"
+    srcKind[isEthSrc] = "eth.src"
+    srcPos = np.where(isV4Src, l3Pos + 12, np.where(isV6Src, l3Pos + 8, offsets[sel] + 6))
+    srcLen = np.where(isV4Src, 4, np.where(isV6Src, 16, 6))
+    for byteIdx in range(16):
+        srcKeys[:, byteIdx] = np.where(byteIdx < srcLen, u8(srcPos + byteIdx), 0)
+
+    return records, srcKind, srcKeys
+###----------------------------------------------------------------------------
+
+
+###----- format raw source address bytes --------------------------------------
+# \param srcKind ... "ip.src", "ipv6.src" or "eth.src"
+#
+# \param srcKey  ... raw source address bytes, zero padded to 16 bytes
+def format_src_key(srcKind, srcKey):
+    if(srcKind == "ip.src"):
+        return socket.inet_ntop(socket.AF_INET, srcKey[0:4])
+    elif(srcKind == "ipv6.src"):
+        return socket.inet_ntop(socket.AF_INET6, srcKey[0:16])
+    else:
+        return srcKey[0:6].hex(":")
+###----------------------------------------------------------------------------
+
+
+###----- assign srcIdx to a chunk of decoded records ----------------------------
+# - like split_ptp_data(), the kind of source address is derived from the eth.type of the first PTP message
+# - records of another kind of source address keep srcIdx -1
+# returns ethTypeUsed, determined by the first chunk
+#
+# \param records, srcKind, srcKeys ... one chunk as returned by decode_ptp_chunk()
+#
+# \param srcLookup   ... dict mapping raw source address bytes to srcIdx, updated in place
+#
+# \param srcValues   ... list of unique source addresses in order of appearance, updated in place
+#
+# \param ethTypeUsed ... kind of source address, "" before the first chunk
+def map_ptp_sources(records, srcKind, srcKeys, srcLookup, srcValues, ethTypeUsed):
+    ### kind of source address is defined by the first PTP message
+    if(ethTypeUsed == ""):
+        if(srcKind[0] == ""):
+            raise ValueError("no valid eth.type found for frame: " + str(records["frameNum"][0]))
+        ethTypeUsed = srcKind[0]
+
+    ### map source addresses to srcIdx, keeping order of appearance
+    useSrc = np.nonzero(srcKind == ethTypeUsed)[0]
+    keyView = np.ascontiguousarray(srcKeys[useSrc]).view(np.dtype((np.void, 16))).ravel()
+    chunkKeys, firstIdx, inverse = np.unique(keyView, return_index = True, return_inverse = True)
+    chunkSrcIdx = np.empty(len(chunkKeys), dtype = np.int32)
+    for keyIdx in np.argsort(firstIdx):
+        key = chunkKeys[keyIdx].tobytes()
+        if(key not in srcLookup):
+            srcLookup[key] = len(srcValues)
+            srcValues.append(format_src_key(ethTypeUsed, key))
+        chunkSrcIdx[keyIdx] = srcLookup[key]
+    records["srcIdx"][useSrc] = chunkSrcIdx[inverse.ravel()]
+
+    return ethTypeUsed
+###----------------------------------------------------------------------------
+
+
+###----- decoding of a growing capture or a pipe, chunk by chunk ---------------
+# generator used by the follow mode, same output as iter_ptp_record_chunks_mmap()
+# - every read returns the data written so far, complete packets are decoded right away
+# - a regular file is polled for new data until it did not grow for idleTimeout seconds
+# - a pipe (e.g. stdin fed by "dumpcap -w -") is read until the writing side closes it
+#
+# \param captureFile  ... binary file object, a regular file or a pipe
+#
+# \param pollInterval ... time between two reads of a regular file without new data, in seconds
+#
+# \param idleTimeout  ... time without new data after which a regular file is regarded as complete, in seconds
+def iter_ptp_record_chunks_follow(captureFile, pollInterval = FOLLOW_DEFAULT_POLL_INTERVAL, idleTimeout = FOLLOW_DEFAULT_IDLE_TIMEOUT, profiler = None):
+    ethTypeUsed = ""
+    srcValues = []
+    srcLookup = {}
+    indexer = CaptureIndexer()
+    buf = bytearray()
+    lastDataTime = time.monotonic()
+
+    while(True):
+        newData = captureFile.read1(FOLLOW_READ_BYTES)
+        if(len(newData) == 0):
+            if(captureFile.seekable() == False or time.monotonic() - lastDataTime > idleTimeout):
+                break
+            time.sleep(pollInterval)
+            continue
+        lastDataTime = time.monotonic()
+        count_bytes_read(profiler, len(newData))
+        buf += newData
+
+        frameNums, offsets, capLens, linkTypes, frameTimes, pos = indexer.index(buf, 0, len(buf))
+        if(len(offsets) > 0):
+            data = np.frombuffer(bytes(buf[:pos]), dtype = np.uint8)
+            records, srcKind, srcKeys = decode_ptp_chunk(data, frameNums, offsets, capLens, linkTypes, frameTimes)
+            if(len(records) > 0):
+                ethTypeUsed = map_ptp_sources(records, srcKind, srcKeys, srcLookup, srcValues, ethTypeUsed)
+                yield records[records["srcIdx"] >= 0], srcValues, ethTypeUsed
+        del buf[:pos]
+###----------------------------------------------------------------------------
+
+
+###----- memory-mapped decoding, chunk by chunk --------------------------------
+# generator used by extract_ptp_records_mmap() and the streaming analysis
+# - the capture file is memory-mapped and decoded chunk by chunk, see decode_ptp_chunk()
+# - like split_ptp_data(), the kind of source address is derived from the eth.type of the first PTP message
+# yields one tuple per chunk holding at least one PTP message ... (records, srcValues, ethTypeUsed)
+# - records     ... structured array of dtype PTP_RECORD_DTYPE, srcIdx refers to srcValues
+# - srcValues   ... list of unique source addresses seen so far, in order of appearance, grows from chunk to chunk
+# - ethTypeUsed ... kind of source address, "ip.src", "ipv6.src" or "eth.src"
+#
+# \param chunkPackets ... maximum number of packets decoded at once
+def iter_ptp_record_chunks_mmap(inputFileName, chunkPackets = MMAP_CHUNK_PACKETS, profiler = None):
+    ethTypeUsed = ""
+
+    with open(inputFileName, "rb") as captureFile:
+        if(os.fstat(captureFile.fileno()).st_size == 0):
+            raise ValueError("invalid capture file, empty: " + inputFileName)
+        buf = mmap.mmap(captureFile.fileno(), 0, access = mmap.ACCESS_READ)
+    count_bytes_read(profiler, len(buf))
+
+    srcValues = []
+    srcLookup = {}
+    data = None
+    try:
+        data = np.frombuffer(buf, dtype = np.uint8)
+        for frameNums, offsets, capLens, linkTypes, frameTimes in index_capture_packets(buf, chunkPackets):
+            records, srcKind, srcKeys = decode_ptp_chunk(data, frameNums, offsets, capLens, linkTypes, frameTimes)
+            if(len(records) == 0):
+                continue
+
+            ethTypeUsed = map_ptp_sources(records, srcKind, srcKeys, srcLookup, srcValues, ethTypeUsed)
+            yield records[records["srcIdx"] >= 0], srcValues, ethTypeUsed
+    finally:
+        # data exports the mapping, released first, also if the generator is closed early or the caller raised
+        data = None
+        buf.close()
+###----------------------------------------------------------------------------
+
+
+###----- memory-mapped extraction into a NumPy structured array ---------------
+# alternative to extract_ptp_data_native() for very large captures
+# - memory usage is bounded by the chunk size plus one PTP_RECORD_DTYPE entry per PTP message
+# returns (records, srcValues, ethTypeUsed), see iter_ptp_record_chunks_mmap()
+def extract_ptp_records_mmap(inputFileName, chunkPackets = MMAP_CHUNK_PACKETS, profiler = None):
+    ethTypeUsed = ""
+    srcValues = []
+    recordChunks = []
+    for records, srcValues, ethTypeUsed in iter_ptp_record_chunks_mmap(inputFileName, chunkPackets, profiler):
+        recordChunks.append(records)
+
+    if(len(recordChunks) == 0):
+        raise ValueError("no eligible PTP messages found within:" + inputFileName)
+
+    return np.concatenate(recordChunks), srcValues, ethTypeUsed
+###----------------------------------------------------------------------------
+
+
+###----- split structured array by source and message type --------------------
+# columnar equivalent of split_ptp_data() for the output of extract_ptp_records_mmap()
+# - the records are copied into the record store field by field, no data frames are built
+#
+# \param records     ... structured array of dtype PTP_RECORD_DTYPE
+#
+# \param srcValues   ... list of unique source addresses, indexed by records["srcIdx"]
+#
+# \param ethTypeUsed ... kind of source address, as returned by extract_ptp_records_mmap()
+def split_ptp_records(result, records, srcValues, ethTypeUsed):
+    result.ethTypeUsed = ethTypeUsed
+
+    result.uniqueSrcValues = np.array(srcValues, dtype = object)
+    print_info(result, "Unique Src Values: ", result.uniqueSrcValues)
+
+    for arrayIdx in range(len(srcValues)):
+        srcRecords = records[records["srcIdx"] == arrayIdx]
+        result.uniqueMsgIDs.append(pd.unique(srcRecords["messageId"]).astype(object))
+
+        for msgID in result.uniqueMsgIDs[arrayIdx]:
+            set_ptp_msg_flag(result, msgID)
+            if(msgID not in PTP_STORE_DTYPES):
+                print_info(result, "unknown message ID: ", msgID)
+                continue
+            append_ptp_message_records(result, msgID, get_store_records(srcRecords[srcRecords["messageId"] == msgID], msgID), arrayIdx)
+
+    print_info(result, "Unique Msg IDs: ", [msgIDs.tolist() for msgIDs in result.uniqueMsgIDs])
+###----------------------------------------------------------------------------
+
+
+###----- records of the record store of decoded messages -----------------------
+# returns a structured array of dtype PTP_STORE_DTYPES[msgID]
+#
+# \param records ... structured array of dtype PTP_RECORD_DTYPE, holding messages of a single message type
+#
+# \param msgID   ... integer messageId of the PTP messages held by records
+def get_store_records(records, msgID):
+    storeRecords = np.empty(len(records), dtype = PTP_STORE_DTYPES[msgID])
+    for col in storeRecords.dtype.names:
+        if(col == "ts"):
+            storeRecords[col] = records["ts_s"].astype(np.int64) * NS_PER_S + records["ts_ns"].astype(np.int64)
+        elif(col == "naMask"):
+            # the mmap decoder reads every field from the packet
+            storeRecords[col] = 0
+        else:
+            storeRecords[col] = records[col]
+    return storeRecords
+###----------------------------------------------------------------------------
+
+
+###----- flight records of decoded messages -----------------------------------
+# returns a structured array of dtype FLIGHT_RECORD_DTYPE, see PtpFlightRecorder
+# - fields not held by the record store for the message type are marked within naMask, so batch and streaming contexts are identical, see PTP_STORE_DTYPES
+#
+# \param records ... structured array of dtype PTP_RECORD_DTYPE
+def get_flight_records(records):
+    flightRecords = np.empty(len(records), dtype = FLIGHT_RECORD_DTYPE)
+    noTS = ~np.isin(records["messageId"], list(PTP_TS_FIELDS))
+    noSeqID = (records["messageId"] == PTP_MTYPE_MANAGEMENT)
+    flightRecords["frameNum"] = records["frameNum"]
+    flightRecords["messageId"] = records["messageId"]
+    flightRecords["seqID"] = records["seqID"]
+    flightRecords["logMP"] = records["logMP"]
+    flightRecords["ts"] = records["ts_s"].astype(np.int64) * NS_PER_S + records["ts_ns"].astype(np.int64)
+    flightRecords["frameTime"] = records["frameTime"]
+    flightRecords["naMask"] = 0
+    for fieldIdx, col in enumerate(FLIGHT_NULLABLE_FIELDS):
+        flightRecords["naMask"] |= (noTS if(col in ("ts", "frameTime")) else noSeqID).astype(np.uint8) << fieldIdx
+    return flightRecords
+###----------------------------------------------------------------------------
+
+
+###----- flight records of the record store ------------------------------------
+# returns a structured array of dtype FLIGHT_RECORD_DTYPE, fields not held by the message type are marked within naMask
+#
+# \param records ... structured array of dtype PTP_STORE_DTYPES[msgID], see PtpRecordStore
+#
+# \param msgID   ... integer messageId of the PTP messages held by records
+def store_to_flight_records(records, msgID):
+    flightRecords = np.empty(len(records), dtype = FLIGHT_RECORD_DTYPE)
+    flightRecords["frameNum"] = records["frameNum"]
+    flightRecords["messageId"] = msgID
+    flightRecords["naMask"] = 0
+    for fieldIdx, col in enumerate(FLIGHT_NULLABLE_FIELDS):
+        if(col in records.dtype.names):
+            flightRecords[col] = records[col]
+            flightRecords["naMask"] |= get_store_na_mask(records, col).astype(np.uint8) << fieldIdx
+        else:
+            flightRecords[col] = 0
+            flightRecords["naMask"] |= np.uint8(1 << fieldIdx)
+    return flightRecords
+###----------------------------------------------------------------------------
+
+
+###----- store the results of a single data frame ----------------------------------
+# appends msg count, logMP, first/last ts and avg interval to the lists of the respective ptpMsgType
+# - shared by ptp_msg_type_specific_calcs() and the streaming analysis
+# - logMP, firstTS, lastTS and avgInterval are ignored for signalling/management messages
+#
+# \param numMsgs     ... number of messages within the data frame
+#
+# \param avgInterval ... avg interval in integer nanoseconds
+def append_ptp_msg_stats(result, ptpMsgType, numMsgs, logMP = None, firstTS = None, lastTS = None, avgInterval = None):
+    # TODO current special cases for signalling/management msgs, as they dont hold time stamps
+    if(ptpMsgType == PTP_MTYPE_SIGNALLING):
+        result.msgCountDF["Sig"] += numMsgs
+        return
+    elif(ptpMsgType == PTP_MTYPE_MANAGEMENT):
+        result.msgCountDF["Man"] += numMsgs
+        return
+
+    result.listFirstTS[ptpMsgType].append(firstTS)
+    result.listLastTS[ptpMsgType].append(lastTS)
+
+    # sync
+    if(ptpMsgType == PTP_MTYPE_SYNC):
+        result.msgCountDF["Sync"] += numMsgs
+        result.listSyncLogMP.append(logMP)
+        result.listSyncAvgInterval.append(avgInterval)
+
+    # delay request
+    elif(ptpMsgType == PTP_MTYPE_DELAY_REQ):
+        result.msgCountDF["DlyReq"] += numMsgs
+        result.listDlyReqLogMP.append(logMP)
+        result.listDlyReqAvgInterval.append(avgInterval)
+
+    # follow up
+    elif(ptpMsgType == PTP_MTYPE_FOLLOW_UP):
+        result.msgCountDF["FollUp"] += numMsgs
+        result.listFollUpLogMP.append(logMP)
+        result.listFollUpAvgInterval.append(avgInterval)
+
+    # delay response
+    elif(ptpMsgType == PTP_MTYPE_DELAY_RESP):
+        result.msgCountDF["DlyResp"] += numMsgs
+        result.listDlyRespLogMP.append(logMP)
+        result.listDlyRespAvgInterval.append(avgInterval)
+
+    # announce
+    elif(ptpMsgType == PTP_MTYPE_ANNOUNCE):
+        result.msgCountDF["Ann"] += numMsgs
+        result.listAnnLogMP.append(logMP)
+        result.listAnnAvgInterval.append(avgInterval)
+###--------------------------------------------------------------------------------
+
+
+###----- PTP message type specific calculations -----------------------------------
+# TODO determine sensible analysis for signnaling messages
+# TODO determine sensible analysis for management messages
+# PTP message type specific calculations
+# - get msg count
+# - get logMP of the first message, every message is checked per logMP segment, see analyze_logmp_segments()
+# - append calculated avgIntervall to list of respective ptpMsgType, see append_ptp_msg_stats()
+# - inter-arrival interval statistics, see calc_interval_stats()
+def ptp_msg_type_specific_calcs(result, ptpMsgType):
+    
+    
+    # iterate through the sources of the given message type
+    for arrayIdx in range(len(result.listSrcIdx[ptpMsgType])):
+        msgData = result.get_msg_data(ptpMsgType, arrayIdx)
+        # TODO current special cases for signalling/management msgs, as they dont hold time stamps
+        if(ptpMsgType == PTP_MTYPE_SIGNALLING or ptpMsgType == PTP_MTYPE_MANAGEMENT):
+            append_ptp_msg_stats(result, ptpMsgType, len(msgData))
+        else:
+            ### shared calculations
+            # ts is kept by the record store as int64 nanoseconds
+            # - missing timestamp fields are treated as zero and therefore reported by check_ts()
+            ts = msgData["ts"]
+
+            # get unique sequence IDs
+            msgTypeUniqueSeqID = len(pd.unique(msgData["seqID"]))
+            # print(msgTypeUniqueSeqID)
+
+            # get information about ts
+            firstTS = ts[0]
+            lastTS  = ts[-1]
+            diffTS  = lastTS - firstTS
+            # avg interval in integer nanoseconds
+            avgInterval = diffTS // msgTypeUniqueSeqID
+            
+            logMP = msgData.first_valid("logMP")
+            append_ptp_msg_stats(result, ptpMsgType, len(msgData), logMP, firstTS, lastTS, avgInterval)
+
+            # interval statistics based on capture times
+            calc_interval_stats(result, ptpMsgType, arrayIdx)
+###--------------------------------------------------------------------------------
+
+
+###----- expected interval of a message type --------------------------------------
+# returns 2**logMP in nanoseconds, None if logMP is outside of PTP_LOGMP_LIMITS of the message type
+#
+# \param msgID ... integer messageId
+#
+# \param logMP ... logMessagePeriod
+def get_expected_interval(msgID, logMP):
+    if(msgID not in PTP_LOGMP_LIMITS or logMP is None or pd.isna(logMP) == True):
+        return None
+    if(PTP_LOGMP_LIMITS[msgID][0] <= logMP <= PTP_LOGMP_LIMITS[msgID][1]):
+        return int(NS_PER_S * 2.0 ** float(logMP))
+    return None
+###--------------------------------------------------------------------------------
+
+
+###----- expected intervals of many messages --------------------------------------
+# vectorized get_expected_interval(), returns a float array holding 2**logMP in nanoseconds, NaN if unknown
+#
+# \param msgID  ... integer messageId
+#
+# \param logMPs ... logMessagePeriods, NaN for messages without
+def get_expected_intervals(msgID, logMPs):
+    logMPs = np.asarray(logMPs, dtype = np.float64)
+    if(msgID not in PTP_LOGMP_LIMITS):
+        return np.full(len(logMPs), np.nan)
+    withinLimits = (logMPs >= PTP_LOGMP_LIMITS[msgID][0]) & (logMPs <= PTP_LOGMP_LIMITS[msgID][1])
+    return np.where(withinLimits, NS_PER_S * 2.0 ** np.where(withinLimits, logMPs, 0.0), np.nan)
+###--------------------------------------------------------------------------------
+
+
+###----- check logMessagePeriods against the limits of a message type -------------
+# returns a bool array, True for a logMP within PTP_LOGMP_LIMITS or PTP_LOGMP_UNSPECIFIED
+# - message types without limits, e.g. signalling messages, are not checked
+#
+# \param msgID  ... integer messageId
+#
+# \param logMPs ... logMessagePeriods, NaN for messages without
+def is_valid_logmp(msgID, logMPs):
+    logMPs = np.asarray(logMPs, dtype = np.float64)
+    if(msgID not in PTP_LOGMP_LIMITS):
+        return np.ones(len(logMPs), dtype = bool)
+    return (~np.isnan(get_expected_intervals(msgID, logMPs))) | (logMPs == PTP_LOGMP_UNSPECIFIED)
+###--------------------------------------------------------------------------------
+
+
+###----- inter-arrival intervals of a single source and message type --------------
+# returns (intervals, prevIdx, msgIdx)
+# - intervals       ... differences of the capture times of consecutive messages, in nanoseconds
+# - prevIdx, msgIdx ... index of the messages an interval starts and ends with
+# - capture times are used, so a single bad PTP timestamp does not distort the intervals
+# - a message holding the same seqID as its predecessor is a duplicate and skipped
+#
+# \param frameTimes ... capture times in nanoseconds, in order of appearance
+#
+# \param seqIDs     ... seqIDs of the messages
+#
+# \param groups     ... None or one label per message, intervals are taken per group, see get_seq_id_groups()
+def calc_intervals(frameTimes, seqIDs, groups = None):
+    frameTimes = np.asarray(frameTimes, dtype = np.int64)
+    seqIDs = np.asarray(seqIDs, dtype = np.float64)
+    order = np.arange(len(frameTimes))
+    if(groups is None):
+        groupCodes = np.zeros(len(frameTimes), dtype = np.int64)
+    else:
+        groupCodes = pd.factorize(groups)[0]
+        order = np.argsort(groupCodes, kind = "stable")
+        frameTimes, seqIDs, groupCodes = frameTimes[order], seqIDs[order], groupCodes[order]
+
+    keep = np.ones(len(frameTimes), dtype = bool)
+    keep[1:] = (groupCodes[1:] != groupCodes[:-1]) | (seqIDs[1:] != seqIDs[:-1])
+    frameTimes, groupCodes, order = frameTimes[keep], groupCodes[keep], order[keep]
+    sameGroup = groupCodes[1:] == groupCodes[:-1]
+    return np.diff(frameTimes)[sameGroup], order[:-1][sameGroup], order[1:][sameGroup]
+###--------------------------------------------------------------------------------
+
+
+###----- compare intervals with the expected interval -----------------------------
+# returns (number of intervals below tolerance, number above tolerance, histogram counts), see INTERVAL_HISTOGRAM_EDGES
+# - all zero if the expected interval is unknown
+#
+# \param intervals ... intervals in nanoseconds, see calc_intervals()
+#
+# \param expected  ... expected interval in nanoseconds, see get_expected_interval(),
+#                      or one per interval, see analyze_logmp_segments(), intervals with NaN are not compared
+#
+# \param tolerance ... allowed relative deviation, e.g. 0.3 ... 30 %
+def classify_intervals(intervals, expected, tolerance):
+    histogram = np.zeros(len(INTERVAL_HISTOGRAM_LABELS), dtype = np.int64)
+    if(expected is None or len(intervals) == 0):
+        return 0, 0, histogram
+
+    relIntervals = intervals / expected
+    relIntervals = relIntervals[~np.isnan(relIntervals)]
+    below = int(np.count_nonzero(relIntervals < 1.0 - tolerance))
+    above = int(np.count_nonzero(relIntervals > 1.0 + tolerance))
+    binIdx = np.clip(np.searchsorted(INTERVAL_HISTOGRAM_EDGES, relIntervals, side = "right") - 1, 0, len(histogram) - 1)
+    histogram += np.bincount(binIdx, minlength = len(histogram))
+    return below, above, histogram
+###--------------------------------------------------------------------------------
+
+
+###----- logMessagePeriod segments of a single source and message type ------------
+# consecutive messages of a group holding the same logMP form a segment, a changed logMP starts a new one,
+# so every interval is compared with the expected interval 2**logMP of its own segment
+# - intervals spanning a logMP change are not compared, as the rate is changing within them
+# returns (segments, intervals, expected interval per interval), see calc_intervals()
+# the data frame of segments holds one row per segment, with the columns LOGMP_SEGMENT_COLUMNS
+# - group                 ... group label, None if no groups are given
+# - logMP, prevLogMP      ... logMP of the segment and of the previous segment of the group, <NA> for the first one
+# - valid                 ... logMP within PTP_LOGMP_LIMITS or PTP_LOGMP_UNSPECIFIED, see is_valid_logmp()
+# - count                 ... number of messages, duplicates included
+# - frameNum, frameNumEnd ... first and last message of the segment
+# - expected              ... expected interval in nanoseconds, <NA> if unknown
+# - intervals, mean       ... number and mean of the intervals within the segment
+# - below, above          ... number of intervals outside the tolerance of the expected interval
+#
+# \param msgID      ... integer messageId
+#
+# \param frameNums  ... frame numbers, in order of appearance
+#
+# \param logMPs     ... logMessagePeriods, NaN for messages without
+#
+# \param frameTimes ... capture times in nanoseconds
+#
+# \param seqIDs     ... seqIDs of the messages
+#
+# \param groups     ... None or one label per message, see get_seq_id_groups()
+#
+# \param tolerance  ... allowed relative deviation, e.g. 0.3 ... 30 %
+def analyze_logmp_segments(msgID, frameNums, logMPs, frameTimes, seqIDs, groups = None, tolerance = INTERVAL_DEFAULT_TOLERANCE):
+    frameNums = np.asarray(frameNums)
+    logMPs = np.asarray(logMPs, dtype = np.float64)
+    order = np.arange(len(logMPs))
+    if(groups is None):
+        groupCodes = np.zeros(len(logMPs), dtype = np.int64)
+        groupLabels = [None]
+    else:
+        groupCodes, groupLabels = pd.factorize(groups)
+        order = np.argsort(groupCodes, kind = "stable")
+
+    ### segment boundaries, messages without logMP form segments of their own
+    sortedCodes = groupCodes[order]
+    sortedLogMPs = np.nan_to_num(logMPs[order], nan = np.inf)
+    segStart = np.ones(len(order), dtype = bool)
+    segStart[1:] = (sortedCodes[1:] != sortedCodes[:-1]) | (sortedLogMPs[1:] != sortedLogMPs[:-1])
+    firstIdx = order[segStart]
+    lastIdx = order[np.append(segStart[1:], True)]
+    segIdx = np.empty(len(order), dtype = np.int64)
+    segIdx[order] = np.cumsum(segStart) - 1
+    numSegs = len(firstIdx)
+
+    segLogMPs = logMPs[firstIdx]
+    segExpected = get_expected_intervals(msgID, segLogMPs)
+    prevLogMPs = np.full(numSegs, np.nan)
+    sameGroup = groupCodes[firstIdx[1:]] == groupCodes[firstIdx[:-1]]
+    prevLogMPs[1:][sameGroup] = segLogMPs[:-1][sameGroup]
+
+    ### intervals compared with the expected interval of their segment
+    intervals, prevIdx, msgIdx = calc_intervals(frameTimes, seqIDs, groups)
+    intervalSegs = segIdx[msgIdx]
+    withinSeg = segIdx[prevIdx] == intervalSegs
+    expected = np.where(withinSeg, segExpected[intervalSegs], np.nan)
+    relIntervals = intervals / expected
+    numIntervals = np.bincount(intervalSegs[withinSeg], minlength = numSegs)
+    sumIntervals = np.bincount(intervalSegs[withinSeg], weights = intervals[withinSeg], minlength = numSegs)
+
+    segments = pd.DataFrame({"group":       [groupLabels[groupCode] for groupCode in groupCodes[firstIdx]],
+                             "logMP":       pd.array(segLogMPs, dtype = "Int64"),
+                             "prevLogMP":   pd.array(prevLogMPs, dtype = "Int64"),
+                             "valid":       is_valid_logmp(msgID, segLogMPs),
+                             "count":       np.bincount(segIdx, minlength = numSegs),
+                             "frameNum":    frameNums[firstIdx],
+                             "frameNumEnd": frameNums[lastIdx],
+                             "expected":    pd.array(segExpected, dtype = "Int64"),
+                             "intervals":   numIntervals,
+                             "mean":        np.divide(sumIntervals, numIntervals, out = np.full(numSegs, np.nan), where = numIntervals > 0),
+                             "below":       np.bincount(intervalSegs[relIntervals < 1.0 - tolerance], minlength = numSegs),
+                             "above":       np.bincount(intervalSegs[relIntervals > 1.0 + tolerance], minlength = numSegs)}, columns = LOGMP_SEGMENT_COLUMNS)
+    return segments, intervals, expected
+###--------------------------------------------------------------------------------
+
+
+###----- check for unexpected logMessagePeriods ------------------------------------
+# prints one warning per segment holding a logMP outside of PTP_LOGMP_LIMITS, counted as "LogMP"
+# - a changed but valid logMP is no warning, the segments are summarized within the final overview
+# returns the data frame of segments warned about
+#
+# \param segments       ... data frame created by analyze_logmp_segments()
+#
+# \param warningLog     ... PtpWarningLog of the result
+#
+# \param firstFrameNum  ... None or first frame of a chunk, segments starting before it continue
+#                           a segment that was checked already, used by the streaming analysis
+def check_logmp(segments, warningLog, firstFrameNum = None):
+    invalidSegments = segments[segments["valid"] == False]
+    if(firstFrameNum is not None):
+        invalidSegments = invalidSegments[invalidSegments["frameNum"] >= firstFrameNum]
+
+    for segment in invalidSegments.itertuples():
+        warningLog.add("LogMP", frameNum = segment.frameNum, frameNumEnd = segment.frameNumEnd, logMP = None if(pd.isna(segment.logMP)) else int(segment.logMP),
+                       messages = int(segment.count), requester = None if(segment.group is None) else format_port_identity(*segment.group))
+
+    return invalidSegments
+###--------------------------------------------------------------------------------
+
+
+###----- keep the logMP segments of a source and message type ---------------------
+# \param msgID    ... integer messageId
+#
+# \param srcIdx   ... index into uniqueSrcValues
+#
+# \param segments ... data frame created by analyze_logmp_segments()
+def append_logmp_segments(result, msgID, srcIdx, segments):
+    segments = segments.assign(messageId = msgID, srcIdx = srcIdx)[result.logMPSegmentsDF.columns]
+    if(len(result.logMPSegmentsDF) == 0):
+        result.logMPSegmentsDF = segments.reset_index(drop = True)
+    else:
+        result.logMPSegmentsDF = pd.concat([result.logMPSegmentsDF, segments], ignore_index = True)
+###--------------------------------------------------------------------------------
+
+
+###----- append a row to the interval statistics ----------------------------------
+# \param statsRow ... dict holding the columns INTERVAL_STATS_COLUMNS
+def append_interval_stats(result, statsRow):
+    statsRow = pd.DataFrame([statsRow], columns = INTERVAL_STATS_COLUMNS)
+    if(len(result.intervalStatsDF) == 0):
+        result.intervalStatsDF = statsRow
+    else:
+        result.intervalStatsDF = pd.concat([result.intervalStatsDF, statsRow], ignore_index = True)
+###--------------------------------------------------------------------------------
+
+
+###----- interval statistics of a single data frame -------------------------------
+# appends one row to result.intervalStatsDF, holding count, min, max, mean, std and percentiles of the intervals,
+# the number of intervals outside result.intervalTolerance of 2**logMP and the histogram relative to 2**logMP
+# - in nanoseconds, mean/std/percentiles as float
+# - every interval is compared with the logMP of its segment, the reported expected interval is the one of the first logMP
+# - the logMP segments are appended to result.logMPSegmentsDF
+#
+# \param ptpMsgType ... integer messageId
+#
+# \param arrayIdx   ... index into result.listSrcIdx[ptpMsgType]
+def calc_interval_stats(result, ptpMsgType, arrayIdx):
+    msgData = result.get_msg_data(ptpMsgType, arrayIdx)
+    srcIdx = result.listSrcIdx[ptpMsgType][arrayIdx]
+    segments, intervals, expected = analyze_logmp_segments(ptpMsgType, msgData["frameNum"], msgData["logMP"], msgData["frameTime"], msgData["seqID"],
+                                                           get_seq_id_groups(msgData, ptpMsgType), result.intervalTolerance)
+    append_logmp_segments(result, ptpMsgType, srcIdx, segments)
+    below, above, histogram = classify_intervals(intervals, expected, result.intervalTolerance)
+
+    statsRow = {"messageId": ptpMsgType,
+                "srcIdx":    srcIdx,
+                "count":     len(intervals),
+                "expected":  get_expected_interval(ptpMsgType, msgData.first_valid("logMP")),
+                "below":     below,
+                "above":     above}
+    if(len(intervals) > 0):
+        statsRow.update({"min":  intervals.min(),
+                         "max":  intervals.max(),
+                         "mean": intervals.mean(),
+                         "std":  intervals.std()})
+        for percentile, percentileValue in zip(INTERVAL_PERCENTILES, np.percentile(intervals, INTERVAL_PERCENTILES)):
+            statsRow["p" + str(percentile)] = percentileValue
+    statsRow.update(zip(INTERVAL_HISTOGRAM_LABELS, histogram))
+    append_interval_stats(result, statsRow)
+###--------------------------------------------------------------------------------
+
+
+###----- convert a flags column to integers ---------------------------------------
+# the tshark/native decoders report ptp.v2.flags as hex string, the mmap decoder as integer
+# - only the few distinct values are converted, not every row
+def flags_to_int(flags):
+    if(pd.api.types.is_numeric_dtype(flags) == True):
+        return flags.fillna(0).astype("int64")
+    flags = flags.fillna("0x0").astype(object)
+    return flags.map({flagStr: int(flagStr, 16) for flagStr in pd.unique(flags)}).astype("int64")
+###--------------------------------------------------------------------------------
+
+
+###----- convert a clock identity column to integers ------------------------------
+# the tshark/native decoders report clock identities as hex string, e.g. "0x001122fffe334455"
+# - returns a uint64 array, missing clock identities are zero
+# - only the distinct values are converted, not every row
+def clock_ids_to_int(clockIds):
+    if(pd.api.types.is_numeric_dtype(clockIds) == True):
+        return clockIds.fillna(0).to_numpy(dtype = np.uint64)
+    clockIds = clockIds.fillna("0x0").astype(str)
+    return clockIds.map({clockIdStr: int(clockIdStr.replace(":", ""), 16) for clockIdStr in pd.unique(clockIds)}).to_numpy(dtype = np.uint64)
+###--------------------------------------------------------------------------------
+
+
+###----- collect the messages of one type for pairing -----------------------------
+# returns a single data frame holding the messages of all sources, ordered by frameNum, with the columns
+# - frameNum, srcIdx, seqID, frameTime ... as extracted
+# - ts                                 ... PTP timestamp, see ptp_msg_type_specific_calcs()
+# - clockId, portId                    ... port identity the message is paired by
+# - seqEpoch                           ... number of seqID wrap-arounds of this port identity so far
+# - occurrence                         ... number of earlier messages with the same key, e.g. for duplicated captures
+#
+# \param ptpMsgType ... integer messageId
+#
+# \param clockCol   ... column holding the clock identity to pair by
+#
+# \param portCol    ... column holding the port number to pair by
+def collect_pairing_data(result, ptpMsgType, clockCol = "clockId", portCol = "portId"):
+    pairData = pd.DataFrame({"frameNum":  pd.Series(dtype = "int64"),
+                             "srcIdx":    pd.Series(dtype = "int64"),
+                             "flags":     pd.Series(dtype = "int64"),
+                             "seqID":     pd.Series(dtype = "int64"),
+                             "frameTime": pd.Series(dtype = "int64"),
+                             "ts":        pd.Series(dtype = "int64"),
+                             "clockId":   pd.Series(dtype = "uint64"),
+                             "portId":    pd.Series(dtype = "int64")})
+    if(len(result.listSrcIdx[ptpMsgType]) > 0):
+        msgDataList = [result.get_msg_data(ptpMsgType, arrayIdx).records for arrayIdx in range(len(result.listSrcIdx[ptpMsgType]))]
+        pairData = pd.concat([pd.DataFrame({"frameNum":  msgData["frameNum"],
+                                            "srcIdx":    result.listSrcIdx[ptpMsgType][arrayIdx],
+                                            "flags":     msgData["flags"].astype(np.int64),
+                                            "seqID":     np.where(get_store_na_mask(msgData, "seqID"), -1, msgData["seqID"]).astype(np.int64),
+                                            "frameTime": msgData["frameTime"],
+                                            "ts":        msgData["ts"],
+                                            "clockId":   msgData[clockCol],
+                                            "portId":    np.where(get_store_na_mask(msgData, portCol), -1, msgData[portCol]).astype(np.int64)})
+                              for arrayIdx, msgData in enumerate(msgDataList)], ignore_index = True)
+        pairData = pairData.sort_values("frameNum", kind = "stable", ignore_index = True)
+
+    portGroups = pairData.groupby(["clockId", "portId"], sort = False)
+    seqWrap = portGroups["seqID"].diff() < -PTP_SEQ_ID_WRAP_THRESHOLD
+    pairData["seqEpoch"] = seqWrap.astype("int64").groupby([pairData["clockId"], pairData["portId"]], sort = False).cumsum()
+    pairData["occurrence"] = pairData.groupby(["clockId", "portId", "seqEpoch", "seqID"], sort = False).cumcount()
+    return pairData
+###--------------------------------------------------------------------------------
+
+
+###----- pair requests with their responses ---------------------------------------
+# hash join of both message types by port identity and sequenceId, linear in the number of messages
+# returns a data frame holding one row per pair or unmatched message, with the columns
+# - clockId, portId, seqEpoch, seqID, occurrence    ... join keys, see collect_pairing_data()
+# - frameNumReq, srcIdxReq, frameTimeReq, tsReq     ... request, <NA> for unmatched responses
+# - frameNumResp, srcIdxResp, frameTimeResp, tsResp ... response, <NA> for unmatched requests
+# - latency                                         ... frameTimeResp - frameTimeReq in nanoseconds, <NA> for unmatched messages
+# - pairState                                       ... "both", "left_only" (unmatched request) or "right_only" (unmatched response)
+#
+# \param reqData  ... requests, see collect_pairing_data()
+#
+# \param respData ... responses, see collect_pairing_data()
+def pair_ptp_messages(reqData, respData):
+    valueColumns = ["frameNum", "srcIdx", "frameTime", "ts"]
+    # an empty side has no clock identities to infer the key type from
+    if(len(reqData) == 0):
+        reqData = reqData.astype({"clockId": respData["clockId"].dtype})
+    elif(len(respData) == 0):
+        respData = respData.astype({"clockId": reqData["clockId"].dtype})
+    # nullable before the merge, unmatched rows would otherwise turn the nanosecond columns into float64 and round them
+    valueTypes = {col: "Int64" for col in valueColumns}
+    pairDF = pd.merge(reqData[PAIR_KEY_COLUMNS + valueColumns].astype(valueTypes), respData[PAIR_KEY_COLUMNS + valueColumns].astype(valueTypes),
+                      how = "outer", on = PAIR_KEY_COLUMNS, suffixes = ("Req", "Resp"), indicator = "pairState", sort = False)
+    pairDF["latency"] = pairDF["frameTimeResp"] - pairDF["frameTimeReq"]
+    pairDF["pairState"] = pairDF["pairState"].astype(str)
+    # order by the first frame of every pair
+    pairDF["frameNum"] = pairDF["frameNumReq"].fillna(pairDF["frameNumResp"])
+    return pairDF.sort_values("frameNum", kind = "stable", ignore_index = True).drop(columns = "frameNum")
+###--------------------------------------------------------------------------------
+
+
+###----- pair Sync/FollowUp and DlyReq/DlyResp messages ---------------------------
+# - Sync messages are only paired if their two-step flag is set, one-step Syncs have no FollowUp
+# - DlyReq messages are paired by their sending port, DlyResp messages by the requesting port they answer
+def run_ptp_pairing(result):
+    if(result.msgFlagSync == True or result.msgFlagFollUp == True):
+        syncData = collect_pairing_data(result, PTP_MTYPE_SYNC)
+        syncData = syncData[(syncData["flags"] & PTP_FLAG_TWO_STEP) != 0]
+        result.pairSyncFollUpDF = pair_ptp_messages(syncData, collect_pairing_data(result, PTP_MTYPE_FOLLOW_UP))
+
+    if(result.msgFlagDlyReq == True or result.msgFlagDlyResp == True):
+        result.pairDlyReqRespDF = pair_ptp_messages(collect_pairing_data(result, PTP_MTYPE_DELAY_REQ),
+                                                    collect_pairing_data(result, PTP_MTYPE_DELAY_RESP, "reqClockId", "reqPortId"))
+###--------------------------------------------------------------------------------
+
+
+###----- t1/t2 of all Sync messages -----------------------------------------------
+# returns a data frame holding one row per Sync, ordered by t2, with the columns
+# - srcIdx       ... source of the Sync, i.e. the master
+# - syncFrameNum ... frame number of the Sync
+# - t1           ... origin time at the master, preciseOriginTimestamp of the FollowUp for two-step Syncs
+# - t2           ... capture time of the Sync
+# - two-step Syncs without FollowUp are left out
+# - Syncs with a zero t1 or a t1 out of order with a neighbouring Sync of the same master are left out, they would distort every exchange
+#   combined with them, the wrong one of two Syncs out of order cannot be told apart, so both are left out
+def collect_sync_times(result):
+    syncData = collect_pairing_data(result, PTP_MTYPE_SYNC)
+    oneStep = syncData[(syncData["flags"] & PTP_FLAG_TWO_STEP) == 0]
+    syncTimes = [pd.DataFrame({"srcIdx":       oneStep["srcIdx"].to_numpy(),
+                               "syncFrameNum": oneStep["frameNum"].to_numpy(),
+                               "t1":           oneStep["ts"].to_numpy(),
+                               "t2":           oneStep["frameTime"].to_numpy()})]
+    if(result.pairSyncFollUpDF is not None):
+        twoStep = result.pairSyncFollUpDF[result.pairSyncFollUpDF["pairState"] == "both"]
+        syncTimes.append(pd.DataFrame({"srcIdx":       twoStep["srcIdxReq"].to_numpy("int64"),
+                                       "syncFrameNum": twoStep["frameNumReq"].to_numpy("int64"),
+                                       "t1":           twoStep["tsResp"].to_numpy("int64"),
+                                       "t2":           twoStep["frameTimeReq"].to_numpy("int64")}))
+    syncTimes = pd.concat(syncTimes, ignore_index = True).sort_values("t2", kind = "stable", ignore_index = True)
+    syncTimes = syncTimes[syncTimes["t1"] > 0].reset_index(drop = True)
+
+    ### t1 has to increase from Sync to Sync of the same master, checked in order of t2
+    srcIdxs = syncTimes["srcIdx"].to_numpy()
+    order = np.argsort(srcIdxs, kind = "stable")
+    sortedT1 = syncTimes["t1"].to_numpy("int64")[order]
+    outOfOrder = (srcIdxs[order][1:] == srcIdxs[order][:-1]) & (sortedT1[1:] <= sortedT1[:-1])
+    dropSync = np.zeros(len(order), dtype = bool)
+    dropSync[order[:-1][outOfOrder]] = True
+    dropSync[order[1:][outOfOrder]] = True
+    return syncTimes[~dropSync].reset_index(drop = True)
+###--------------------------------------------------------------------------------
+
+
+###----- capture clock estimate of offset and mean path delay --------------------
+# every DlyReq/DlyResp pair is combined with the latest Sync of the same master captured before the DlyReq
+# - t1 ... origin time of the Sync at the master, see collect_sync_times()
+# - t2 ... capture time of the Sync
+# - t3 ... capture time of the DlyReq
+# - t4 ... receive time of the DlyReq at the master, receiveTimestamp of the DlyResp
+# t2 and t3 are capture times, the capture clock stands in for the slave clock, so both quantities are capture clock estimates:
+# the offset is the one of the capturing node, not the offset from master of the slave,
+# the mean path delay is not affected by a constant offset of the capture clock, it is only the one of the slave if the capture was taken there
+# - exchanges with a zero t4 are left out, so are Syncs with an implausible t1, see collect_sync_times()
+#
+# fills result.offsetDelayDF with one row per exchange, ordered by t3, with the columns
+# - clockId, portId             ... port identity of the slave
+# - srcIdx, slaveSrcIdx         ... source of the master and the slave
+# - frameNumReq, frameNumResp   ... frame numbers of DlyReq and DlyResp
+# - syncFrameNum                ... frame number of the Sync used
+# - t1, t2, t3, t4              ... in nanoseconds
+# - delay                       ... mean path delay ((t2 - t1) + (t4 - t3)) / 2 in nanoseconds
+# - captureOffset               ... offset of the capture clock from the master ((t2 - t1) - (t4 - t3)) / 2 in nanoseconds
+def calc_offset_delay(result):
+    if(result.pairDlyReqRespDF is None or result.msgFlagSync == False):
+        return
+
+    syncTimes = collect_sync_times(result)
+    # joined by a copy of t2, the values are kept as nullable integers, exchanges without preceding Sync would turn them into float otherwise
+    syncTimes["syncTime"] = syncTimes["t2"]
+    syncTimes = syncTimes.astype({"syncFrameNum": "Int64", "t1": "Int64", "t2": "Int64"})
+    dlyPairs = result.pairDlyReqRespDF[result.pairDlyReqRespDF["pairState"] == "both"]
+    dlyPairs = dlyPairs[dlyPairs["tsResp"] > 0]
+    exchanges = pd.DataFrame({"clockId":      dlyPairs["clockId"].to_numpy(),
+                              "portId":       dlyPairs["portId"].to_numpy(),
+                              "srcIdx":       dlyPairs["srcIdxResp"].to_numpy("int64"),
+                              "slaveSrcIdx":  dlyPairs["srcIdxReq"].to_numpy("int64"),
+                              "frameNumReq":  dlyPairs["frameNumReq"].to_numpy("int64"),
+                              "frameNumResp": dlyPairs["frameNumResp"].to_numpy("int64"),
+                              "t3":           dlyPairs["frameTimeReq"].to_numpy("int64"),
+                              "t4":           dlyPairs["tsResp"].to_numpy("int64")})
+    exchanges = exchanges.sort_values("t3", kind = "stable", ignore_index = True)
+
+    offsetDelayDF = pd.merge_asof(exchanges, syncTimes, left_on = "t3", right_on = "syncTime", by = "srcIdx", direction = "backward")
+    offsetDelayDF = offsetDelayDF.dropna(subset = ["t1"]).astype({"syncFrameNum": "int64", "t1": "int64", "t2": "int64"})
+    offsetDelayDF = offsetDelayDF[["clockId", "portId", "srcIdx", "slaveSrcIdx", "frameNumReq", "frameNumResp", "syncFrameNum", "t1", "t2", "t3", "t4"]].reset_index(drop = True)
+
+    masterToSlave = offsetDelayDF["t2"] - offsetDelayDF["t1"]
+    slaveToMaster = offsetDelayDF["t4"] - offsetDelayDF["t3"]
+    offsetDelayDF["delay"] = (masterToSlave + slaveToMaster) // 2
+    offsetDelayDF["captureOffset"] = (masterToSlave - slaveToMaster) // 2
+
+    result.offsetDelayDF = offsetDelayDF
+    result.offsetDelayStatsDF = calc_offset_delay_stats(offsetDelayDF)
+###--------------------------------------------------------------------------------
+
+
+###----- summary statistics of capture clock offset and mean path delay ----------
+# returns a data frame holding one row per slave port identity and quantity ("delay", "captureOffset"), with the columns
+# - clockId, portId, slaveSrcIdx, quantity
+# - count, mean, std, min, max and p<N> for every N within SERVO_PERCENTILES, in nanoseconds, all but std rounded to integers
+# - withheld ... None or the reason the statistics of the slave are not meaningful, both rows of the slave hold the same value
+#   "timescale" ... the mean capture clock offset exceeds SERVO_MAX_CAPTURE_OFFSET_NS
+#   "negativeDelay" ... the mean path delay is negative, the capture was not taken at the slave
+#
+# \param offsetDelayDF ... data frame created by calc_offset_delay()
+def calc_offset_delay_stats(offsetDelayDF):
+    statsRows = []
+    for (clockId, portId), slaveDF in offsetDelayDF.groupby(["clockId", "portId"], sort = False):
+        slaveRows = []
+        for quantity in ("delay", "captureOffset"):
+            values = slaveDF[quantity].to_numpy()
+            # relative to the minimum, offsets of a capture clock far off the master would lose their nanoseconds as float otherwise
+            minValue = values.min()
+            relValues = (values - minValue).astype(np.float64)
+            statsRow = {"clockId":     clockId,
+                        "portId":      portId,
+                        "slaveSrcIdx": slaveDF["slaveSrcIdx"].iat[0],
+                        "quantity":    quantity,
+                        "count":       len(values),
+                        "mean":        minValue + int(round(relValues.mean())),
+                        "std":         relValues.std(),
+                        "min":         minValue,
+                        "max":         values.max()}
+            for percentile, percentileValue in zip(SERVO_PERCENTILES, np.percentile(relValues, SERVO_PERCENTILES)):
+                statsRow["p" + str(percentile)] = minValue + int(round(percentileValue))
+            slaveRows.append(statsRow)
+
+        withheld = None
+        if(abs(slaveRows[1]["mean"]) > SERVO_MAX_CAPTURE_OFFSET_NS):
+            withheld = "timescale"
+        elif(slaveRows[0]["mean"] < 0):
+            withheld = "negativeDelay"
+        for statsRow in slaveRows:
+            statsRow["withheld"] = withheld
+        statsRows += slaveRows
+    return pd.DataFrame(statsRows, columns = ["clockId", "portId", "slaveSrcIdx", "quantity", "count", "mean", "std", "min", "max"] + ["p" + str(percentile) for percentile in SERVO_PERCENTILES] + ["withheld"])
+###--------------------------------------------------------------------------------
+
+
+###----- check the seqIDs of a single data frame ----------------------------------
+# see check_seq_id(), the runs found are kept within result.seqIDRunsDF
+#
+# \param msgID    ... integer messageId
+#
+# \param arrayIdx ... index into result.listSrcIdx[msgID]
+def check_msg_seq_ids(result, msgID, arrayIdx):
+    msgData = result.get_msg_data(msgID, arrayIdx)
+    seqIDRuns = check_seq_id(msgData, result.warningLog, get_seq_id_groups(msgData, msgID), msgID)
+    append_seq_id_runs(result, msgID, result.listSrcIdx[msgID][arrayIdx], seqIDRuns)
+###--------------------------------------------------------------------------------
+
+
+###----- check the logMP segments of a single data frame ----------------------------
+# the segments are created by calc_interval_stats(), see check_logmp()
+#
+# \param msgID    ... integer messageId
+#
+# \param arrayIdx ... index into result.listSrcIdx[msgID]
+def check_msg_logmp(result, msgID, arrayIdx):
+    segments = result.logMPSegmentsDF
+    segments = segments[(segments["messageId"] == msgID) & (segments["srcIdx"] == result.listSrcIdx[msgID][arrayIdx])]
+    check_logmp(segments, result.warningLog)
+###--------------------------------------------------------------------------------
+
+
+###----- print warning overview ---------------------------------------------------
+# check for potential reasons to print a warning, like
+# - Zero TS
+# - Negative TS
+# - Backwards TS between two following Messages
+# - Irregular seqIDs of all message types
+# - logMP outside of the limits of a message type
+# - Not yet defined reasons due to unknown problems
+def print_warning_overview(result):
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "--- Warning(s) -----------------------------------------------------")
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- Sync -")
+    if(result.msgFlagSync == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_SYNC])):
+            result.warningLog.set_source(PTP_MTYPE_SYNC, result.listSrcIdx[PTP_MTYPE_SYNC][arrayIdx])
+            check_ts(result.get_msg_data(PTP_MTYPE_SYNC, arrayIdx), result.warningLog)
+            check_msg_seq_ids(result, PTP_MTYPE_SYNC, arrayIdx)
+            check_msg_logmp(result, PTP_MTYPE_SYNC, arrayIdx)
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- DlyReq -")
+    if(result.msgFlagDlyReq == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_DELAY_REQ])):
+            result.warningLog.set_source(PTP_MTYPE_DELAY_REQ, result.listSrcIdx[PTP_MTYPE_DELAY_REQ][arrayIdx])
+            check_ts(result.get_msg_data(PTP_MTYPE_DELAY_REQ, arrayIdx), result.warningLog)
+            # find possible seqID irregularities
+            check_msg_seq_ids(result, PTP_MTYPE_DELAY_REQ, arrayIdx)
+            check_msg_logmp(result, PTP_MTYPE_DELAY_REQ, arrayIdx)
+            # compare number of DlyReq and DlyResp messages
+            check_dly_cnt_mismatch(result, PTP_MTYPE_DELAY_REQ)
+
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- FollowUp -")
+    if(result.msgFlagFollUp == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_FOLLOW_UP])):
+            result.warningLog.set_source(PTP_MTYPE_FOLLOW_UP, result.listSrcIdx[PTP_MTYPE_FOLLOW_UP][arrayIdx])
+            check_ts(result.get_msg_data(PTP_MTYPE_FOLLOW_UP, arrayIdx), result.warningLog)
+            check_msg_seq_ids(result, PTP_MTYPE_FOLLOW_UP, arrayIdx)
+            check_msg_logmp(result, PTP_MTYPE_FOLLOW_UP, arrayIdx)
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- DlyResp -")
+    if(result.msgFlagDlyResp == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_DELAY_RESP])):
+            result.warningLog.set_source(PTP_MTYPE_DELAY_RESP, result.listSrcIdx[PTP_MTYPE_DELAY_RESP][arrayIdx])
+            check_ts(result.get_msg_data(PTP_MTYPE_DELAY_RESP, arrayIdx), result.warningLog)
+            # find possible seqID irregularities, per requesting port identity
+            check_msg_seq_ids(result, PTP_MTYPE_DELAY_RESP, arrayIdx)
+            check_msg_logmp(result, PTP_MTYPE_DELAY_RESP, arrayIdx)
+            # compare number of DlyReq and DlyResp messages
+            check_dly_cnt_mismatch(result, PTP_MTYPE_DELAY_RESP)
+                
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- Ann -")
+    if(result.msgFlagAnn == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_ANNOUNCE])):
+            result.warningLog.set_source(PTP_MTYPE_ANNOUNCE, result.listSrcIdx[PTP_MTYPE_ANNOUNCE][arrayIdx])
+            check_ts(result.get_msg_data(PTP_MTYPE_ANNOUNCE, arrayIdx), result.warningLog)
+            check_msg_seq_ids(result, PTP_MTYPE_ANNOUNCE, arrayIdx)
+            check_msg_logmp(result, PTP_MTYPE_ANNOUNCE, arrayIdx)
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- Sig -")
+    if(result.msgFlagSig == True):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_SIGNALLING])):
+            result.warningLog.set_source(PTP_MTYPE_SIGNALLING, result.listSrcIdx[PTP_MTYPE_SIGNALLING][arrayIdx])
+            check_msg_seq_ids(result, PTP_MTYPE_SIGNALLING, arrayIdx)
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "- Pairing -")
+    result.warningLog.set_source(None, None)
+    if(result.pairSyncFollUpDF is not None):
+        check_ptp_pairs(result, result.pairSyncFollUpDF, "Sync", "FollowUp", PAIR_LATE_FOLLOW_UP_NS)
+    if(result.pairDlyReqRespDF is not None):
+        check_ptp_pairs(result, result.pairDlyReqRespDF, "DlyReq", "DlyResp", PAIR_LATE_DELAY_RESP_NS)
+    result.warningLog.print_suppressed()
+    print_info(result, "--------------------------------------------------------------------")
+###-------------------------------------------------------------------------------- 
+
+
+###----- print final overview -----------------------------------------------------
+def print_final_overview(result):
+    
+    print("--- Msg Type Specific Overview -------------------------------------")
+    ### Sync Message Overview
+    if(result.msgFlagSync == True):
+        ### display actual results
+        print("--------------------------------------------------------------------")
+        print("--- sync info ---")
+
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_SYNC])):
+            print("")
+            print("src:", str(result.get_src_value(PTP_MTYPE_SYNC, arrayIdx)))
+            ### expected avg interval VS actual avg interval
+            # result.listSyncLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
+            firstTS = result.listFirstTS[PTP_MTYPE_SYNC][arrayIdx]
+            lastTS = result.listLastTS[PTP_MTYPE_SYNC][arrayIdx]
+            print("first ts:", format_ts_ns(firstTS), "s")
+            print("last ts: ", format_ts_ns(lastTS), "s")
+            syncAvgIntervalExpected = get_expected_interval(PTP_MTYPE_SYNC, result.listSyncLogMP[arrayIdx])
+            if(syncAvgIntervalExpected != None):
+                syncExpectedNumMsgs = (lastTS - firstTS) / syncAvgIntervalExpected
+                print("Sync Log MP:", result.listSyncLogMP[arrayIdx])
+                print("Expected Num Sync Msgs: ", syncExpectedNumMsgs) # FIXME leave it like this or add number to a second row in result.msgCountDF
+                print("Expected Avg Sync Interval:  ", format_ts_ns(syncAvgIntervalExpected), "s")
+                print("Calculated Avg Sync Interval:", format_ts_ns(result.listSyncAvgInterval[arrayIdx]), "s")
+            elif(result.listSyncLogMP[arrayIdx] == PTP_LOGMP_UNSPECIFIED):
+                print("Sync LogMP:", result.listSyncLogMP[arrayIdx], "(unspecified)")
+            else:
+                print("Unexpected Log MP:", result.listSyncLogMP[arrayIdx])
+       
+    ### DelayReq Message Overview 
+    if(result.msgFlagDlyReq == True):
+        ### display actual results
+        print("--------------------------------------------------------------------")
+        print("--- dely req info ---")
+
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_DELAY_REQ])):
+            print("")
+            print("src:", str(result.get_src_value(PTP_MTYPE_DELAY_REQ, arrayIdx)))
+            ### expected avg interval VS actual avg interval
+            # result.listDlyReqLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
+            print("first ts:", format_ts_ns(result.listFirstTS[PTP_MTYPE_DELAY_REQ][arrayIdx]), "s")
+            print("last ts: ", format_ts_ns(result.listLastTS[PTP_MTYPE_DELAY_REQ][arrayIdx]), "s")
+            dlyReqAvgIntervalExpected = get_expected_interval(PTP_MTYPE_DELAY_REQ, result.listDlyReqLogMP[arrayIdx])
+            if(dlyReqAvgIntervalExpected != None):
+                print("DlyReq LogMP:", result.listDlyReqLogMP[arrayIdx])
+                print("Expected Avg DlyReq Interval:  ", format_ts_ns(dlyReqAvgIntervalExpected), "s")
+            elif(result.listDlyReqLogMP[arrayIdx] == PTP_LOGMP_UNSPECIFIED):
+                print("DlyReq LogMP:", result.listDlyReqLogMP[arrayIdx], "(unspecified)")
+            else:
+                print("Unexpected Log MP:", result.listDlyReqLogMP[arrayIdx])
+            print("Calculated Avg DlyReq Interval:", format_ts_ns(result.listDlyReqAvgInterval[arrayIdx]), "s")
+    
+    ### Follow Up Message Overview
+    if(result.msgFlagFollUp == True):
+        ### display actual results
+        print("--------------------------------------------------------------------")
+        print("--- follow up info ---")
+
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_FOLLOW_UP])):
+            print("")
+            print("src:", str(result.get_src_value(PTP_MTYPE_FOLLOW_UP, arrayIdx)))
+            ### expected avg interval VS actual avg interval
+            # result.listFollUpLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
+            print("first ts:", format_ts_ns(result.listFirstTS[PTP_MTYPE_FOLLOW_UP][arrayIdx]), "s")
+            print("last ts: ", format_ts_ns(result.listLastTS[PTP_MTYPE_FOLLOW_UP][arrayIdx]), "s")
+            follUpAvgIntervalExpected = get_expected_interval(PTP_MTYPE_FOLLOW_UP, result.listFollUpLogMP[arrayIdx])
+            if(follUpAvgIntervalExpected != None):
+                print("FollUp LogMP:", result.listFollUpLogMP[arrayIdx])
+                print("Expected Avg FollUp Interval:  ", format_ts_ns(follUpAvgIntervalExpected), "s")
+            elif(result.listFollUpLogMP[arrayIdx] == PTP_LOGMP_UNSPECIFIED):
+                print("FollUp LogMP:", result.listFollUpLogMP[arrayIdx], "(unspecified)")
+            else:
+                print("Unexpected Log MP:", result.listFollUpLogMP[arrayIdx])
+            print("Calculated Avg FollUp Interval:", format_ts_ns(result.listFollUpAvgInterval[arrayIdx]), "s")
+    
+    ### DelayResp Message Overview
+    if(result.msgFlagDlyResp == True):
+        ### display actual results
+        print("--------------------------------------------------------------------")
+        print("--- delay response info ---")
+
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_DELAY_RESP])):
+            print("")
+            print("src:", str(result.get_src_value(PTP_MTYPE_DELAY_RESP, arrayIdx)))
+            ### expected avg interval VS actual avg interval
+            # result.listDlyRespLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
+            print("first ts:", format_ts_ns(result.listFirstTS[PTP_MTYPE_DELAY_RESP][arrayIdx]), "s")
+            print("last ts: ", format_ts_ns(result.listLastTS[PTP_MTYPE_DELAY_RESP][arrayIdx]), "s")
+            dlyRespAvgIntervalExpected = get_expected_interval(PTP_MTYPE_DELAY_RESP, result.listDlyRespLogMP[arrayIdx])
+            if(dlyRespAvgIntervalExpected != None):
+                print("DlyResp LogMP:", result.listDlyRespLogMP[arrayIdx])
+                print("Expected Avg DlyResp Interval:  ", format_ts_ns(dlyRespAvgIntervalExpected), "s")
+            elif(result.listDlyRespLogMP[arrayIdx] == PTP_LOGMP_UNSPECIFIED):
+                print("DlyResp LogMP:", result.listDlyRespLogMP[arrayIdx], "(unspecified)")
             else:
-                print("Unexpected Log MP:", listDlyRespLogMP[arrayIdx])
-            print("Calculated Avg DlyResp Interval:", listDlyRespAvgInterval[arrayIdx], "s")
+                print("Unexpected Log MP:", result.listDlyRespLogMP[arrayIdx])
+            print("Calculated Avg DlyResp Interval:", format_ts_ns(result.listDlyRespAvgInterval[arrayIdx]), "s")
     
     ### Announce Message Overview
-    if(msgFlagAnn == True):
+    if(result.msgFlagAnn == True):
         ### display actual results
         print("--------------------------------------------------------------------")
         print("--- announce info ---")
 
-        for arrayIdx in range(len(listAnnDF)):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_ANNOUNCE])):
             print("")
-            print("src:", str(uniqueSrcValues[arrayIdx]))
+            print("src:", str(result.get_src_value(PTP_MTYPE_ANNOUNCE, arrayIdx)))
             ### expected avg interval VS actual avg interval
-            # listAnnLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
-            annAvgIntervalExpected = 0.0
-            print("first ts:", listAnnDF[arrayIdx]["ts"][listAnnDF[arrayIdx]["ts"].first_valid_index()], "s")
-            print("last ts: ", listAnnDF[arrayIdx]["ts"][listAnnDF[arrayIdx]["ts"].last_valid_index()], "s")
-            if(-7 <= listAnnLogMP[arrayIdx] <= 4): # FIXME magic numbers for limits
-                print("Ann LogMP:", listAnnLogMP[arrayIdx])
-                annAvgIntervalExpected = 2.0 ** float(listAnnLogMP[arrayIdx])
-                print("Expected Avg Ann Interval:  ", annAvgIntervalExpected, "s")
+            # result.listAnnLogMP[arrayIdx] = 127 # FIXME inserting LogMP for tests
+            print("first ts:", format_ts_ns(result.listFirstTS[PTP_MTYPE_ANNOUNCE][arrayIdx]), "s")
+            print("last ts: ", format_ts_ns(result.listLastTS[PTP_MTYPE_ANNOUNCE][arrayIdx]), "s")
+            annAvgIntervalExpected = get_expected_interval(PTP_MTYPE_ANNOUNCE, result.listAnnLogMP[arrayIdx])
+            if(annAvgIntervalExpected != None):
+                print("Ann LogMP:", result.listAnnLogMP[arrayIdx])
+                print("Expected Avg Ann Interval:  ", format_ts_ns(annAvgIntervalExpected), "s")
+            elif(result.listAnnLogMP[arrayIdx] == PTP_LOGMP_UNSPECIFIED):
+                print("Ann LogMP:", result.listAnnLogMP[arrayIdx], "(unspecified)")
             else:
-                print("Unexpected Log MP:", listAnnLogMP[arrayIdx])
-            print("Calculated Avg Ann Interval:", listAnnAvgInterval[arrayIdx], "s")
+                print("Unexpected Log MP:", result.listAnnLogMP[arrayIdx])
+            print("Calculated Avg Ann Interval:", format_ts_ns(result.listAnnAvgInterval[arrayIdx]), "s")
         
     ### Signalling Message Overview
-    if(msgFlagSig == True):
+    if(result.msgFlagSig == True):
         ### display actual results
         print("--------------------------------------------------------------------")
         print("--- signalling info ---")
         print("TODO determine sensible analysis for signalling messages")
         
-        for arrayIdx in range(len(listSigDF)):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_SIGNALLING])):
             print("")
-            print("src" + str(arrayIdx) + ": " + str(uniqueSrcValues[arrayIdx]))
+            print("src" + str(arrayIdx) + ": " + str(result.get_src_value(PTP_MTYPE_SIGNALLING, arrayIdx)))
       
     ### Management Message Overview
-    if(msgFlagMan == True):
+    if(result.msgFlagMan == True):
         ### display actual results
         print("--------------------------------------------------------------------")
         print("--- management info ---")
         print("TODO determine sensible analysis for management messages")
         
-        for arrayIdx in range(len(listManDF)):
+        for arrayIdx in range(len(result.listSrcIdx[PTP_MTYPE_MANAGEMENT])):
+            print("")
+            print("src" + str(arrayIdx) + ": " + str(result.get_src_value(PTP_MTYPE_MANAGEMENT, arrayIdx)))
+
+    ### Pairing Overview
+    if(result.pairSyncFollUpDF is not None or result.pairDlyReqRespDF is not None):
+        print("--------------------------------------------------------------------")
+        print("--- pairing info ---")
+
+        for pairName, pairDF in (("Sync/FollowUp", result.pairSyncFollUpDF), ("DlyReq/DlyResp", result.pairDlyReqRespDF)):
+            if(pairDF is None):
+                continue
+            latency = pairDF["latency"].dropna()
+            print("")
+            print(pairName + ":")
+            print("Pairs:              ", len(latency))
+            print("Unmatched Requests: ", int((pairDF["pairState"] == "left_only").sum()))
+            print("Unmatched Responses:", int((pairDF["pairState"] == "right_only").sum()))
+            if(len(latency) > 0):
+                print("Min Latency:", format_ts_ns(latency.min()), "s")
+                print("Avg Latency:", format_ts_ns(latency.sum() // len(latency)), "s")
+                print("Max Latency:", format_ts_ns(latency.max()), "s")
+
+    ### Capture Clock Estimate of Offset / Mean Path Delay Overview
+    if(result.offsetDelayStatsDF is not None and len(result.offsetDelayStatsDF) > 0):
+        print("--------------------------------------------------------------------")
+        print("--- offset/delay info (capture clock estimate) ---")
+
+        for quantityIdx in range(0, len(result.offsetDelayStatsDF), 2):
+            slaveStats = result.offsetDelayStatsDF.iloc[quantityIdx:quantityIdx+2]
+            print("")
+            print("slave:", format_port_identity(slaveStats["clockId"].iat[0], slaveStats["portId"].iat[0]), "src:", result.uniqueSrcValues[slaveStats["slaveSrcIdx"].iat[0]])
+            print("Exchanges:", slaveStats["count"].iat[0])
+            if(slaveStats["withheld"].iat[0] == "timescale"):
+                print("withheld: timescale, capture clock not on the PTP timescale, mean capture offset:", format_ts_ns(slaveStats["mean"].iat[1]), "s")
+                continue
+            if(slaveStats["withheld"].iat[0] == "negativeDelay"):
+                print("withheld: negativeDelay, capture not taken at the slave, mean path delay:", format_ts_ns(slaveStats["mean"].iat[0]), "s")
+                continue
+            for quantityName, quantityStats in zip(("Mean Path Delay", "Capture Clock Offset"), slaveStats.itertuples()):
+                print(quantityName + ":")
+                print("- mean:", format_ts_ns(quantityStats.mean), "s")
+                print("- std: ", format_ts_ns(round(quantityStats.std)), "s")
+                print("- min: ", format_ts_ns(quantityStats.min), "s")
+                print("- max: ", format_ts_ns(quantityStats.max), "s")
+                for percentile in SERVO_PERCENTILES:
+                    print(("- p" + str(percentile) + ":").ljust(7), format_ts_ns(getattr(quantityStats, "p" + str(percentile))), "s")
+
+    ### Interval Overview
+    if(len(result.intervalStatsDF) > 0):
+        print("--------------------------------------------------------------------")
+        print("--- interval info ---")
+
+        for statsRow in result.intervalStatsDF.to_dict("records"):
             print("")
-            print("src" + str(arrayIdx) + ": " + str(uniqueSrcValues[arrayIdx]))
-        
-    ### calculate total number of PTP messages found
-    msgCountDF["Total"] = msgCountDF["Ann"] + msgCountDF["DlyReq"] + msgCountDF["DlyResp"] + msgCountDF["FollUp"] + msgCountDF["Man"] + msgCountDF["Sig"] + msgCountDF["Sync"]
-    
+            print(PTP_MTYPE_NAMES[statsRow["messageId"]], "src:", result.uniqueSrcValues[statsRow["srcIdx"]])
+            print("Intervals:", statsRow["count"])
+            if(pd.isna(statsRow["expected"]) == False):
+                print("Expected Interval:", format_ts_ns(statsRow["expected"]), "s, tolerance:", "%g" % (result.intervalTolerance * 100), "%")
+            if(statsRow["count"] > 0):
+                for statName in ["min"] + ["p" + str(percentile) for percentile in INTERVAL_PERCENTILES] + ["max", "mean", "std"]:
+                    print(("- " + statName + ":").ljust(7), format_ts_ns(round(statsRow[statName])), "s")
+            if(pd.isna(statsRow["expected"]) == False):
+                print("Outside Tolerance:", statsRow["below"], "below,", statsRow["above"], "above")
+                print("Histogram (interval / expected):", " | ".join(label + ": " + str(statsRow[label]) for label in INTERVAL_HISTOGRAM_LABELS))
+
+    ### logMP Segment Overview
+    # only sources and message types whose logMP changed or is unexpected
+    logMPSegments = result.logMPSegmentsDF
+    reportedSegments = logMPSegments[logMPSegments["prevLogMP"].notna() | (logMPSegments["valid"] == False)]
+    if(len(reportedSegments) > 0):
+        print("--------------------------------------------------------------------")
+        print("--- logMP info ---")
+        reportedStreams = logMPSegments.set_index(["messageId", "srcIdx"]).index.isin(reportedSegments.set_index(["messageId", "srcIdx"]).index)
+        logMPSummary = logMPSegments[reportedStreams].copy()
+        logMPSummary.insert(0, "msgType", logMPSummary["messageId"].map(PTP_MTYPE_NAMES))
+        logMPSummary.insert(1, "src", [result.uniqueSrcValues[srcIdx] for srcIdx in logMPSummary["srcIdx"]])
+        logMPSummary["group"] = [format_port_identity(*group) if(group is not None) else "" for group in logMPSummary["group"]]
+        logMPSummary["expected"] = [format_ts_ns(int(expected)) if(pd.isna(expected) == False) else "-" for expected in logMPSummary["expected"]]
+        logMPSummary["mean"] = [format_ts_ns(round(mean)) if(pd.isna(mean) == False) else "-" for mean in logMPSummary["mean"]]
+        print(logMPSummary.drop(columns = ["messageId", "srcIdx", "prevLogMP"]).rename(columns = {"group": "requester"}).to_string(index = False))
+
+    ### Irregular seqID Overview
+    if(len(result.seqIDRunsDF) > 0):
+        print("--------------------------------------------------------------------")
+        print("--- seqID info ---")
+        seqIDSummary = result.seqIDRunsDF.groupby(["messageId", "srcIdx", "kind"], sort = False).agg(runs = ("count", "size"), count = ("count", "sum"), missing = ("missing", "sum")).reset_index()
+        seqIDSummary.insert(0, "msgType", seqIDSummary["messageId"].map(PTP_MTYPE_NAMES))
+        seqIDSummary.insert(1, "src", [result.uniqueSrcValues[srcIdx] for srcIdx in seqIDSummary["srcIdx"]])
+        print(seqIDSummary.drop(columns = ["messageId", "srcIdx"]).to_string(index = False))
+
     print("--------------------------------------------------------------------")
     print("--- Msg Count Overview ---")
-    print(msgCountDF)        
+    print(result.msgCountDF)        
     
     print("--------------------------------------------------------------------")
     print("--- Warning Count Overview ---")
-    print(warningCountDF)
+    print(result.warningCountDF.to_string())
 ###--------------------------------------------------------------------------------
 
 
 
-###--------------------------------------------------------------------------------------------------------------------------------------------------
-###----- Main Body ----------------------------------------------------------------------------------------------------------------------------------
-###--------------------------------------------------------------------------------------------------------------------------------------------------
-def main():
-    ###----- cmd line arguements ----------------------------------------------
-    ### - define and parse cmd line arguments
+###----- extract PTP messages of a capture ------------------------------------
+# run the decoder selected for the given analyzer, fill the given result with
+# sources, message types and per-source/per-message-type data frames
+#
+# \param analyzer      ... PtpAnalyzer holding the decoder settings
+#
+# \param result        ... PtpAnalysisResult to fill
+#
+# \param inputFileName ... capture file to analyse
+def extract_ptp_data(analyzer, result, inputFileName):
+    if(analyzer.decoder == DECODER_NATIVE):
+        ###----- native extraction --------------------------------------------------
+        # decode the capture without tshark, split the resulting data frame in memory
+        with profile_stage(result.profiler, "decode"):
+            ptpData = extract_ptp_data_native(inputFileName, result.profiler)
+        with profile_stage(result.profiler, "frames"):
+            split_ptp_data(result, ptpData)
+        ###------------------------------------------------------------------------
+    elif(analyzer.decoder == DECODER_MMAP):
+        ###----- memory-mapped extraction -------------------------------------------
+        # decode the capture into a NumPy structured array, copy it into the record store field by field
+        with profile_stage(result.profiler, "decode"):
+            ptpRecords, srcValues, ethTypeUsed = extract_ptp_records_mmap(inputFileName, profiler = result.profiler)
+        with profile_stage(result.profiler, "frames"):
+            split_ptp_records(result, ptpRecords, srcValues, ethTypeUsed)
+        ###------------------------------------------------------------------------
+    else:
+        ###----- check tshark version -------------------------------------------------
+        # function to discern installed version of tshark/wireshark
+        # needed because of version specific differences such as
+        # --- different names for tshark fields, e.g. ptp.v2.messageid VS ptp.v2.messagetype
+        # --- different formatting of values of certain fields, e.g. hex-formatting VS strings
+        if(analyzer.tsharkChecked == False):
+            with profile_stage(result.profiler, "tsharkVersion"):
+                check_tshark_version(result.profiler)
+            analyzer.tsharkChecked = True
+        ###----------------------------------------------------------------------------
+    
+        if(analyzer.singlePass == True):
+            ###----- single-pass extraction ---------------------------------------------
+            # invoke tshark once for the union of all needed fields
+            # split the resulting data frame by source and message type in memory
+            with profile_stage(result.profiler, "tshark"):
+                ptpData = extract_ptp_data_single_pass(inputFileName, result.profiler)
+            with profile_stage(result.profiler, "frames"):
+                split_ptp_data(result, ptpData)
+            ###------------------------------------------------------------------------
+        else:
+            ###----- determine Layer2/IPv4/IPv6 ------------------------------------------- 
+            # invoke tshark to analyse field eth.type
+            # create pandas dataframe for processing
+            # check dataframe for eligible ptp messages
+            # check value of field eth.type, set appropriate ethTypeFlag for further operations 
+            with profile_stage(result.profiler, "ethType"):
+                determine_eth_type(result, inputFileName)
+            ###----------------------------------------------------------------------------
+    
+            ###----- identifying unique source-IPs ----------------------------------------
+            # TODO add check whether or not ALL PTP messages are of same ethType
+            # read all data from tshark output
+            # store ip.src values in data frame ... srcData
+            # store unique values for ip.src in ... uniqueSrcValues
+            with profile_stage(result.profiler, "sources"):
+                identify_ptp_sources(result, inputFileName)
+            ###----------------------------------------------------------------------------
+    
+            ###----- create separate data frames for unique source-IPs --------------------
+            # invoke tshark for every unique ip.src found
+            # generate separate data frames for unique ip.src values, add data frames to list ... srcsList[]
+            with profile_stage(result.profiler, "sourceFrames"):
+                srcsList = create_ptp_source_data_frames(result, inputFileName, analyzer.tsharkJobs)
+            ###----------------------------------------------------------------------------
 
-    ### define arguments
-    # -h ... (predefined) show help about this script
-    # -v ... show version and general information about this script
-    # -i ... input file
-    parser.add_argument("-v", "--version", action="version", version="%(prog)s 3.0", help="show program version and exit.")
-    parser.add_argument("-i", "--inFile", type=str, required=True)
 
-    ### parse given arguments
-    args = parser.parse_args()
-    
-    ### call function to analyse specified input file
-    parseFile(args.inFile)
+            ###----- identifying unique PTP message IDs -----------------------------------
+            # read data from srcsList[]
+            # identify unique message IDs for identified srcVal in previously created srcsList
+            # store unique message IDs in list ... uniqueMsgIDs
+            with profile_stage(result.profiler, "msgTypes"):
+                identify_ptp_msg_types(result, srcsList)
+            ###----------------------------------------------------------------------------
+
+
+            ###----- get further information according to message type --------------------
+            # invoke tshark while iterating through uniqueSrcValues and uniqueMsgIDs, extracting information according to PTP message type
+            # keep information in seperate data frames
+            with profile_stage(result.profiler, "furtherInformation"):
+                ptpMsgData = get_further_information(result, inputFileName, analyzer.tsharkJobs)
+            ###----------------------------------------------------------------------------
+
+
+            ###----- create individual data frames for different message IDs --------------
+            # go through previously read tshark output
+            # append generated data frames to lists differentiated by type of PTP message
+            with profile_stage(result.profiler, "msgFrames"):
+                create_ptp_message_data_frames(result, ptpMsgData)
+            ###----------------------------------------------------------------------------
 ###----------------------------------------------------------------------------
 
-def parseFile(inputFileName:str):
-    
-    ### prepare counters for potential warnings regarding different possible problems
-    # TODO maybe add more dimensions to this data frame, to easily determine the origin of a warning
-    warningData = {"Zero":        [0],
-                   "Negative":    [0],
-                   "Backwards":   [0],
-                   "SeqID":       [0],
-                   "CntMismatch": [0],
-                   "Other":       [0]}
-    warningCountDF = pd.DataFrame(warningData)
-    warningCountDF.index = ["wCnt"]
-    # print(warningCountDF)
-    
-    ###----- check tshark version -------------------------------------------------
-    # function to discern installed version of tshark/wireshark
-    # needed because of version specific differences such as
-    # --- different names for tshark fields, e.g. ptp.v2.messageid VS ptp.v2.messagetype
-    # --- different formatting of values of certain fields, e.g. hex-formatting VS strings
-    check_tshark_version()
-    ###----------------------------------------------------------------------------
-    
-    ###----- determine Layer2/IPv4/IPv6 ------------------------------------------- 
-    # invoke tshark to analyse field eth.type
-    # create pandas dataframe for processing
-    # check dataframe for eligible ptp messages
-    # check value of field eth.type, set appropriate ethTypeFlag for further operations 
-    determine_eth_type(inputFileName)
-    ###----------------------------------------------------------------------------
-    
-    ###----- identifying unique source-IPs ----------------------------------------
-    # TODO add check whether or not ALL PTP messages are of same ethType
-    # read all data from initially created file .txt file
-    # store ip.src values in data frame ... srcData
-    # store unique values for ip.src in ... uniqueSrcValues
-    identify_ptp_sources(inputFileName)
-    ###----------------------------------------------------------------------------
-    
-    ###----- create separate data frames for unique source-IPs --------------------
-    # invoke tshark for every unique ip.src found, store output in separate .txt files
-    # generate separate data frames for unique ip.src values, add data frames to list ... srcsList[]
-    create_ptp_source_data_frames(inputFileName)
-    ###----------------------------------------------------------------------------
 
+###----- cache key of a capture ----------------------------------------------
+# hash over the content, size and mtime of the capture as well as everything the extraction depends on
+# - decoder, single pass, layout version of the cache and the tshark field name used for the messageId
+#
+# \param analyzer      ... PtpAnalyzer holding the decoder settings
+#
+# \param inputFileName ... capture file to analyse
+#
+# \param profiler      ... PtpProfiler counting the bytes hashed, None ... not profiled
+def get_cache_key(analyzer, inputFileName, profiler = None):
+    contentHash = hashlib.blake2b(digest_size = 20)
+    with open(inputFileName, "rb") as captureFile:
+        for block in iter(lambda: captureFile.read(CACHE_HASH_BLOCK_SIZE), b""):
+            contentHash.update(block)
+    fileStat = os.stat(inputFileName)
+    count_bytes_read(profiler, fileStat.st_size)
 
-    ###----- identifying unique PTP message IDs -----------------------------------
-    # read data from srcsList[]
-    # identify unique message IDs for identified srcVal in previously created srcsList
-    # store unique message IDs in list ... uniqueMsgIDs
-    identify_ptp_msg_types()
-    ###----------------------------------------------------------------------------
+    decoderVersion = [CACHE_FORMAT_VERSION, analyzer.decoder, analyzer.singlePass]
+    if(analyzer.decoder == DECODER_TSHARK):
+        decoderVersion.append(msgIdentifierUsed)
 
+    keyHash = hashlib.blake2b(contentHash.digest(), digest_size = 20)
+    keyHash.update(repr((fileStat.st_size, fileStat.st_mtime_ns, decoderVersion)).encode("utf-8"))
+    return keyHash.hexdigest()
+###----------------------------------------------------------------------------
 
-    ###----- get further information according to message type --------------------
-    # invoke tshark while iterating through uniqueSrcValues and uniqueMsgIDs, extracting information according to PTP message type
-    # store information in seperate .txt files
-    get_further_information(inputFileName, uniqueSrcValues, uniqueMsgIDs)
-    ###----------------------------------------------------------------------------
 
+###----- write the extracted data of a result to the cache --------------------
+# the structured arrays of the record store are written as they are, see PtpRecordStore
+# - written to a temporary file first, so concurrent batch workers never read a partial cache file
+#
+# \param cacheFileName ... .npz file within the cache directory
+def store_cached_extraction(result, cacheFileName):
+    cacheArrays = {"ethTypeUsed":     np.array(result.ethTypeUsed),
+                   "uniqueSrcValues": np.array(result.uniqueSrcValues, dtype = str)}
 
-    ###----- create individual data frames for different message IDs --------------
-    # go through previously created .txt files to create individual pandas data frames
-    # append generated data frames to lists differentiated by type of PTP message
-    create_ptp_message_data_frames()
-    ###----------------------------------------------------------------------------
-    
+    for srcIdx in range(len(result.uniqueSrcValues)):
+        cacheArrays["msgIDs_" + str(srcIdx)] = np.array(result.uniqueMsgIDs[srcIdx], dtype = np.int64)
+
+    for msgID in result.listSrcIdx:
+        cacheArrays["srcIdx_" + str(msgID)] = np.array(result.listSrcIdx[msgID], dtype = np.int64)
+        for arrayIdx in range(len(result.listSrcIdx[msgID])):
+            cacheArrays["msg_" + str(msgID) + "_" + str(arrayIdx)] = result.get_msg_data(msgID, arrayIdx).records
+
+    tmpFileName = cacheFileName + "." + str(os.getpid()) + ".tmp"
+    with open(tmpFileName, "wb") as cacheFile:
+        np.savez(cacheFile, **cacheArrays)
+    os.replace(tmpFileName, cacheFileName)
+###----------------------------------------------------------------------------
+
+
+###----- fill a result with the extracted data from the cache -----------------
+# returns False if there is no (readable) cache file, the result is left untouched in that case
+#
+# \param cacheFileName ... .npz file within the cache directory
+def load_cached_extraction(result, cacheFileName):
+    try:
+        with np.load(cacheFileName, allow_pickle = False) as cacheData:
+            ethTypeUsed = str(cacheData["ethTypeUsed"])
+            uniqueSrcValues = cacheData["uniqueSrcValues"].astype(object)
+            uniqueMsgIDs = [cacheData["msgIDs_" + str(srcIdx)].astype(object) for srcIdx in range(len(uniqueSrcValues))]
+
+            msgData = {}
+            for msgID in result.listSrcIdx:
+                srcIdxList = [int(srcIdx) for srcIdx in cacheData["srcIdx_" + str(msgID)]]
+                msgData[msgID] = [(srcIdxList[arrayIdx], cacheData["msg_" + str(msgID) + "_" + str(arrayIdx)]) for arrayIdx in range(len(srcIdxList))]
+                if(any([records.dtype != PTP_STORE_DTYPES[msgID] for _, records in msgData[msgID]]) == True):
+                    raise ValueError("unexpected record layout within cache file: " + cacheFileName)
+    except (OSError, KeyError, ValueError):
+        return False
+
+    result.ethTypeUsed = ethTypeUsed
+    result.uniqueSrcValues = uniqueSrcValues
+    result.uniqueMsgIDs = uniqueMsgIDs
+    for srcMsgIDs in uniqueMsgIDs:
+        for msgID in srcMsgIDs:
+            set_ptp_msg_flag(result, msgID)
+    for msgID in msgData:
+        for srcIdx, records in msgData[msgID]:
+            append_ptp_message_records(result, msgID, records, srcIdx)
+
+    # mark as recently used for the LRU eviction
+    os.utime(cacheFileName)
+    count_bytes_read(result.profiler, os.path.getsize(cacheFileName))
+    return True
+###----------------------------------------------------------------------------
+
+
+###----- limit the size of a cache directory ----------------------------------
+# removes the least recently used cache files until the directory fits into maxBytes
+def evict_cache_files(cacheDir, maxBytes):
+    cacheFiles = []
+    for fileName in os.listdir(cacheDir):
+        if(fileName.endswith(".npz") == True):
+            try:
+                fileStat = os.stat(os.path.join(cacheDir, fileName))
+            except FileNotFoundError:
+                continue
+            cacheFiles.append((fileStat.st_mtime_ns, fileStat.st_size, os.path.join(cacheDir, fileName)))
+
+    cacheFiles.sort()
+    totalBytes = sum([fileSize for _, fileSize, _ in cacheFiles])
+    for _, fileSize, cacheFileName in cacheFiles:
+        if(totalBytes <= maxBytes):
+            break
+        try:
+            os.remove(cacheFileName)
+        except FileNotFoundError:
+            pass
+        totalBytes -= fileSize
+###----------------------------------------------------------------------------
+
+
+###----- extract PTP messages of a capture, using the extraction cache ---------
+# same as extract_ptp_data(), an unchanged capture is restored from analyzer.cacheDir without decoding it
+def extract_ptp_data_cached(analyzer, result, inputFileName):
+    # the cache key depends on the tshark version, check it first
+    if(analyzer.decoder == DECODER_TSHARK and analyzer.tsharkChecked == False):
+        with profile_stage(result.profiler, "tsharkVersion"):
+            check_tshark_version(result.profiler)
+        analyzer.tsharkChecked = True
+
+    os.makedirs(analyzer.cacheDir, exist_ok = True)
+    with profile_stage(result.profiler, "cacheKey"):
+        cacheFileName = os.path.join(analyzer.cacheDir, get_cache_key(analyzer, inputFileName, result.profiler) + ".npz")
+
+    with profile_stage(result.profiler, "cacheLoad"):
+        cacheLoaded = load_cached_extraction(result, cacheFileName)
+    if(cacheLoaded == True):
+        print_info(result, "Using cached extraction: ", cacheFileName)
+        return
+
+    extract_ptp_data(analyzer, result, inputFileName)
+    with profile_stage(result.profiler, "cacheStore"):
+        store_cached_extraction(result, cacheFileName)
+        evict_cache_files(analyzer.cacheDir, analyzer.cacheMaxBytes)
+###----------------------------------------------------------------------------
+
+
+###----- tables of a result for the columnar export --------------------------
+# returns a dict of data frames, keyed by table name
+# - info, sources          ... input file, kind of source address, interval tolerance and the sources indexed by srcIdx
+# - msgSync .. msgMan      ... decoded messages of all sources, per message type, srcIdx as first column followed by the fields of the record store, see PTP_STORE_DTYPES,
+#                             missing values as <NA> instead of naMask
+# - msgCount .. offsetDelayStats ... computed results, tables not created by the analysis are left out
+def get_export_tables(result):
+    tables = {"info":    pd.DataFrame({"inputFileName":     [str(result.inputFileName)],
+                                       "ethTypeUsed":       [result.ethTypeUsed],
+                                       "intervalTolerance": [result.intervalTolerance],
+                                       "exportVersion":     [EXPORT_FORMAT_VERSION]}),
+              "sources": pd.DataFrame({"srcIdx": np.arange(len(result.uniqueSrcValues), dtype = np.int64),
+                                       "src":    [str(srcValue) for srcValue in result.uniqueSrcValues]})}
+
+    for msgID, msgName in PTP_MTYPE_NAMES.items():
+        if(len(result.listSrcIdx[msgID]) > 0):
+            msgRecords = [result.get_msg_data(msgID, arrayIdx).records for arrayIdx in range(len(result.listSrcIdx[msgID]))]
+            records = np.concatenate(msgRecords)
+            if(len(records) == 0):
+                continue
+            msgFrame = pd.DataFrame({"srcIdx": np.repeat(np.array(result.listSrcIdx[msgID], dtype = np.int64), [len(srcRecords) for srcRecords in msgRecords])})
+            for col in records.dtype.names:
+                if(col == "naMask"):
+                    continue
+                msgFrame[col] = records[col]
+                if(col in PTP_STORE_NULLABLE_FIELDS):
+                    msgFrame[col] = msgFrame[col].astype("Int64").mask(get_store_na_mask(records, col))
+            tables["msg" + msgName] = msgFrame
+
+    for tableName in ["msgCount", "warningCount", "intervalStats", "logMPSegments", "seqIDRuns", "pairSyncFollUp", "pairDlyReqResp", "offsetDelay", "offsetDelayStats"]:
+        frame = getattr(result, tableName + "DF")
+        if(frame is not None):
+            tables[tableName] = frame.reset_index(drop = True)
+    return tables
+###----------------------------------------------------------------------------
+
+
+###----- convert a data frame to column types every export format supports ----
+# - group labels (port identities of requesters) are formatted, see format_port_identity()
+# - object columns become nullable integers, floats, booleans or strings
+def prepare_export_frame(frame):
+    frame = frame.copy()
+    for col in frame.columns:
+        values = frame[col]
+        if(col == "group"):
+            frame[col] = pd.array([format_port_identity(*group) if(group is not None) else None for group in values], dtype = "string")
+        elif(values.dtype == object):
+            inferredType = pd.api.types.infer_dtype(values, skipna = True)
+            if(inferredType == "integer"):
+                frame[col] = pd.array(values, dtype = "Int64")
+            elif(inferredType in ("floating", "mixed-integer-float")):
+                frame[col] = values.astype(np.float64)
+            elif(inferredType == "boolean"):
+                frame[col] = pd.array(values, dtype = "boolean")
+            else:
+                frame[col] = pd.array([str(value) if(pd.isna(value) == False) else None for value in values], dtype = "string")
+    return frame
+###----------------------------------------------------------------------------
+
+
+###----- store a data frame as named arrays of an .npz export -----------------
+# every column is stored as <tableName>/<column>, missing values of nullable columns as <tableName>/<column>/na
+#
+# \param exportArrays ... dict of arrays to be written by np.savez
+#
+# \param tableName    ... name of the table, see get_export_tables()
+def frame_to_export_arrays(exportArrays, tableName, frame):
+    exportArrays[tableName + "/"] = np.array(frame.columns, dtype = str)
+    for col in frame.columns:
+        values = frame[col]
+        key = tableName + "/" + col
+        if(isinstance(values.dtype, np.dtype) == True and values.dtype.kind in "biuf"):
+            exportArrays[key] = values.to_numpy()
+        elif(hasattr(values.dtype, "numpy_dtype") == True):
+            # nullable integers and booleans
+            exportArrays[key] = values.to_numpy(dtype = values.dtype.numpy_dtype, na_value = 0)
+            exportArrays[key + "/na"] = values.isna().to_numpy()
+        else:
+            exportArrays[key] = values.fillna("").astype(str).to_numpy(dtype = str)
+            exportArrays[key + "/na"] = values.isna().to_numpy()
+###----------------------------------------------------------------------------
+
+
+###----- check if an export format can be written ------------------------------
+# raises ValueError for unknown formats and if pyarrow is missing for parquet/arrow
+def check_export_format(exportFormat):
+    if(exportFormat not in (EXPORT_FORMAT_NPZ, EXPORT_FORMAT_PARQUET, EXPORT_FORMAT_ARROW)):
+        raise ValueError("unknown export format: " + str(exportFormat))
+    if(exportFormat != EXPORT_FORMAT_NPZ and importlib.util.find_spec("pyarrow") is None):
+        raise ValueError("the " + exportFormat + " export needs pyarrow, install it or use the " + EXPORT_FORMAT_NPZ + " export")
+###----------------------------------------------------------------------------
+
+
+###----- export decoded messages and results of a capture ----------------------
+# writes the tables of get_export_tables() in a columnar binary format, see EXPORT_FORMAT_*
+# - named after the capture, <exportDir>/<capture>.npz or <exportDir>/<capture>/<table>.parquet|.arrow
+# - written to a temporary file first, like store_cached_extraction()
+# returns the path of the written file or directory
+#
+# \param exportDir    ... directory the export is written to, created if missing
+#
+# \param exportFormat ... EXPORT_FORMAT_NPZ, EXPORT_FORMAT_PARQUET or EXPORT_FORMAT_ARROW
+def export_result(result, exportDir, exportFormat = EXPORT_FORMAT_NPZ):
+    check_export_format(exportFormat)
+    captureName = "stdin" if(result.inputFileName == "-") else os.path.basename(result.inputFileName)
+    tables = {tableName: prepare_export_frame(frame) for tableName, frame in get_export_tables(result).items()}
+    os.makedirs(exportDir, exist_ok = True)
+
+    if(exportFormat == EXPORT_FORMAT_NPZ):
+        exportPath = os.path.join(exportDir, captureName + ".npz")
+        exportArrays = {}
+        for tableName, frame in tables.items():
+            frame_to_export_arrays(exportArrays, tableName, frame)
+        tmpFileName = exportPath + "." + str(os.getpid()) + ".tmp"
+        with open(tmpFileName, "wb") as exportFile:
+            np.savez(exportFile, **exportArrays)
+        os.replace(tmpFileName, exportPath)
+        return exportPath
+
+    exportPath = os.path.join(exportDir, captureName)
+    os.makedirs(exportPath, exist_ok = True)
+    for tableName, frame in tables.items():
+        tableFileName = os.path.join(exportPath, tableName + "." + exportFormat)
+        tmpFileName = tableFileName + "." + str(os.getpid()) + ".tmp"
+        if(exportFormat == EXPORT_FORMAT_PARQUET):
+            frame.to_parquet(tmpFileName, index = False)
+        else:
+            frame.to_feather(tmpFileName)
+        os.replace(tmpFileName, tableFileName)
+    return exportPath
+###----------------------------------------------------------------------------
+
+
+###----- load an export written by export_result() -----------------------------
+# returns a dict of data frames, keyed by table name, nullable columns are restored with <NA>
+#
+# \param exportPath ... .npz file or directory of .parquet/.arrow files
+def load_export(exportPath):
+    tables = {}
+    if(os.path.isdir(exportPath) == True):
+        for fileName in sorted(os.listdir(exportPath)):
+            tableName, fileExt = os.path.splitext(fileName)
+            if(fileExt == "." + EXPORT_FORMAT_PARQUET):
+                tables[tableName] = pd.read_parquet(os.path.join(exportPath, fileName))
+            elif(fileExt == "." + EXPORT_FORMAT_ARROW):
+                tables[tableName] = pd.read_feather(os.path.join(exportPath, fileName))
+        return tables
+
+    with np.load(exportPath, allow_pickle = False) as exportData:
+        for key in exportData.files:
+            if(key.endswith("/") == False):
+                continue
+            tableName = key[:-1]
+            frameData = {}
+            for col in exportData[key]:
+                values = exportData[tableName + "/" + col]
+                if((tableName + "/" + col + "/na") in exportData.files):
+                    values = pd.array(values)
+                    values[exportData[tableName + "/" + col + "/na"]] = None
+                frameData[str(col)] = values
+            tables[tableName] = pd.DataFrame(frameData, columns = [str(col) for col in exportData[key]])
+    return tables
+###----------------------------------------------------------------------------
+
+
+###----- convert numpy scalars for the JSON report ---------------------------
+def json_default(value):
+    if(isinstance(value, np.integer) == True):
+        return int(value)
+    if(isinstance(value, np.floating) == True):
+        return float(value)
+    if(isinstance(value, np.ndarray) == True):
+        return value.tolist()
+    if(value is pd.NA):
+        return None
+    raise TypeError("not serializable: " + repr(value))
+###----------------------------------------------------------------------------
+
+
+###----- machine-readable report of a result -----------------------------------
+# returns a dict holding the message and warning counts and one record per warning, see PtpWarningLog
+# - every warning record additionally holds the source address as "src"
+def get_report(result):
+    warnings = []
+    for record in result.warningLog.records:
+        record = dict(record)
+        record["src"] = None if(record["srcIdx"] is None) else str(result.uniqueSrcValues[record["srcIdx"]])
+        warnings.append(record)
+
+    return {"reportVersion": REPORT_FORMAT_VERSION,
+            "inputFileName": str(result.inputFileName),
+            "msgCount":      {col: int(value) for col, value in result.msgCountDF.iloc[0].items()},
+            "warningCount":  {col: int(value) for col, value in result.warningCountDF.iloc[0].items()},
+            "warnings":      warnings}
+###----------------------------------------------------------------------------
+
+
+###----- write the report of a result -------------------------------------------
+# writes <reportDir>/<capture>.json, see get_report(),
+# and the summaries <reportDir>/<capture>_msgCount.csv and <reportDir>/<capture>_warningCount.csv
+# returns the path of the JSON report
+#
+# \param reportDir ... directory the report is written to, created if missing
+def write_report(result, reportDir):
+    captureName = "stdin" if(result.inputFileName == "-") else os.path.basename(result.inputFileName)
+    os.makedirs(reportDir, exist_ok = True)
+
+    reportPath = os.path.join(reportDir, captureName + ".json")
+    with open(reportPath, "w") as reportFile:
+        json.dump(get_report(result), reportFile, indent = 1, default = json_default)
+    result.msgCountDF.to_csv(os.path.join(reportDir, captureName + "_msgCount.csv"), index = False)
+    result.warningCountDF.to_csv(os.path.join(reportDir, captureName + "_warningCount.csv"), index = False)
+    return reportPath
+###----------------------------------------------------------------------------
+
+
+###----- print the profile of a result ----------------------------------------
+def print_profile(result):
+    print("--- Profile --------------------------------------------------------")
+    print(result.profiler.get_stats_df().to_string(index = False, float_format = "{:.3f}".format))
+    print("--------------------------------------------------------------------")
+###----------------------------------------------------------------------------
+
+
+###----- write the profile of a result -------------------------------------------
+# writes <reportDir>/<capture>_profile.json, holding one entry per stage, see PtpProfiler.get_stats_df()
+# returns the path of the profile
+#
+# \param reportDir ... directory the profile is written to, created if missing
+def write_profile(result, reportDir):
+    captureName = "stdin" if(result.inputFileName == "-") else os.path.basename(result.inputFileName)
+    os.makedirs(reportDir, exist_ok = True)
+
+    statsDF = result.profiler.get_stats_df()
+    profile = {"profileVersion": PROFILE_FORMAT_VERSION,
+               "inputFileName":  str(result.inputFileName),
+               "stages":         [{key: (None if(pd.isna(value)) else value) for key, value in row.items()} for row in statsDF.to_dict("records")]}
+
+    profilePath = os.path.join(reportDir, captureName + "_profile.json")
+    with open(profilePath, "w") as profileFile:
+        json.dump(profile, profileFile, indent = 1, default = json_default)
+    return profilePath
+###----------------------------------------------------------------------------
+
+
+###----- total number of PTP messages ----------------------------------------
+def calc_total_msg_count(result):
+    result.msgCountDF["Total"] = result.msgCountDF["Ann"] + result.msgCountDF["DlyReq"] + result.msgCountDF["DlyResp"] + result.msgCountDF["FollUp"] + result.msgCountDF["Man"] + result.msgCountDF["Sig"] + result.msgCountDF["Sync"]
+###----------------------------------------------------------------------------
+
+
+###----- check the seqIDs and intervals of a chunk of records ------------------
+# streaming equivalent of check_msg_seq_ids() and calc_interval_stats()
+# - the last message of every seqID group of the previous chunks is prepended, so irregular seqIDs and intervals are found across chunks
+# - a run crossing a chunk border continues the open record of the previous chunk, the runs kept are merged by merge_seq_id_runs()
+# - intervals are only taken for message types holding timestamps
+#
+# \param stats          ... PtpStreamStats of the source and message type
+#
+# \param records        ... structured array of dtype PTP_RECORD_DTYPE, messages of this source and type only
+#
+# \param warningLog     ... PtpWarningLog of the result
+def update_stream_sequence(stats, records, warningLog):
+    groups = get_seq_id_groups(records, stats.msgID)
+    frameNums = records["frameNum"]
+    seqIDs = records["seqID"].astype(np.int64)
+    frameTimes = records["frameTime"]
+    logMPs = records["logMP"].astype(np.int64)
+    ts = records["ts_s"].astype(np.int64) * NS_PER_S + records["ts_ns"].astype(np.int64)
+    if(len(stats.lastSeqIDs) > 0):
+        lastSeqIDs = np.array(list(stats.lastSeqIDs.values()), dtype = np.int64)
+        frameNums = np.concatenate((lastSeqIDs[:, 0], frameNums))
+        seqIDs = np.concatenate((lastSeqIDs[:, 1], seqIDs))
+        frameTimes = np.concatenate((lastSeqIDs[:, 2], frameTimes))
+        logMPs = np.concatenate((lastSeqIDs[:, 3], logMPs))
+        ts = np.concatenate((lastSeqIDs[:, 4], ts))
+        if(groups is not None):
+            groups = pd.MultiIndex.from_tuples(list(stats.lastSeqIDs)).append(groups)
+
+    stats.seqIDRuns.append(check_seq_id({"frameNum": frameNums, "seqID": seqIDs, "ts": ts}, warningLog, groups, stats.msgID, continued = True))
+    if(stats.msgID in PTP_TS_FIELDS):
+        segments, intervals, expected = analyze_logmp_segments(stats.msgID, frameNums, logMPs, frameTimes, seqIDs, groups, stats.intervalTolerance)
+        check_logmp(segments, warningLog, int(records["frameNum"][0]))
+        update_stream_intervals(stats, intervals, expected)
+
+    ### keep the last message of every group, with the capture time of the first of its duplicates, see calc_intervals()
+    if(groups is None):
+        groupCodes = np.zeros(len(seqIDs), dtype = np.int64)
+        groupLabels = [None]
+    else:
+        groupCodes, groupLabels = pd.factorize(groups)
+    order = np.argsort(groupCodes, kind = "stable")
+    sortedCodes = groupCodes[order]
+    sortedSeqIDs = seqIDs[order]
+    newSeqID = np.ones(len(order), dtype = bool)
+    newSeqID[1:] = (sortedCodes[1:] != sortedCodes[:-1]) | (sortedSeqIDs[1:] != sortedSeqIDs[:-1])
+    firstOfSeqID = order[np.flatnonzero(newSeqID)][np.cumsum(newSeqID) - 1]
+    for lastPos in np.flatnonzero(np.append(sortedCodes[1:] != sortedCodes[:-1], True)):
+        itemIdx = order[lastPos]
+        stats.lastSeqIDs[groupLabels[sortedCodes[lastPos]]] = (int(frameNums[itemIdx]), int(seqIDs[itemIdx]), int(frameTimes[firstOfSeqID[lastPos]]), int(logMPs[itemIdx]), int(ts[itemIdx]))
+###----------------------------------------------------------------------------
+
+
+###----- update the running interval statistics --------------------------------
+# chunks are merged with Chan's parallel variant of Welford's algorithm, histograms are summed up
+#
+# \param stats     ... PtpStreamStats of the source and message type
+#
+# \param intervals ... intervals of the chunk in nanoseconds, see calc_intervals()
+#
+# \param expected  ... expected interval per interval, see analyze_logmp_segments()
+def update_stream_intervals(stats, intervals, expected):
+    if(len(intervals) == 0):
+        return
+
+    below, above, histogram = classify_intervals(intervals, expected, stats.intervalTolerance)
+    stats.intervalsBelow += below
+    stats.intervalsAbove += above
+    stats.intervalHist += histogram
+    stats.intervalLogHist += np.bincount(np.searchsorted(INTERVAL_LOG_EDGES, intervals, side = "right"), minlength = len(stats.intervalLogHist))
+
+    intervals = intervals.astype(np.float64)
+    chunkMean = intervals.mean()
+    chunkM2 = ((intervals - chunkMean) ** 2).sum()
+    numIntervals = stats.numIntervals + len(intervals)
+    delta = chunkMean - stats.meanInterval
+    stats.m2Interval += chunkM2 + delta * delta * stats.numIntervals * len(intervals) / numIntervals
+    stats.meanInterval += delta * len(intervals) / numIntervals
+    stats.numIntervals = numIntervals
+    stats.minInterval = intervals.min() if(stats.minInterval == None) else min(stats.minInterval, intervals.min())
+    stats.maxInterval = intervals.max() if(stats.maxInterval == None) else max(stats.maxInterval, intervals.max())
+###----------------------------------------------------------------------------
+
+
+###----- update the running state of one source and message type --------------
+# streaming equivalent of ptp_msg_type_specific_calcs(), check_ts() and check_seq_id()
+# - the last message of the previous chunk is prepended, so backwards ts and irregular seqIDs are found across chunks
+#
+# \param stats          ... PtpStreamStats of the source and message type
+#
+# \param records        ... structured array of dtype PTP_RECORD_DTYPE, messages of this source and type only
+#
+# \param warningLog     ... PtpWarningLog of the result
+def update_stream_stats(stats, records, warningLog):
+    warningLog.set_source(stats.msgID, stats.srcIdx)
+    if(stats.count == 0):
+        stats.logMP = int(records["logMP"][0])
+    stats.count += len(records)
+
+    ### irregular seqIDs, logMP segments and interval statistics, checked for all message types like print_warning_overview()
+    if(stats.msgID in SEQ_ID_MSG_TYPES):
+        update_stream_sequence(stats, records, warningLog)
+
+    # TODO current special cases for signalling/management msgs, as they dont hold time stamps
+    if(stats.msgID not in PTP_TS_FIELDS):
+        return
+
+    frameNums = records["frameNum"]
+    ts = records["ts_s"].astype(np.int64) * NS_PER_S + records["ts_ns"].astype(np.int64)
+    stats.seqIDSeen[records["seqID"]] = True
+    if(stats.firstTS == None):
+        stats.firstTS = int(ts[0])
+
+    ### zero and negative ts, new messages only
+    # msgIdx continues the message indices of the previous chunks, so warnings are aggregated across chunks
+    msgIdxOffset = stats.count - len(records)
+    idx = np.flatnonzero(ts == 0)
+    warningLog.add_indexed("Zero", msgIdxOffset + idx, frameNums[idx])
+    idx = np.flatnonzero(ts < 0)
+    warningLog.add_indexed("Negative", msgIdxOffset + idx, frameNums[idx], ts = ts[idx].tolist())
+
+    ### continue with the last message of the previous chunk
+    if(stats.lastTS != None):
+        frameNums = np.concatenate(([stats.lastFrameNum], frameNums))
+        ts = np.concatenate(([stats.lastTS], ts))
+        msgIdxOffset -= 1
+
+    ### backwards ts between two consecutive PTP messages
+    idx = np.flatnonzero(ts[:-1] > ts[1:])
+    warningLog.add_indexed("Backwards", msgIdxOffset + idx, frameNums[idx], frameNums[idx+1], ts = ts[idx].tolist(), tsEnd = ts[idx+1].tolist())
+
+    stats.lastFrameNum = int(frameNums[-1])
+    stats.lastTS = int(ts[-1])
+###----------------------------------------------------------------------------
+
+
+###----- update the streaming state with a chunk of records --------------------
+# splits the chunk by source and message type, keeping the order of appearance
+#
+# \param streamState       ... dict of PtpStreamStats, keyed by (srcIdx, msgID), in order of appearance
+#
+# \param records           ... structured array of dtype PTP_RECORD_DTYPE
+#
+# \param warningLog        ... PtpWarningLog of the result
+#
+# \param intervalTolerance ... allowed relative deviation of an interval from the expected interval
+def update_stream_state(streamState, records, warningLog, intervalTolerance = INTERVAL_DEFAULT_TOLERANCE):
+    groupKeys = records["srcIdx"].astype(np.int64) * 16 + records["messageId"]
+    order = np.argsort(groupKeys, kind = "stable")
+    uniqueKeys, groupStart = np.unique(groupKeys[order], return_index = True)
+    groupEnd = np.append(groupStart[1:], len(order))
+
+    for groupIdx in np.argsort(order[groupStart]):
+        key = (int(uniqueKeys[groupIdx]) // 16, int(uniqueKeys[groupIdx]) % 16)
+        if(key not in streamState):
+            streamState[key] = PtpStreamStats(key[0], key[1], intervalTolerance)
+        update_stream_stats(streamState[key], records[order[groupStart[groupIdx]:groupEnd[groupIdx]]], warningLog)
+###----------------------------------------------------------------------------
+
+
+###----- append the interval statistics of a stream ----------------------------
+# streaming equivalent of calc_interval_stats(), percentiles are estimated, see PtpStreamStats.get_interval_percentiles()
+#
+# \param stats ... PtpStreamStats of the source and message type
+def append_stream_interval_stats(result, stats):
+    statsRow = {"messageId": stats.msgID,
+                "srcIdx":    stats.srcIdx,
+                "count":     stats.numIntervals,
+                "expected":  get_expected_interval(stats.msgID, stats.logMP),
+                "below":     stats.intervalsBelow,
+                "above":     stats.intervalsAbove}
+    if(stats.numIntervals > 0):
+        statsRow.update({"min":  stats.minInterval,
+                         "max":  stats.maxInterval,
+                         "mean": stats.meanInterval,
+                         "std":  stats.get_interval_std()})
+        statsRow.update(zip(["p" + str(percentile) for percentile in INTERVAL_PERCENTILES], stats.get_interval_percentiles()))
+    statsRow.update(zip(INTERVAL_HISTOGRAM_LABELS, stats.intervalHist))
+    append_interval_stats(result, statsRow)
+###----------------------------------------------------------------------------
+
+
+###----- fill a result from the streaming state --------------------------------
+# same order of sources and message types as split_ptp_records(), the record store stays empty
+#
+# \param srcValues   ... list of unique source addresses, indexed by srcIdx
+#
+# \param ethTypeUsed ... kind of source address
+def finish_stream_state(result, streamState, srcValues, ethTypeUsed):
+    result.ethTypeUsed = ethTypeUsed
+    result.uniqueSrcValues = np.array(srcValues, dtype = object)
+    print_info(result, "Unique Src Values: ", result.uniqueSrcValues)
+
+    srcMsgIDs = [[] for srcIdx in range(len(srcValues))]
+    for srcIdx, msgID in streamState:
+        srcMsgIDs[srcIdx].append(msgID)
+        set_ptp_msg_flag(result, msgID)
+    result.uniqueMsgIDs = [np.array(msgIDs, dtype = object) for msgIDs in srcMsgIDs]
+    print_info(result, "Unique Msg IDs: ", [msgIDs.tolist() for msgIDs in result.uniqueMsgIDs])
+
+    for srcIdx in range(len(srcValues)):
+        for msgID in srcMsgIDs[srcIdx]:
+            if(msgID not in result.listSrcIdx):
+                print_info(result, "unknown message ID: ", msgID)
+                continue
+
+            stats = streamState[(srcIdx, msgID)]
+            result.listSrcIdx[msgID].append(srcIdx)
+            append_seq_id_runs(result, msgID, srcIdx, merge_seq_id_runs(stats.seqIDRuns))
+            if(msgID in PTP_TS_FIELDS):
+                append_stream_interval_stats(result, stats)
+            if(msgID in PTP_TS_FIELDS):
+                append_ptp_msg_stats(result, msgID, stats.count, stats.logMP, stats.firstTS, stats.lastTS, stats.get_avg_interval())
+            else:
+                append_ptp_msg_stats(result, msgID, stats.count)
+
+    # same order as ptp_msg_type_specific_calcs() creates them
+    result.intervalStatsDF = result.intervalStatsDF.sort_values("messageId", kind = "stable", ignore_index = True)
+    result.streamState = streamState
+    calc_total_msg_count(result)
+###----------------------------------------------------------------------------
+
+
+###----- compare running number of DlyReq and DlyResp messages ------------------
+# used by the follow mode after every chunk, the final check_dly_cnt_mismatch() is done at the end as usual
+# - up to FOLLOW_CNT_MISMATCH_TOLERANCE DlyReq messages may still wait for their DlyResp
+# - only printed if the difference changed since the last warning, not counted in warningCountDF
+# returns the difference of the last printed warning
+#
+# \param result          ... PtpAnalysisResult of the streaming analysis
+#
+# \param streamState     ... dict of PtpStreamStats, keyed by (srcIdx, msgID)
+#
+# \param liveCntMismatch ... difference of the last printed warning, 0 ... none printed yet
+def check_live_cnt_mismatch(result, streamState, liveCntMismatch):
+    cntDlyReq = sum([stats.count for stats in streamState.values() if stats.msgID == PTP_MTYPE_DELAY_REQ])
+    cntDlyResp = sum([stats.count for stats in streamState.values() if stats.msgID == PTP_MTYPE_DELAY_RESP])
+    cntMismatch = cntDlyReq - cntDlyResp
+
+    if(abs(cntMismatch) <= FOLLOW_CNT_MISMATCH_TOLERANCE or cntMismatch == liveCntMismatch):
+        return liveCntMismatch
+
+    print_info(result, "")
+    print_info(result, "Missing DlyResp Msg (live):" if(cntMismatch > 0) else "Missing DlyReq Msg (live):")
+    print_info(result, "- Cnt DlyReq:  ", cntDlyReq)
+    print_info(result, "- Cnt DlyResp: ", cntDlyResp)
+    return cntMismatch
+###----------------------------------------------------------------------------
+
+
+###----- streaming analysis of a capture ---------------------------------------
+# alternative to extract_ptp_data() and run_ptp_calcs() for captures larger than RAM
+# - the capture is decoded chunk by chunk by the mmap decoder, see iter_ptp_record_chunks_mmap()
+# - only a PtpStreamStats per source and message type is kept, warnings are printed while decoding
+# - with analyzer.follow a growing capture or stdin is decoded as the packets arrive, see iter_ptp_record_chunks_follow()
+def stream_ptp_data(analyzer, result, inputFileName):
+    print_info(result, "--------------------------------------------------------------------")
+    print_info(result, "--- Warning(s) -----------------------------------------------------")
+    print_info(result, "--------------------------------------------------------------------")
+
+    streamState = {}
+    srcValues = []
+    ethTypeUsed = ""
+    if(analyzer.follow == False):
+        for records, srcValues, ethTypeUsed in iter_ptp_record_chunks_mmap(inputFileName, analyzer.chunkPackets, result.profiler):
+            # sources seen so far, the warnings printed while decoding name their source
+            result.uniqueSrcValues = srcValues
+            with profile_stage(result.profiler, "update"):
+                if(result.warningLog.recorder is not None):
+                    result.warningLog.recorder.feed(records)
+                update_stream_state(streamState, records, result.warningLog, result.intervalTolerance)
+    else:
+        ### follow a growing capture or read from stdin ("-"), stop with Ctrl+C
+        captureFile = sys.stdin.buffer if(inputFileName == "-") else open(inputFileName, "rb")
+        liveCntMismatch = 0
+        try:
+            for records, srcValues, ethTypeUsed in iter_ptp_record_chunks_follow(captureFile, analyzer.pollInterval, analyzer.idleTimeout, result.profiler):
+                result.uniqueSrcValues = srcValues
+                with profile_stage(result.profiler, "update"):
+                    if(result.warningLog.recorder is not None):
+                        result.warningLog.recorder.feed(records)
+                    update_stream_state(streamState, records, result.warningLog, result.intervalTolerance)
+                liveCntMismatch = check_live_cnt_mismatch(result, streamState, liveCntMismatch)
+                # print the completed warnings right away, open runs are continued with the next chunk and printed once complete
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            print_info(result, "")
+            print_info(result, "follow mode stopped")
+        finally:
+            if(captureFile != sys.stdin.buffer):
+                captureFile.close()
+
+    result.warningLog.flush()
+    if(len(streamState) == 0):
+        raise ValueError("no eligible PTP messages found within:" + inputFileName)
+
+    finish_stream_state(result, streamState, srcValues, ethTypeUsed)
+    result.warningLog.set_source(None, None)
+
+    ### compare number of DlyReq and DlyResp messages, once per data frame like print_warning_overview()
+    for srcIdx in result.listSrcIdx[PTP_MTYPE_DELAY_REQ]:
+        check_dly_cnt_mismatch(result, PTP_MTYPE_DELAY_REQ)
+    for srcIdx in result.listSrcIdx[PTP_MTYPE_DELAY_RESP]:
+        check_dly_cnt_mismatch(result, PTP_MTYPE_DELAY_RESP)
+    result.warningLog.print_suppressed()
+    print_info(result, "--------------------------------------------------------------------")
+###----------------------------------------------------------------------------
+
+
+###----- message type specific calculations for all found message types -------
+# \param result ... PtpAnalysisResult filled by extract_ptp_data()
+def run_ptp_calcs(result):
     ###----- sync message calculations --------------------------------------------
     # check if sync messages were found
-    if(msgFlagSync == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_SYNC, listSyncDF)
+    if(result.msgFlagSync == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_SYNC]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_SYNC)
     ###----------------------------------------------------------------------------
 
     ###----- delay Req message calculations ---------------------------------------
     # check if delay request messages were found
-    if(msgFlagDlyReq == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_DELAY_REQ, listDlyReqDF)
+    if(result.msgFlagDlyReq == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_DELAY_REQ]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_DELAY_REQ)
     ###----------------------------------------------------------------------------
 
     ###----- follow up message calculations ---------------------------------------
     # check if follow up messages were found
-    if(msgFlagFollUp == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_FOLLOW_UP, listFollUpDF)
+    if(result.msgFlagFollUp == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_FOLLOW_UP]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_FOLLOW_UP)
     ###----------------------------------------------------------------------------
 
     ###----- delay Res message calculations ---------------------------------------
     # check if delay response messages were found
-    if(msgFlagDlyResp == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_DELAY_RESP, listDlyRespDF)
+    if(result.msgFlagDlyResp == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_DELAY_RESP]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_DELAY_RESP)
     ###----------------------------------------------------------------------------
 
     ###----- announce message calculations ----------------------------------------
     # check if announce messages were found
-    if(msgFlagAnn == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_ANNOUNCE, listAnnDF)
+    if(result.msgFlagAnn == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_ANNOUNCE]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_ANNOUNCE)
     ###----------------------------------------------------------------------------
 
     ###----- signalling message calculations --------------------------------------
     ### check if signalling messages were found
-    if(msgFlagSig == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_SIGNALLING, listSigDF)
+    if(result.msgFlagSig == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_SIGNALLING]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_SIGNALLING)
     ###----------------------------------------------------------------------------
     
     ###----- management message calculations --------------------------------------
     ### check if management messages were found
-    if(msgFlagMan == True):
-        ptp_msg_type_specific_calcs(PTP_MTYPE_MANAGEMENT, listManDF)
+    if(result.msgFlagMan == True):
+        with profile_stage(result.profiler, PTP_MTYPE_NAMES[PTP_MTYPE_MANAGEMENT]):
+            ptp_msg_type_specific_calcs(result, PTP_MTYPE_MANAGEMENT)
     ###----------------------------------------------------------------------------
-    
-    ###----- print warning overview -----------------------------------------------
-    print_warning_overview(warningCountDF)
+
+    ###----- pairing of requests and responses -------------------------------------
+    with profile_stage(result.profiler, "pairing"):
+        run_ptp_pairing(result)
     ###----------------------------------------------------------------------------
-    
-    ###----- print final overview -------------------------------------------------
-    print_final_overview(warningCountDF)
+
+    ###----- offset from master and mean path delay -------------------------------
+    with profile_stage(result.profiler, "captureOffsetDelay"):
+        calc_offset_delay(result)
     ###----------------------------------------------------------------------------
 
+    ### calculate total number of PTP messages found
+    calc_total_msg_count(result)
+###----------------------------------------------------------------------------
+
+
+###----- collect the captures of a batch run ---------------------------------
+# returns the sorted list of files within a directory or matching a glob pattern
+#
+# \param batchPattern ... directory or glob pattern, e.g. "captures/*.pcapng"
+def collect_batch_files(batchPattern):
+    if(os.path.isdir(batchPattern) == True):
+        batchFiles = [os.path.join(batchPattern, fileName) for fileName in os.listdir(batchPattern)]
+    else:
+        batchFiles = glob.glob(batchPattern)
+    batchFiles = sorted([fileName for fileName in batchFiles if os.path.isfile(fileName)])
+
+    if(len(batchFiles) == 0):
+        raise ValueError("no capture files found for: " + batchPattern)
+    return batchFiles
+###----------------------------------------------------------------------------
+
+
+###----- initialise a batch worker process -----------------------------------
+# every worker process keeps its own analyzer, so tshark is only checked once per process
+def init_batch_worker(singlePass, decoder, cacheDir, cacheMaxBytes, streaming, chunkPackets, intervalTolerance, exportDir, exportFormat, reportDir, warningDetail, profile, contextSize):
+    global batchAnalyzer
+    # the batch already keeps every core busy, therefore tshark runs sequentially within a worker
+    batchAnalyzer = PtpAnalyzer(singlePass, decoder, tsharkJobs = 1, cacheDir = cacheDir, cacheMaxBytes = cacheMaxBytes, streaming = streaming, chunkPackets = chunkPackets,
+                                intervalTolerance = intervalTolerance, exportDir = exportDir, exportFormat = exportFormat, reportDir = reportDir, quiet = True,
+                                warningDetail = warningDetail, profile = profile, contextSize = contextSize)
+###----------------------------------------------------------------------------
+
+
+###----- analyse a single capture of a batch run -----------------------------
+# runs within a worker process, the analyzer is quiet, the capture is only summarized by the returned row
+# returns one row of the batch summary, holding msgCount and warningCount of the capture
+#
+# \param inputFileName ... capture file to analyse
+def analyze_batch_file(inputFileName):
+    summaryRow = {"file": inputFileName}
+    try:
+        result = batchAnalyzer.analyze(inputFileName)
+    except Exception as e:
+        summaryRow["error"] = str(e)
+        return summaryRow
+
+    summaryRow.update(result.msgCountDF.iloc[0].to_dict())
+    summaryRow.update(result.warningCountDF.iloc[0].to_dict())
+    if(result.profiler is not None):
+        summaryRow["wall_s"] = result.profiler.get_stats_df()["wall_s"].iloc[-1]
+    summaryRow["error"] = ""
+    return summaryRow
+###----------------------------------------------------------------------------
+
+
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Main Body ----------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+def main():
+    ###----- cmd line arguements ----------------------------------------------
+    ### - define and parse cmd line arguments
+
+    ### define arguments
+    # -h ... (predefined) show help about this script
+    # -v ... show version and general information about this script
+    # -i ... input file
+    # -s ... extract all needed fields with a single tshark run
+    # -d ... decoder used to extract PTP messages
+    # -b ... directory or glob pattern of captures to analyse in parallel
+    # -j ... number of worker processes of a batch run
+    # -c ... directory of the extraction cache
+    # -S ... streaming analysis with constant memory
+    # -F ... follow a growing capture or read from stdin
+    # --intervalTolerance ... allowed relative deviation of a message interval
+    # -e ... directory decoded messages and results are exported to
+    # -r ... directory of the JSON/CSV report
+    # -q ... print nothing
+    # --warningLimit ... warning records printed per type
+    # -W ... one warning record per message
+    # --profile ... time and memory per stage
+    # --contextSize ... messages around a warning within the report
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-v", "--version", action="version", version="%(prog)s " + TOOL_VERSION, help="show program version and exit.")
+    inputGroup = parser.add_mutually_exclusive_group(required=True)
+    inputGroup.add_argument("-i", "--inFile", type=str)
+    inputGroup.add_argument("-b", "--batch", type=str, help="directory or glob pattern of captures, analysed in parallel, prints one summary table.")
+    parser.add_argument("-c", "--cacheDir", type=str, default=None, help="directory of the extraction cache, unchanged captures are not decoded again.")
+    parser.add_argument("--cacheSize", type=int, default=CACHE_DEFAULT_MAX_BYTES // (1024 * 1024), help="size limit of the extraction cache in MiB, least recently used entries are evicted.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes of a batch run, defaults to the number of cores.")
+    parser.add_argument("-s", "--singlePass", action="store_true", help="decode the input file only once and split by source and message type in memory.")
+    parser.add_argument("-d", "--decoder", type=str, choices=[DECODER_TSHARK, DECODER_NATIVE, DECODER_MMAP], default=DECODER_TSHARK, help="decoder used to extract PTP messages, native and mmap do not need tshark (implies single pass).")
+    parser.add_argument("-S", "--stream", action="store_true", help="analyse the capture chunk by chunk with constant memory, for captures larger than RAM (uses the mmap decoder, no cache).")
+    parser.add_argument("--chunkSize", type=int, default=MMAP_CHUNK_PACKETS, help="number of packets decoded at once by the mmap decoder.")
+    parser.add_argument("-F", "--follow", action="store_true", help="follow a growing capture (or read from stdin with -i -), warnings are printed as the packets arrive (implies --stream).")
+    parser.add_argument("--pollInterval", type=float, default=FOLLOW_DEFAULT_POLL_INTERVAL, help="time between two reads of a growing capture without new data, in seconds.")
+    parser.add_argument("--idleTimeout", type=float, default=FOLLOW_DEFAULT_IDLE_TIMEOUT, help="time without new data after which a growing capture is regarded as complete, in seconds.")
+    parser.add_argument("--intervalTolerance", type=float, default=INTERVAL_DEFAULT_TOLERANCE, help="allowed relative deviation of a message interval from 2**logMP, e.g. 0.3 ... 30 %%.")
+    parser.add_argument("-e", "--exportDir", type=str, default=None, help="export decoded messages and results per capture to this directory, in a columnar binary format.")
+    parser.add_argument("-r", "--reportDir", type=str, default=None, help="write a JSON report holding one record per warning and CSV summaries of msgCount and warningCount per capture to this directory.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="print nothing, warnings are only collected, e.g. for the report.")
+    parser.add_argument("--warningLimit", type=int, default=WARNING_DEFAULT_PRINT_LIMIT, help="number of warnings printed per warning type, further ones are only counted, 0 ... no limit.")
+    parser.add_argument("-W", "--warningDetail", action="store_true", help="one warning per message instead of aggregating consecutive ones, printed without limit.")
+    parser.add_argument("--profile", action="store_true", help="print wall time, CPU time, peak RSS, tshark launches and bytes read per stage, written as JSON to the report directory (-r).")
+    parser.add_argument("--contextSize", type=int, default=FLIGHT_DEFAULT_DEPTH, help="number of messages of the same source kept before and after every warning within the report (-r), 0 ... none.")
+    parser.add_argument("--exportFormat", type=str, choices=[EXPORT_FORMAT_NPZ, EXPORT_FORMAT_PARQUET, EXPORT_FORMAT_ARROW], default=EXPORT_FORMAT_NPZ, help="format of the export, parquet and arrow need pyarrow.")
+
+    ### parse given arguments
+    args = parser.parse_args()
+    
+    ### call function to analyse specified input file(s)
+    if(args.batch != None):
+        parseBatch(args.batch, args.singlePass, args.decoder, args.jobs, args.cacheDir, args.cacheSize * 1024 * 1024, args.stream, args.chunkSize, args.intervalTolerance,
+                   args.exportDir, args.exportFormat, args.reportDir, args.quiet, args.warningDetail, args.profile, args.contextSize)
+    else:
+        parseFile(args.inFile, args.singlePass, args.decoder, args.cacheDir, args.cacheSize * 1024 * 1024, args.stream, args.chunkSize, args.follow, args.pollInterval, args.idleTimeout,
+                  args.intervalTolerance, args.exportDir, args.exportFormat, args.reportDir, args.quiet, args.warningLimit, args.warningDetail, args.profile, args.contextSize)
+###----------------------------------------------------------------------------
+
+###----- analyse a single capture --------------------------------------------
+# kept for compatibility, e.g. with useWiresharkParser.ipynb
+# returns the PtpAnalysisResult of the given capture
+def parseFile(inputFileName:str, singlePass:bool = False, decoder:str = DECODER_TSHARK, cacheDir:str = None, cacheMaxBytes:int = CACHE_DEFAULT_MAX_BYTES, streaming:bool = False, chunkPackets:int = MMAP_CHUNK_PACKETS,
+              follow:bool = False, pollInterval:float = FOLLOW_DEFAULT_POLL_INTERVAL, idleTimeout:float = FOLLOW_DEFAULT_IDLE_TIMEOUT, intervalTolerance:float = INTERVAL_DEFAULT_TOLERANCE,
+              exportDir:str = None, exportFormat:str = EXPORT_FORMAT_NPZ, reportDir:str = None, quiet:bool = False,
+              warningLimit:int = WARNING_DEFAULT_PRINT_LIMIT, warningDetail:bool = False, profile:bool = False, contextSize:int = FLIGHT_DEFAULT_DEPTH):
+    analyzer = PtpAnalyzer(singlePass, decoder, cacheDir = cacheDir, cacheMaxBytes = cacheMaxBytes, streaming = streaming, chunkPackets = chunkPackets,
+                           follow = follow, pollInterval = pollInterval, idleTimeout = idleTimeout, intervalTolerance = intervalTolerance,
+                           exportDir = exportDir, exportFormat = exportFormat, reportDir = reportDir, quiet = quiet,
+                           warningLimit = warningLimit, warningDetail = warningDetail, profile = profile, contextSize = contextSize)
+    return analyzer.analyze(inputFileName)
+###----------------------------------------------------------------------------
+
+###----- analyse a batch of captures -----------------------------------------
+# analyses every capture in a process pool, prints and returns one summary data frame
+# holding msgCount and warningCount per capture, failed captures are listed with their error
+#
+# \param batchPattern ... directory or glob pattern of captures
+#
+# \param numWorkers   ... number of worker processes, None ... number of cores
+def parseBatch(batchPattern:str, singlePass:bool = False, decoder:str = DECODER_TSHARK, numWorkers:int = None, cacheDir:str = None, cacheMaxBytes:int = CACHE_DEFAULT_MAX_BYTES, streaming:bool = False, chunkPackets:int = MMAP_CHUNK_PACKETS,
+               intervalTolerance:float = INTERVAL_DEFAULT_TOLERANCE, exportDir:str = None, exportFormat:str = EXPORT_FORMAT_NPZ, reportDir:str = None, quiet:bool = False,
+               warningDetail:bool = False, profile:bool = False, contextSize:int = FLIGHT_DEFAULT_DEPTH):
+    batchFiles = collect_batch_files(batchPattern)
+    if(exportDir != None):
+        check_export_format(exportFormat)
+
+    # imported once before the workers are started, forked workers inherit it instead of importing it each, see LazyModule
+    importlib.import_module("pandas")
+    with concurrent.futures.ProcessPoolExecutor(max_workers = numWorkers, initializer = init_batch_worker,
+                                                initargs = (singlePass, decoder, cacheDir, cacheMaxBytes, streaming, chunkPackets, intervalTolerance, exportDir, exportFormat, reportDir, warningDetail, profile, contextSize)) as executor:
+        summaryRows = list(executor.map(analyze_batch_file, batchFiles))
+
+    summaryDF = pd.DataFrame(summaryRows).set_index("file")
+    countColumns = [column for column in summaryDF.columns if(column not in ["error", "wall_s"])]
+    summaryDF[countColumns] = summaryDF[countColumns].fillna(0).astype(np.int64)
+
+    if(reportDir != None):
+        os.makedirs(reportDir, exist_ok = True)
+        summaryDF.to_csv(os.path.join(reportDir, "batch_summary.csv"))
+    if(quiet == False):
+        print("--- Batch Summary ---------------------------------------------------")
+        print(summaryDF.to_string())
+    return summaryDF
+###----------------------------------------------------------------------------
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
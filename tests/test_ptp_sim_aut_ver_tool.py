@@ -0,0 +1,114 @@
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+### Tests of the Automatic .pcap Verification Tool
+###
+### - run with: python -m pytest -q tests
+###
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+###----- Imports ------------------------------------------------------------------------------------------------------------------------------------
+import glob
+import os
+import sys
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ptp_sim_aut_ver_tool as ptpTool
+import ptp_benchmark
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Constants ----------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+### captures shipped with the repository
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testdata")
+TESTDATA_FILES = sorted(glob.glob(os.path.join(TESTDATA_DIR, "*")))
+
+### packets decoded at once by the streaming analysis, small so runs and intervals cross chunk borders
+STREAM_CHUNK_PACKETS = 50
+
+### warning types only found by the pairing, which the streaming analysis does not do
+PAIRING_WARNING_TYPES = ["Unmatched", "Late"]
+
+### faults injected into the generated capture, see ptp_benchmark.generate_capture()
+GEN_PACKETS = 4000
+GEN_FAULTS = {"missingDlyResp": 3, "zeroTS": 2, "backwardsTS": 4, "seqIDGaps": 5}
+
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+###----- Functions ----------------------------------------------------------------------------------------------------------------------------------
+###--------------------------------------------------------------------------------------------------------------------------------------------------
+
+###----- quiet analysis of a capture -------------------------------------------
+def analyze(inputFileName, decoder = ptpTool.DECODER_MMAP, streaming = False):
+    analyzer = ptpTool.PtpAnalyzer(decoder = decoder, quiet = True, streaming = streaming, chunkPackets = STREAM_CHUNK_PACKETS)
+    return analyzer.analyze(inputFileName)
+###----------------------------------------------------------------------------
+
+
+###----- seqID runs in a comparable order ---------------------------------------
+# the streaming analysis finds the runs of DlyResp requesters in another order
+def sorted_seq_id_runs(result):
+    seqIDRuns = result.seqIDRunsDF.astype({"group": str})
+    return seqIDRuns.sort_values(["messageId", "srcIdx", "frameNum"], kind = "stable", ignore_index = True)
+###----------------------------------------------------------------------------
+
+
+###----- native and mmap decoders give the same results ---------------------------
+@pytest.mark.parametrize("inputFileName", TESTDATA_FILES, ids = os.path.basename)
+def test_native_equals_mmap(inputFileName):
+    nativeResult = analyze(inputFileName, ptpTool.DECODER_NATIVE)
+    mmapResult = analyze(inputFileName, ptpTool.DECODER_MMAP)
+
+    pd.testing.assert_frame_equal(nativeResult.msgCountDF, mmapResult.msgCountDF)
+    pd.testing.assert_frame_equal(nativeResult.warningCountDF, mmapResult.warningCountDF)
+    pd.testing.assert_frame_equal(nativeResult.seqIDRunsDF, mmapResult.seqIDRunsDF)
+    pd.testing.assert_frame_equal(nativeResult.intervalStatsDF, mmapResult.intervalStatsDF)
+###----------------------------------------------------------------------------
+
+
+###----- the streaming analysis gives the same results as the batch analysis -------
+@pytest.mark.parametrize("inputFileName", TESTDATA_FILES, ids = os.path.basename)
+def test_stream_equals_batch(inputFileName):
+    batchResult = analyze(inputFileName)
+    streamResult = analyze(inputFileName, streaming = True)
+
+    pd.testing.assert_frame_equal(batchResult.msgCountDF, streamResult.msgCountDF)
+    pd.testing.assert_frame_equal(batchResult.warningCountDF.drop(columns = PAIRING_WARNING_TYPES),
+                                  streamResult.warningCountDF.drop(columns = PAIRING_WARNING_TYPES))
+    pd.testing.assert_frame_equal(sorted_seq_id_runs(batchResult), sorted_seq_id_runs(streamResult), check_dtype = False)
+###----------------------------------------------------------------------------
+
+
+###----- injected faults are counted as expected -----------------------------------
+# - zeroTS         ... a zero ts, also backwards against the previous Sync
+# - backwardsTS    ... a backwards FollowUp ts
+# - seqIDGaps      ... a gap of the Sync and one of the FollowUp seqIDs
+# - missingDlyResp ... a gap of the DlyResp seqIDs of the requester and an unmatched DlyReq, together a count mismatch
+@pytest.mark.parametrize("fileFormat", ["pcap", "pcapng"])
+@pytest.mark.parametrize("decoder", [ptpTool.DECODER_NATIVE, ptpTool.DECODER_MMAP])
+def test_generated_faults(tmp_path, fileFormat, decoder):
+    inputFileName = str(tmp_path / ("faults." + fileFormat))
+    info = ptp_benchmark.generate_capture(inputFileName, GEN_PACKETS, fileFormat, faults = GEN_FAULTS)
+    assert all(info[faultType] == numFaults for faultType, numFaults in GEN_FAULTS.items())
+
+    warningCounts = analyze(inputFileName, decoder).warningCountDF.iloc[0].to_dict()
+    assert warningCounts == {"Zero":        GEN_FAULTS["zeroTS"],
+                             "Negative":    0,
+                             "Backwards":   GEN_FAULTS["zeroTS"] + GEN_FAULTS["backwardsTS"],
+                             "SeqID":       2 * GEN_FAULTS["seqIDGaps"] + GEN_FAULTS["missingDlyResp"],
+                             "LogMP":       0,
+                             "CntMismatch": 1,
+                             "Unmatched":   GEN_FAULTS["missingDlyResp"],
+                             "Late":        0,
+                             "Other":       0}
+###----------------------------------------------------------------------------
+
+
+###----- a missing DlyReq or DlyResp is found by the count and the pairing ---------
+@pytest.mark.parametrize("captureName", ["master_original_dly_req_missing.pcap", "master_original_dly_resp_missing.pcap"])
+@pytest.mark.parametrize("decoder", [ptpTool.DECODER_NATIVE, ptpTool.DECODER_MMAP])
+def test_missing_dly_msg(captureName, decoder):
+    warningCounts = analyze(os.path.join(TESTDATA_DIR, captureName), decoder).warningCountDF.iloc[0]
+    assert warningCounts["CntMismatch"] == 1
+    assert warningCounts["Unmatched"] == 1
+###----------------------------------------------------------------------------